@@ -1,4 +1,5 @@
 import importlib
+import importlib.util
 import os
 import subprocess
 import sys
@@ -45,6 +46,10 @@ class DependencyManager:
         else:
             globals()[global_name] = importlib.import_module(module_name)
 
+    @staticmethod
+    def is_module_available(module_name):
+        return importlib.util.find_spec(module_name) is not None
+
     @staticmethod
     def install_pip():
         try:
@@ -166,14 +171,10 @@ def register_dependencies():
     safe_register_class(InstallDependenciesOperator)
     safe_register_class(PortalPipePreferences)
 
-    try:
-        for dependency in dependencies:
-            DependencyManager.import_module(
-                module_name=dependency.module, global_name=dependency.name
-            )
-        DependencyManager.dependencies_installed = True
-    except ModuleNotFoundError:
-        return
+    # Only locate the packages; transports import them on first use
+    DependencyManager.dependencies_installed = all(
+        DependencyManager.is_module_available(dependency.module) for dependency in dependencies
+    )
 
 
 def unregister_dependencies():
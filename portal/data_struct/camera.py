@@ -2,9 +2,12 @@ import math
 
 import bpy
 import mathutils
+import numpy as np
 
 
 class Camera:
+    TOLERANCE = 1e-6  # smaller changes are not written back to Blender
+
     def __init__(self):
         """Initialize the Camera object without requiring a name or other details."""
         self.position = (0, 0, 0)
@@ -35,56 +38,94 @@ class Camera:
         self.vertical_fov = vertical_fov
         self.horizontal_fov = horizontal_fov
 
-    def sync_camera(self, name, collection_name=None):
-        """Synchronize camera data with the Blender camera object."""
+    def sync_camera(self, name, collection_name=None, pose=True):
+        """
+        Synchronize camera data with the Blender camera object. Only values that differ from the
+        current ones are written, so a moving camera does not touch render settings. With
+        `pose=False` the location and rotation are left to a CameraStream.
+        """
         self.camera_object = self._get_or_create_camera(name, collection_name)
-        cam = self.camera_object
-        cam.location = self.position
-
-        # Calculate the target point the camera should look at
-        look_vector = mathutils.Vector(self.look_direction)
-        target_point = mathutils.Vector(self.position) + look_vector
-        direction = target_point - cam.location
-
-        # Set the rotation of the camera to look at the target point
-        cam.rotation_mode = "QUATERNION"
-        cam.rotation_quaternion = direction.to_track_quat("-Z", "Y")
-
+        if pose:
+            self._set_pose()
         self._set_camera_resolution()
         self._set_camera_fov_and_lens()
 
+    def sync_pose(self, name):
+        """Write only the location and rotation of an existing camera."""
+        self.camera_object = bpy.data.objects.get(name)
+        if self.camera_object and self.camera_object.type == "CAMERA":
+            self._set_pose()
+
     def set_cliping(self, near, far):
         cam = self.camera_object
-        cam.data.clip_start = near
-        cam.data.clip_end = far
+        Camera._assign(cam.data, "clip_start", near)
+        Camera._assign(cam.data, "clip_end", far)
+
+    def _set_pose(self):
+        """Place the camera at its position, looking along its look direction."""
+        cam = self.camera_object
+        Camera._assign(cam, "location", self.position)
+        direction = mathutils.Vector(self.look_direction)
+        Camera._assign(cam, "rotation_mode", "QUATERNION")
+        Camera._assign(cam, "rotation_quaternion", direction.to_track_quat("-Z", "Y"))
+
+    def pose_matrix(self) -> np.ndarray:
+        """
+        4x4 world matrix of the pose `_set_pose` writes: -Z along the look direction and Y toward
+        world up, as `to_track_quat("-Z", "Y")` does.
+        """
+        z_axis = -np.asarray(self.look_direction, dtype=np.float64)
+        z_axis /= np.linalg.norm(z_axis) or 1.0
+        up = np.array((0.0, 0.0, 1.0)) if abs(z_axis[2]) < 1 - 1e-6 else np.array((0.0, 1.0, 0.0))
+        y_axis = up - np.dot(up, z_axis) * z_axis
+        y_axis /= np.linalg.norm(y_axis)
+        matrix = np.eye(4)
+        matrix[:3, :3] = np.stack((np.cross(y_axis, z_axis), y_axis, z_axis), axis=1)
+        matrix[:3, 3] = self.position
+        return matrix
 
     def _set_camera_resolution(self):
         """Set the resolution of the camera's render."""
-        bpy.context.scene.render.resolution_x = self.resolution_x
-        bpy.context.scene.render.resolution_y = self.resolution_y
+        render = bpy.context.scene.render
+        Camera._assign(render, "resolution_x", self.resolution_x)
+        Camera._assign(render, "resolution_y", self.resolution_y)
         self.aspect_ratio = self.resolution_x / self.resolution_y
 
     def _set_camera_fov_and_lens(self):
         """Set the field of view (FOV) and lens of the camera."""
         cam = self.camera_object
-        cam.data.lens = self.focal_length
+        Camera._assign(cam.data, "lens", self.focal_length)
 
         if self.aspect_ratio >= 1.0:
             # Use vertical FOV for landscape orientation
-            cam.data.sensor_fit = "VERTICAL"
+            Camera._assign(cam.data, "sensor_fit", "VERTICAL")
             vertical_fov_rad = math.radians(self.vertical_fov)
             sensor_height = 2 * self.focal_length * math.tan(vertical_fov_rad / 2)
             sensor_width = sensor_height * self.aspect_ratio
         else:
             # Use horizontal FOV for portrait orientation
-            cam.data.sensor_fit = "HORIZONTAL"
+            Camera._assign(cam.data, "sensor_fit", "HORIZONTAL")
             horizontal_fov_rad = math.radians(self.horizontal_fov)
             sensor_width = 2 * self.focal_length * math.tan(horizontal_fov_rad / 2)
             sensor_height = sensor_width / self.aspect_ratio
 
         # Set sensor size
-        cam.data.sensor_width = sensor_width
-        cam.data.sensor_height = sensor_height
+        Camera._assign(cam.data, "sensor_width", sensor_width)
+        Camera._assign(cam.data, "sensor_height", sensor_height)
+
+    @staticmethod
+    def _assign(target, attribute, value) -> bool:
+        """Set `target.attribute` only when it differs; every write triggers depsgraph updates."""
+        current = getattr(target, attribute)
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            changed = current != value
+        elif isinstance(value, float):
+            changed = abs(current - value) > Camera.TOLERANCE
+        else:
+            changed = any(abs(a - b) > Camera.TOLERANCE for a, b in zip(current, value))
+        if changed:
+            setattr(target, attribute, value)
+        return changed
 
     def _get_or_create_camera(self, name, collection_name=None):
         """Get an existing camera or create a new one in the scene."""
@@ -0,0 +1,84 @@
+import time
+from collections import deque
+
+import numpy as np
+
+
+class CameraStream:
+    """
+    Timestamped camera poses of one channel, resampled on the Blender timer so motion stays smooth
+    when packets arrive with jitter.
+
+    Sender timestamps are milliseconds, like the "Timestamp" dictionary item; they are converted
+    to seconds on arrival and mapped onto the local clock with the smallest offset seen so far (the
+    least delayed packet). Playback runs `delay` seconds behind the newest sample and linearly
+    interpolates between the two samples around it; with extrapolation enabled it may predict past
+    the newest sample by up to `MAX_EXTRAPOLATION` seconds using the last velocity.
+    """
+
+    MAX_SAMPLES = 16
+    MAX_EXTRAPOLATION = 0.1  # seconds
+    TIMESTAMP_SCALE = 1e-3  # sender milliseconds -> seconds
+
+    _streams = {}  # channel name -> CameraStream
+
+    def __init__(self):
+        self.samples = deque(maxlen=CameraStream.MAX_SAMPLES)  # (time, position, direction)
+        self.clock_offset = None  # local time - sender time
+
+    @staticmethod
+    def push(channel_name, timestamp, position, direction):
+        """Add a sample stamped in milliseconds. Without a "Timestamp", arrival time is used."""
+        stream = CameraStream._streams.setdefault(channel_name, CameraStream())
+        now = time.perf_counter()
+        timestamp = now if timestamp is None else float(timestamp) * CameraStream.TIMESTAMP_SCALE
+        offset = now - timestamp
+        if stream.clock_offset is None or offset < stream.clock_offset:
+            stream.clock_offset = offset
+        if stream.samples and timestamp <= stream.samples[-1][0]:
+            return  # late or duplicate packet
+        position = np.asarray(position, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        stream.samples.append((timestamp, position, direction))
+
+    @staticmethod
+    def sample(channel_name, delay=0.0, extrapolate=False):
+        """Return the (position, direction) to show now, or None without samples."""
+        stream = CameraStream._streams.get(channel_name)
+        if stream is None or not stream.samples:
+            return None
+        samples = stream.samples
+        target = time.perf_counter() - stream.clock_offset - delay
+
+        if len(samples) == 1 or target <= samples[0][0]:
+            return samples[0][1], samples[0][2]
+        newest = samples[-1]
+        if target >= newest[0]:
+            if not extrapolate:
+                return newest[1], newest[2]
+            previous = samples[-2]
+            ahead = min(target - newest[0], CameraStream.MAX_EXTRAPOLATION)
+            t = 1 + ahead / (newest[0] - previous[0])
+            return CameraStream._blend(previous, newest, t)
+
+        for before, after in zip(samples, list(samples)[1:]):
+            if before[0] <= target < after[0]:
+                t = (target - before[0]) / (after[0] - before[0])
+                return CameraStream._blend(before, after, t)
+        return newest[1], newest[2]
+
+    @staticmethod
+    def clear(channel_name=None):
+        if channel_name is None:
+            CameraStream._streams.clear()
+        else:
+            CameraStream._streams.pop(channel_name, None)
+
+    @staticmethod
+    def _blend(before, after, t):
+        """Linear position, normalized-linear look direction."""
+        position = before[1] + (after[1] - before[1]) * t
+        direction = before[2] + (after[2] - before[2]) * t
+        length = np.linalg.norm(direction)
+        direction = direction / length if length > 0 else after[2]
+        return position, direction
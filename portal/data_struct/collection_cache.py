@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+
+import bpy
+
+
+class CollectionCache:
+    """
+    Resolves `::` separated layer paths to nested collections, caching the result per channel.
+
+    The first segment of a received layer path is the channel name, which keys the cache. Entries
+    store collection names; a hit costs one lookup and is used while that collection still exists
+    and is linked somewhere, wherever the user may have moved it. Deleted or unlinked collections
+    are resolved again under their parent path, and an unlinked one is linked back there. Inside
+    `batch()`, objects are grouped by layer path and linked once per collection on exit, so the
+    lookup runs once per message.
+    """
+
+    _collections = {}  # channel (root layer) -> {layer path: collection name}
+    _pending = None  # layer path -> objects to link while a batch is open
+
+    @staticmethod
+    def resolve(layer_path):
+        """Get the collection for a layer path, creating missing collections along the way."""
+        root = layer_path.split("::", 1)[0]
+        paths = CollectionCache._collections.setdefault(root, {})
+        name = paths.get(layer_path)
+        cached = bpy.data.collections.get(name) if name else None
+        if cached is not None and cached.users:
+            return cached  # only the leaf is checked; its parents are not walked
+
+        # Not cached, deleted or unlinked: find or create it under its parent
+        parent_path, _, layer = layer_path.rpartition("::")
+        parent = (
+            CollectionCache.resolve(parent_path) if parent_path else bpy.context.scene.collection
+        )
+        collection = parent.children.get(layer)
+        if not collection:
+            # an unlinked collection is linked back instead of leaving an orphan behind
+            collection = cached or bpy.data.collections.new(layer)
+            parent.children.link(collection)
+        paths[layer_path] = collection.name
+        return collection
+
+    @staticmethod
+    def link(obj, layer_path=None):
+        """Link an object to its layer collection, deferred to the end of an open batch."""
+        if CollectionCache._pending is not None:
+            CollectionCache._pending.setdefault(layer_path, []).append(obj)
+            return
+        CollectionCache._link_all([obj], layer_path)
+
+    @staticmethod
+    @contextmanager
+    def batch():
+        """Group `link()` calls and link each collection's objects in one pass on exit."""
+        if CollectionCache._pending is not None:
+            yield  # already batching; the outer batch links
+            return
+        CollectionCache._pending = {}
+        try:
+            yield
+        finally:
+            pending, CollectionCache._pending = CollectionCache._pending, None
+            for layer_path, objects in pending.items():
+                CollectionCache._link_all(objects, layer_path)
+
+    @staticmethod
+    def layer_paths(channel_name) -> dict:
+        """Collection name -> layer path for the collections resolved for a channel."""
+        paths = CollectionCache._collections.get(channel_name, {})
+        return {name: layer_path for layer_path, name in paths.items()}
+
+    @staticmethod
+    def clear(channel_name=None):
+        """Drop cached paths for a channel, or for every channel."""
+        if channel_name is None:
+            CollectionCache._collections.clear()
+        else:
+            CollectionCache._collections.pop(channel_name, None)
+
+    @staticmethod
+    def _link_all(objects, layer_path):
+        collection = CollectionCache.resolve(layer_path) if layer_path else bpy.context.collection
+        linked = collection.objects
+        for obj in objects:
+            if obj.name not in linked:
+                linked.link(obj)
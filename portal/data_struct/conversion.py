@@ -0,0 +1,138 @@
+import numpy as np
+
+
+class CoordinateConversion:
+    """
+    Per-connection affine conversion from the sender's coordinate system into Blender's:
+    `v' = A (v - origin)`, where `A` is the unit scale times the axis remap. Points get the full
+    conversion, vectors (directions, extents) only `A`, and object matrices are conjugated so
+    rigid transforms stay rigid while matching the converted geometry.
+    """
+
+    UNIT_SCALES = {
+        "METERS": 1.0,
+        "CENTIMETERS": 0.01,
+        "MILLIMETERS": 0.001,
+        "INCHES": 0.0254,
+        "FEET": 0.3048,
+    }
+    AXIS_REMAPS = {
+        "Z_UP": np.eye(3),
+        "Y_UP": np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]], dtype=np.float64),  # (x, y, z) -> (x, -z, y)
+    }
+
+    def __init__(self, linear: np.ndarray, offset: np.ndarray):
+        self.linear = linear  # 3x3
+        self.offset = offset  # translation applied after the linear part
+        self.matrix = np.eye(4)
+        self.matrix[:3, :3] = linear
+        self.matrix[:3, 3] = offset
+        self.inverse = np.linalg.inv(self.matrix)
+        self.scale = abs(np.linalg.det(linear)) ** (1 / 3)  # uniform scale for radii and sizes
+
+    @staticmethod
+    def from_connection(connection) -> "CoordinateConversion | None":
+        """Build the connection's conversion, or None when it is the identity."""
+        scale = CoordinateConversion.UNIT_SCALES[connection.source_unit]
+        linear = CoordinateConversion.AXIS_REMAPS[connection.up_axis] * scale
+        origin = np.asarray(connection.origin_offset, dtype=np.float64)
+        if np.allclose(linear, np.eye(3)) and not origin.any():
+            return None
+        return CoordinateConversion(linear, -linear @ origin)
+
+    def points(self, values) -> np.ndarray:
+        """Convert an (N, 3) array of positions in one matrix op, keeping float32 input float32."""
+        values = np.asarray(values)
+        dtype = values.dtype if values.dtype in (np.float32, np.float64) else np.float64
+        values = values.reshape(-1, 3)
+        return (values @ self.linear.T.astype(dtype) + self.offset.astype(dtype)).astype(
+            dtype, copy=False
+        )
+
+    def vectors(self, values) -> np.ndarray:
+        """Convert directions or extents: linear part only, no offset."""
+        values = np.asarray(values, dtype=np.float64).reshape(-1, 3)
+        return values @ self.linear.T
+
+    def matrices(self, values) -> np.ndarray:
+        """Conjugate (N, 4, 4) world matrices so they act on converted geometry."""
+        values = np.asarray(values)
+        return (self.matrix @ values @ self.inverse).astype(values.dtype, copy=False)
+
+    def convert_dict(self, data: dict, points=(), vectors=()) -> dict:
+        """Return a copy of a flat dict with the named point and vector entries converted."""
+        data = dict(data)
+        for key in points:
+            if data.get(key) is not None:
+                data[key] = self.points(data[key])[0].tolist()
+        for key in vectors:
+            if data.get(key) is not None:
+                data[key] = self.vectors(data[key])[0].tolist()
+        return data
+
+    EVEN_ORDERS = ("XYZ", "YZX", "ZXY")
+
+    @staticmethod
+    def to_euler(matrices, order="XYZ") -> np.ndarray:
+        """
+        Euler angles (x, y, z) of (N, 3, 3) rotation matrices for a Blender rotation order,
+        matching Blender's to_euler(). Other orders are solved as XYZ in permuted axes.
+        """
+        if order != "XYZ":
+            axes = ["XYZ".index(axis) for axis in order]
+            permutation = np.eye(3)[axes]
+            angles = CoordinateConversion.to_euler(permutation @ matrices @ permutation.T)
+            if order not in CoordinateConversion.EVEN_ORDERS:
+                angles = -angles  # an odd axis permutation mirrors every rotation
+            euler = np.empty_like(angles)
+            euler[:, axes] = angles
+            return euler
+        cy = np.hypot(matrices[:, 0, 0], matrices[:, 1, 0])
+        regular = cy > 16 * np.finfo(np.float32).eps
+        x = np.where(
+            regular,
+            np.arctan2(matrices[:, 2, 1], matrices[:, 2, 2]),
+            np.arctan2(-matrices[:, 1, 2], matrices[:, 1, 1]),
+        )
+        y = np.arctan2(-matrices[:, 2, 0], cy)
+        z = np.where(regular, np.arctan2(matrices[:, 1, 0], matrices[:, 0, 0]), 0.0)
+        return np.stack((x, y, z), axis=1)
+
+    @staticmethod
+    def to_quaternion(matrices) -> np.ndarray:
+        """(w, x, y, z) quaternions of (N, 3, 3) rotation matrices (Shepperd's method)."""
+        m = matrices
+        trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+        # One candidate per pivot component; each is accurate when its pivot is the largest
+        candidates = np.stack(
+            (
+                (
+                    1 + trace,
+                    m[:, 2, 1] - m[:, 1, 2],
+                    m[:, 0, 2] - m[:, 2, 0],
+                    m[:, 1, 0] - m[:, 0, 1],
+                ),
+                (
+                    m[:, 2, 1] - m[:, 1, 2],
+                    1 + 2 * m[:, 0, 0] - trace,
+                    m[:, 0, 1] + m[:, 1, 0],
+                    m[:, 0, 2] + m[:, 2, 0],
+                ),
+                (
+                    m[:, 0, 2] - m[:, 2, 0],
+                    m[:, 0, 1] + m[:, 1, 0],
+                    1 + 2 * m[:, 1, 1] - trace,
+                    m[:, 1, 2] + m[:, 2, 1],
+                ),
+                (
+                    m[:, 1, 0] - m[:, 0, 1],
+                    m[:, 0, 2] + m[:, 2, 0],
+                    m[:, 1, 2] + m[:, 2, 1],
+                    1 + 2 * m[:, 2, 2] - trace,
+                ),
+            )
+        ).transpose(2, 0, 1)  # (N, pivot, component)
+        pivots = np.stack((trace, m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]), axis=1).argmax(axis=1)
+        quaternions = candidates[np.arange(len(m)), pivots]
+        quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+        return quaternions * np.where(quaternions[:, :1] < 0, -1.0, 1.0)  # w >= 0
@@ -0,0 +1,191 @@
+import math
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+from .collection_cache import CollectionCache
+from .material import Material
+from .p_types import PCurveType
+
+
+class Curve:
+    """
+    One curve object holding any number of splines, so thousands of curves can share a single
+    datablock. Polylines and lines become POLY splines; NURBS keep their weights and order; arcs
+    and circles are converted to exact rational quadratic NURBS.
+    """
+
+    MAX_ORDER = 6  # Blender's NURBS order limit
+
+    def __init__(self):
+        self.splines = []  # (spline type, (N, 4) points with weights, order, endpoint, bezier, cyclic)
+        self.curve_data = None
+        self.object_name = None
+        self.transform = None
+
+    def add_polyline(self, points, closed=False):
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        self.splines.append(("POLY", Curve._with_weights(points), 2, False, False, closed))
+
+    def add_nurbs(self, points, weights=None, degree=3, knots=None, periodic=False):
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        order = max(2, min(degree + 1, Curve.MAX_ORDER, len(points)))
+        endpoint, bezier = Curve._knot_modes(knots, order - 1, periodic)
+        self.splines.append(
+            ("NURBS", Curve._with_weights(points, weights), order, endpoint, bezier, periodic)
+        )
+
+    def add_arc(self, origin, x_axis, y_axis, radius, start_angle, end_angle):
+        """Add an arc as a rational quadratic NURBS made of <= 90 degree Bezier segments."""
+        sweep = end_angle - start_angle
+        if sweep <= 0:
+            sweep += 2 * math.pi
+        segments = max(1, math.ceil(sweep / (math.pi / 2) - 1e-9))
+        step = sweep / segments
+        middle_weight = math.cos(step / 2)
+
+        angles = start_angle + step / 2 * np.arange(2 * segments + 1)
+        radii = np.full(len(angles), radius, dtype=np.float64)
+        weights = np.ones(len(angles), dtype=np.float64)
+        radii[1::2] /= middle_weight  # middle control points sit on the tangent intersection
+        weights[1::2] = middle_weight
+
+        origin, x_axis, y_axis = (np.asarray(v, dtype=np.float64) for v in (origin, x_axis, y_axis))
+        x_axis = x_axis / np.linalg.norm(x_axis)
+        y_axis = y_axis / np.linalg.norm(y_axis)
+        points = (
+            origin
+            + (radii * np.cos(angles))[:, None] * x_axis
+            + (radii * np.sin(angles))[:, None] * y_axis
+        )
+        self.splines.append(("NURBS", Curve._with_weights(points, weights), 3, True, True, False))
+
+    def create_or_replace(self, object_name, layer_path=None):
+        """Create or rebuild the curve object, reusing its datablock."""
+        if not self.splines:
+            raise ValueError("Curve data must include at least one curve.")
+        self.object_name = object_name
+
+        obj = bpy.data.objects.get(object_name)
+        if obj and obj.type != "CURVE":
+            # Object data type cannot change; drop the stale object
+            bpy.data.objects.remove(obj)
+            obj = None
+
+        if obj and obj.data.users == 1:
+            self.curve_data = obj.data
+            self.curve_data.splines.clear()
+        else:
+            self.curve_data = bpy.data.curves.new(f"{object_name}_curve", "CURVE")
+            self.curve_data.dimensions = "3D"
+            if obj:
+                obj.data = self.curve_data
+
+        if obj is None:
+            obj = bpy.data.objects.new(object_name, self.curve_data)
+            CollectionCache.link(obj, layer_path)
+        elif not obj.users_collection:
+            CollectionCache.link(obj, layer_path)
+
+        for spline_type, points, order, endpoint, bezier, cyclic in self.splines:
+            spline = self.curve_data.splines.new(spline_type)
+            spline.points.add(len(points) - 1)  # a new spline starts with one point
+            spline.points.foreach_set("co", points.ravel())
+            if spline_type == "NURBS":
+                spline.order_u = order
+                spline.use_endpoint_u = endpoint
+                spline.use_bezier_u = bezier
+            spline.use_cyclic_u = cyclic
+
+        if self.transform is not None:
+            obj.matrix_world = Matrix(np.reshape(self.transform, (4, 4)).tolist())
+
+    def apply_material(self, material):
+        """Apply material to the curve object."""
+        obj = bpy.data.objects.get(self.object_name)
+        if not obj:
+            raise ValueError(f"Object {self.object_name} not found.")
+
+        if isinstance(material, str):
+            mat = bpy.data.materials.get(material)
+            if not mat:
+                raise ValueError(f"Material {material} not found.")
+        elif isinstance(material, Material):
+            material.create_or_replace(material.name)
+            mat = material.material
+        else:
+            raise ValueError("Material must be a string or Material object.")
+
+        if len(obj.data.materials) == 0:
+            obj.data.materials.append(mat)
+        else:
+            obj.data.materials[0] = mat
+
+    @staticmethod
+    def _with_weights(points, weights=None) -> np.ndarray:
+        """Append the NURBS weight as the fourth coordinate Blender expects."""
+        result = np.ones((len(points), 4), dtype=np.float32)
+        result[:, :3] = points
+        if weights is not None:
+            result[:, 3] = weights
+        return result
+
+    @staticmethod
+    def _knot_modes(knots, degree, periodic) -> tuple[bool, bool]:
+        """
+        Map a knot vector (Rhino style, without the outer duplicates) onto Blender's endpoint /
+        Bezier knot modes. Blender cannot store arbitrary knots, so other vectors are approximated
+        by uniform spacing.
+        """
+        if not knots:
+            return not periodic, False
+        knots = np.asarray(knots, dtype=np.float64)
+        values, counts = np.unique(knots, return_counts=True)
+        endpoint = not periodic and counts[0] >= degree and counts[-1] >= degree
+        interior = counts[1:-1]
+        bezier = endpoint and degree > 1 and len(interior) > 0 and bool(np.all(interior == degree))
+        spacing = np.diff(values)
+        if len(spacing) and not np.allclose(spacing, spacing[0]):
+            print("Non-uniform NURBS knots are not supported by Blender; using uniform spacing.")
+        return endpoint, bezier
+
+    @staticmethod
+    def from_dict(dict):
+        """
+        Create a Curve from a json dictionary. The dictionary is either a single curve or holds
+        a "Curves" list; every curve becomes a spline of the same datablock.
+        """
+        curve = Curve()
+        for curve_dict in dict.get("Curves", [dict]):
+            curve_type = PCurveType(curve_dict.get("CurveType", PCurveType.POLYLINE.value))
+            if curve_type == PCurveType.LINE:
+                curve.add_polyline([curve_dict["Start"], curve_dict["End"]])
+            elif curve_type == PCurveType.POLYLINE:
+                curve.add_polyline(curve_dict["Points"], curve_dict.get("Closed", False))
+            elif curve_type == PCurveType.NURBS:
+                curve.add_nurbs(
+                    curve_dict["Points"],
+                    curve_dict.get("Weights"),
+                    curve_dict.get("Degree", 3),
+                    curve_dict.get("Knots"),
+                    curve_dict.get("Periodic", False),
+                )
+            elif curve_type in (PCurveType.ARC, PCurveType.CIRCLE):
+                plane = curve_dict.get("Plane", {})
+                start = curve_dict.get("StartAngle", 0.0)
+                end = curve_dict.get("EndAngle", 2 * math.pi)
+                if curve_type == PCurveType.CIRCLE:
+                    start, end = 0.0, 2 * math.pi
+                curve.add_arc(
+                    plane.get("Origin", (0, 0, 0)),
+                    plane.get("XAxis", (1, 0, 0)),
+                    plane.get("YAxis", (0, 1, 0)),
+                    curve_dict["Radius"],
+                    start,
+                    end,
+                )
+            else:
+                raise ValueError(f"Unsupported curve type: {curve_type.name}")
+        curve.transform = dict.get("Transform")
+        return curve
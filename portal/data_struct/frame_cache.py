@@ -0,0 +1,297 @@
+import json
+import os
+from bisect import bisect_right
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+from .collection_cache import CollectionCache
+from .mesh import Mesh
+
+
+class FrameCache:
+    """
+    Per-channel on-disk cache of received meshes, indexed by frame, for scrubbing without a sender.
+
+    `<channel>.pcache` holds raw little-endian arrays appended in 64-byte aligned chunks and is
+    memory-mapped for playback. `<channel>.pcache.idx` has one JSON line per written frame listing
+    each object's world matrix, layer path and the offset, dtype and shape of its arrays: vertex
+    positions, face loop totals, corner vertex indices and mesh attributes. Chunks are referenced
+    again when the geometry or topology did not change, so static or deforming meshes only store
+    what moved. Objects the played frame does not list are unlinked until a frame lists them again.
+    """
+
+    ALIGNMENT = 64
+    DOMAINS = ("POINT", "FACE", "CORNER")
+
+    _writers = {}  # channel name -> FrameCache being written
+    _readers = {}  # channel name -> FrameCache being played
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.data_file = None
+        self.index_file = None
+        self.size = 0
+        self.last = {}  # object name -> (geometry hash, arrays, topology arrays) last written
+
+        self.frames = {}  # frame -> object entries
+        self.frame_numbers = []
+        self.index_position = 0
+        self.buffer = None  # np.memmap of the data file
+        self.played = {}  # object name -> topology applied last
+        self.played_frame = None
+        self.object_names = set()  # every object any cached frame lists
+        self.shown = None  # names the played frame linked; None until a frame was played
+
+    @staticmethod
+    def cache_path(directory, channel_name):
+        return os.path.join(bpy.path.abspath(directory), f"{channel_name}.pcache")
+
+    # Writing
+
+    @staticmethod
+    def is_writing(channel_name) -> bool:
+        return channel_name in FrameCache._writers
+
+    @staticmethod
+    def open_writer(channel_name, directory):
+        """Start appending frames to the channel's cache file."""
+        path = FrameCache.cache_path(directory, channel_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        cache = FrameCache(path)
+        cache.data_file = open(path, "ab")
+        cache.size = cache.data_file.tell()
+        cache.index_file = open(cache.index_path, "a", encoding="utf-8")
+        FrameCache._writers[channel_name] = cache
+
+    @staticmethod
+    def close_writer(channel_name):
+        cache = FrameCache._writers.pop(channel_name, None)
+        if cache:
+            cache.data_file.close()
+            cache.index_file.close()
+
+    @staticmethod
+    def write(channel_name, frame, object_names):
+        """Store the current arrays of the channel's mesh objects under `frame`."""
+        cache = FrameCache._writers.get(channel_name)
+        if cache is None:
+            return
+        objects = []
+        layer_paths = CollectionCache.layer_paths(channel_name)
+        for name in sorted(object_names):
+            obj = bpy.data.objects.get(name)
+            if obj is not None and obj.type == "MESH":
+                objects.append(cache._write_object(obj, layer_paths))
+        cache.data_file.flush()  # chunks land before the index line that points at them
+        cache.index_file.write(json.dumps({"Frame": int(frame), "Objects": objects}) + "\n")
+        cache.index_file.flush()
+
+    def _write_object(self, obj, layer_paths) -> dict:
+        mesh = obj.data
+        geometry_hash = mesh.get(Mesh.HASH_KEY)
+        previous = self.last.get(obj.name)
+        if geometry_hash and previous and previous[0] == geometry_hash:
+            # unchanged geometry: point at the chunks already written
+            arrays = previous[1]
+            if Mesh._shared_meshes.get(geometry_hash) != mesh.name:
+                # streamed attributes are not part of the hash
+                arrays = dict(arrays, Attributes=self._write_attributes(mesh))
+        else:
+            positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", positions)
+            totals = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_total", totals)
+            corners = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", corners)
+
+            arrays = {"Position": self._append(positions.reshape(-1, 3))}
+            if previous and FrameCache._same_topology(previous[2], totals, corners):
+                arrays["LoopTotals"] = previous[1]["LoopTotals"]
+                arrays["Corners"] = previous[1]["Corners"]
+            else:
+                arrays["LoopTotals"] = self._append(totals)
+                arrays["Corners"] = self._append(corners)
+            arrays["Attributes"] = self._write_attributes(mesh)
+            previous = (geometry_hash, arrays, (totals, corners))
+        self.last[obj.name] = (geometry_hash, arrays, previous[2])
+        entry = {
+            "Name": obj.name,
+            "Matrix": [value for row in obj.matrix_world for value in row],
+            "Arrays": arrays,
+        }
+        layer_path = next(
+            (layer_paths[c.name] for c in obj.users_collection if c.name in layer_paths), None
+        )
+        if layer_path:
+            entry["Layer"] = layer_path
+        return entry
+
+    def _write_attributes(self, mesh) -> dict:
+        attributes = {}
+        for attribute in mesh.attributes:
+            if attribute.is_internal or attribute.is_required:
+                continue
+            if attribute.domain not in FrameCache.DOMAINS:
+                continue
+            spec = Mesh.ATTRIBUTE_TYPES.get(attribute.data_type)
+            if spec is None:
+                continue
+            dtype, components, key = spec
+            values = np.empty(len(attribute.data) * components, dtype=dtype)
+            attribute.data.foreach_get(key, values)
+            chunk = self._append(values)
+            chunk["DataType"] = attribute.data_type
+            chunk["Domain"] = attribute.domain
+            attributes[attribute.name] = chunk
+        return attributes
+
+    def _append(self, array) -> dict:
+        """Write an array as an aligned chunk and return its index entry."""
+        padding = -self.size % FrameCache.ALIGNMENT
+        if padding:
+            self.data_file.write(b"\0" * padding)
+            self.size += padding
+        offset = self.size
+        data = np.ascontiguousarray(array)
+        self.data_file.write(data.tobytes())
+        self.size += data.nbytes
+        return {"Offset": offset, "Type": data.dtype.str, "Shape": list(data.shape)}
+
+    @staticmethod
+    def _same_topology(previous, totals, corners) -> bool:
+        return np.array_equal(previous[0], totals) and np.array_equal(previous[1], corners)
+
+    # Playback
+
+    @staticmethod
+    def play(channel_name, directory, frame) -> bool:
+        """Show the cached frame at or before `frame`. Returns False without a cache file."""
+        path = FrameCache.cache_path(directory, channel_name)
+        cache = FrameCache._readers.get(channel_name)
+        if cache is None or cache.path != path:
+            if not os.path.exists(path) or not os.path.exists(path + ".idx"):
+                return False
+            cache = FrameCache(path)
+            FrameCache._readers[channel_name] = cache
+        cache._refresh()
+
+        position = bisect_right(cache.frame_numbers, frame) - 1
+        if position < 0:
+            return True
+        cached_frame = cache.frame_numbers[position]
+        if cached_frame == cache.played_frame:
+            return True  # scrubbing inside a held frame
+        entries = cache.frames[cached_frame]
+        with CollectionCache.batch():
+            for entry in entries:
+                cache._apply_object(entry)
+        cache._unlink_missing({entry["Name"] for entry in entries})
+        cache.played_frame = cached_frame
+        return True
+
+    @staticmethod
+    def clear(channel_name=None):
+        """Drop playback state so the next frame change re-reads the cache from disk."""
+        if channel_name is None:
+            FrameCache._readers.clear()
+        else:
+            FrameCache._readers.pop(channel_name, None)
+
+    def _refresh(self):
+        """Read index lines appended since the last call and remap the grown data file."""
+        with open(self.index_path, "rb") as index_file:
+            index_file.seek(self.index_position)
+            lines = index_file.readlines()
+        complete = [line for line in lines if line.endswith(b"\n")]  # skip a line being written
+        self.index_position += sum(map(len, complete))
+        for line in complete:
+            record = json.loads(line)
+            self.frames[record["Frame"]] = record["Objects"]
+            self.object_names.update(entry["Name"] for entry in record["Objects"])
+        if complete:
+            self.frame_numbers = sorted(self.frames)
+            self.played_frame = None
+        size = os.path.getsize(self.path)
+        if size and (self.buffer is None or len(self.buffer) < size):
+            self.buffer = np.memmap(self.path, dtype=np.uint8, mode="r")
+
+    def _unlink_missing(self, names):
+        """
+        Unlink objects shown before but not listed in this frame, as ObjectPool.reconcile does
+        for live messages. They are kept so scrubbing back relinks them instead of rebuilding.
+        """
+        shown = self.object_names if self.shown is None else self.shown
+        for name in shown - names:
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                continue
+            for collection in obj.users_collection:
+                collection.objects.unlink(obj)
+        self.shown = names
+
+    def _view(self, chunk) -> np.ndarray:
+        """Zero-copy view of a chunk in the mapped file."""
+        dtype = np.dtype(chunk["Type"])
+        count = int(np.prod(chunk["Shape"]))
+        start = chunk["Offset"]
+        return self.buffer[start : start + count * dtype.itemsize].view(dtype)
+
+    def _apply_object(self, entry):
+        name = entry["Name"]
+        arrays = entry["Arrays"]
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.type != "MESH":
+            if obj is not None:
+                bpy.data.objects.remove(obj)
+            obj = bpy.data.objects.new(name, bpy.data.meshes.new(f"{name}_mesh"))
+            CollectionCache.link(obj, entry.get("Layer"))  # older caches have no layer path
+            self.played.pop(name, None)
+        elif not obj.users_collection:
+            CollectionCache.link(obj, entry.get("Layer"))  # unlinked while another frame played
+        mesh = obj.data
+        if mesh.users > 1:
+            obj.data = mesh = mesh.copy()  # never deform geometry other objects share
+            self.played.pop(name, None)
+
+        positions = self._view(arrays["Position"])
+        topology = (arrays["LoopTotals"]["Offset"], arrays["Corners"]["Offset"], len(positions))
+        if self.played.get(name) != topology or len(mesh.vertices) * 3 != len(positions):
+            totals = self._view(arrays["LoopTotals"])
+            corners = self._view(arrays["Corners"])
+            mesh.clear_geometry()
+            mesh.vertices.add(len(positions) // 3)
+            mesh.loops.add(len(corners))
+            mesh.polygons.add(len(totals))
+            mesh.vertices.foreach_set("co", positions)
+            mesh.loops.foreach_set("vertex_index", corners)
+            starts = np.zeros(len(totals), dtype=np.int32)
+            np.cumsum(totals[:-1], out=starts[1:])
+            mesh.polygons.foreach_set("loop_start", starts)
+            mesh.update(calc_edges=True)
+            self.played[name] = topology
+        else:
+            mesh.vertices.foreach_set("co", positions)
+            mesh.update()
+
+        attributes = mesh.attributes
+        for attribute_name, chunk in arrays["Attributes"].items():
+            attribute = attributes.get(attribute_name)
+            if attribute and (
+                attribute.data_type != chunk["DataType"] or attribute.domain != chunk["Domain"]
+            ):
+                attributes.remove(attribute)
+                attribute = None
+            if attribute is None:
+                attribute = attributes.new(attribute_name, chunk["DataType"], chunk["Domain"])
+            key = Mesh.ATTRIBUTE_TYPES[chunk["DataType"]][2]
+            attribute.data.foreach_set(key, self._view(chunk))
+
+        # cached geometry no longer matches any hash or delta baseline
+        if Mesh.HASH_KEY in mesh:
+            del mesh[Mesh.HASH_KEY]
+        if Mesh.VERSION_KEY in obj:
+            del obj[Mesh.VERSION_KEY]
+        obj.matrix_world = Matrix(np.reshape(entry["Matrix"], (4, 4)).tolist())
@@ -0,0 +1,98 @@
+import struct
+
+import bpy
+import numpy as np
+
+
+class Image:
+    """
+    Raw pixel payload written straight into a Blender image.
+
+    Binary layout (little-endian), sent as the packet payload without JSON:
+    `[4b uint32 width] [4b uint32 height] [1b uint8 channels] [1b uint8 dtype]
+    [2b uint16 name length] [name utf-8] [pixels]`. `dtype` is 0 for uint8 and 1 for float32;
+    pixels are row-major, bottom row first as Blender stores them, with 1 to 4 channels.
+    """
+
+    HEADER_FORMAT = "<IIBBH"
+    DTYPES = {0: np.uint8, 1: np.float32}
+
+    _buffers = {}  # image name -> reusable float32 RGBA buffer
+
+    def __init__(self):
+        self.name = None
+        self.width = 0
+        self.height = 0
+        self.channels = 4
+        self.pixels = None  # (height * width, channels) array, uint8 or float32
+        self.image = None
+
+    def create_or_replace(self, image_name=None):
+        """Write the pixels into the named image, reusing it when it already exists."""
+        self.name = image_name or self.name
+        self.image = bpy.data.images.get(self.name)
+        is_float = self.pixels.dtype == np.float32
+
+        if self.image is None:
+            self.image = bpy.data.images.new(
+                self.name, self.width, self.height, alpha=True, float_buffer=is_float
+            )
+        elif tuple(self.image.size) != (self.width, self.height):
+            self.image.scale(self.width, self.height)
+
+        self.image.pixels.foreach_set(self._to_rgba())
+        self.image.update()
+
+    def _to_rgba(self) -> np.ndarray:
+        """Expand to the flat float32 RGBA layout Blender expects, avoiding copies where possible."""
+        if self.channels == 4 and self.pixels.dtype == np.float32:
+            return self.pixels.reshape(-1)
+
+        size = self.width * self.height * 4
+        buffer = Image._buffers.get(self.name)
+        if buffer is None or len(buffer) != size:
+            buffer = np.empty(size, dtype=np.float32)
+            Image._buffers[self.name] = buffer
+        rgba = buffer.reshape(-1, 4)
+
+        pixels = self.pixels
+        if self.channels <= 2:
+            rgba[:, :3] = pixels[:, :1]  # luminance (+ alpha)
+        else:
+            rgba[:, :3] = pixels[:, :3]
+        has_alpha = self.channels in (2, 4)
+        if has_alpha:
+            rgba[:, 3] = pixels[:, -1]
+        if pixels.dtype == np.uint8:
+            buffer *= np.float32(1 / 255)  # normalize in place
+        if not has_alpha:
+            rgba[:, 3] = 1.0
+        return buffer
+
+    @staticmethod
+    def from_bytes(data) -> "Image":
+        """Parse a binary image payload without copying the pixel bytes."""
+        header_size = struct.calcsize(Image.HEADER_FORMAT)
+        width, height, channels, dtype, name_length = struct.unpack_from(
+            Image.HEADER_FORMAT, data
+        )
+        if not 1 <= channels <= 4:
+            raise ValueError(f"Unsupported channel count: {channels}")
+        if dtype not in Image.DTYPES:
+            raise ValueError(f"Unsupported pixel type: {dtype}")
+
+        name = bytes(data[header_size : header_size + name_length]).decode("utf-8")
+        offset = header_size + name_length
+        count = width * height * channels
+        pixel_type = Image.DTYPES[dtype]
+        if len(data) < offset + count * np.dtype(pixel_type).itemsize:
+            raise ValueError(f"Image payload is truncated: expected {count} values.")
+        pixels = np.frombuffer(data, dtype=pixel_type, count=count, offset=offset)
+
+        image = Image()
+        image.name = name
+        image.width = width
+        image.height = height
+        image.channels = channels
+        image.pixels = pixels.reshape(-1, channels)
+        return image
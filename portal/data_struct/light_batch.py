@@ -0,0 +1,297 @@
+import bpy
+import numpy as np
+
+from .collection_cache import CollectionCache
+from .color import Color
+from .conversion import CoordinateConversion
+
+
+class LightBatch:
+    """
+    All lights of one message, held as arrays so their orientation is computed in one NumPy pass.
+
+    The values last written to Blender are kept per channel. On the next message each light is
+    compared with them and only properties that moved beyond `TOLERANCE` are written, so static
+    lights cause no depsgraph updates; a skipped property keeps its written value as the baseline,
+    so slow drift still gets written once it adds up. Lights missing from the message are removed.
+    """
+
+    TOLERANCE = 1e-5
+    TYPES = {"SPOT": "SPOT", "POINT": "POINT", "DIRECTIONAL": "SUN", "RECTANGULAR": "AREA"}
+
+    FIELDS = ("colors", "energies", "locations", "rotations", "spots", "sizes")
+
+    _applied = {}  # channel name -> LightBatch holding the values currently in Blender
+
+    def __init__(self):
+        self.names = []  # object names
+        self.data_names = []  # light datablock names used on creation, or None
+        self.types = []  # Blender light types
+        self.colors = None  # (N, 3) linear rgb
+        self.energies = None  # (N, 1) watts
+        self.locations = None  # (N, 3)
+        self.rotations = None  # (N, 3) XYZ euler
+        self.orientations = None  # (N, 3, 3) rotation matrices the eulers came from
+        self.spots = None  # (N, 2) spot size, spot blend
+        self.sizes = None  # (N, 2) area size x, y
+
+    def apply(self, channel_name, layer_path=None) -> int:
+        """Create, update and remove light objects to match this batch. Returns lights written."""
+        previous = LightBatch._applied.get(channel_name)
+        objects = bpy.data.objects
+
+        index = {name: i for i, name in enumerate(previous.names)} if previous else {}
+        rows = np.array([index.get(name, -1) for name in self.names], dtype=np.int64)
+        # a light whose type changed is rewritten as a whole
+        known = np.array(
+            [row >= 0 and previous.types[row] == t for row, t in zip(rows, self.types)], dtype=bool
+        )
+        changed = {field: self._changed(field, previous, rows, known) for field in self.FIELDS}
+        dirty = ~known | np.logical_or.reduce(list(changed.values()))
+        full_mask = ~known  # lights written as a whole
+        skipped = np.zeros(len(self.names), dtype=bool)  # names held by objects of other kinds
+
+        colors, energies = self.colors.tolist(), self.energies[:, 0].tolist()
+        locations, rotations = self.locations.tolist(), self.rotations.tolist()
+        spots, sizes = self.spots.tolist(), self.sizes.tolist()
+
+        written = 0
+        for i, name in enumerate(self.names):
+            obj = objects.get(name)
+            if obj is not None and obj.type != "LIGHT":
+                # This channel only creates lights, so the object is not ours to replace
+                print(f"Object {name} is not a light; skipping the light with that name.")
+                skipped[i] = True
+                continue
+            if obj is None:
+                data_name = self.data_names[i] or f"{name}_{self.types[i]}"
+                light_data = bpy.data.lights.new(data_name, self.types[i])
+                obj = objects.new(name, light_data)
+                CollectionCache.link(obj, layer_path)
+                full = full_mask[i] = True
+            elif not dirty[i]:
+                continue
+            else:
+                light_data = obj.data
+                full = full_mask[i] = not known[i] or light_data.type != self.types[i]
+                if light_data.type != self.types[i]:
+                    light_data.type = self.types[i]
+
+            light_type = self.types[i]
+            if full or changed["colors"][i]:
+                light_data.color = colors[i]
+            if full or changed["energies"][i]:
+                light_data.energy = energies[i]
+            if full or changed["locations"][i]:
+                obj.location = locations[i]
+            if light_type in ("SPOT", "AREA") and (full or changed["rotations"][i]):
+                obj.rotation_euler = rotations[i]
+            if light_type == "SPOT" and (full or changed["spots"][i]):
+                light_data.spot_size, light_data.spot_blend = spots[i]
+            elif light_type == "AREA" and (full or changed["sizes"][i]):
+                light_data.shape = "RECTANGLE"
+                light_data.size, light_data.size_y = sizes[i]
+            written += 1
+
+        if previous:
+            self._remove_missing(previous)
+        LightBatch._applied[channel_name] = self._written_state(
+            previous, rows, known, changed, full_mask, skipped
+        )
+        return written
+
+    def _written_state(self, previous, rows, known, changed, full_mask, skipped) -> "LightBatch":
+        """
+        This batch with every property that was not written replaced by the previous baseline,
+        so the next comparison is against what Blender actually shows.
+        """
+        state = LightBatch()
+        state.names, state.data_names, state.types = self.names, self.data_names, self.types
+        for field in self.FIELDS:
+            values = getattr(self, field).copy()
+            keep = known & ~(changed[field] | full_mask)
+            if keep.any():
+                values[keep] = getattr(previous, field)[rows[keep]]
+            setattr(state, field, values)
+        if skipped.any():
+            # never written: drop them so they are not treated as existing lights next time
+            state._drop(~skipped)
+        return state
+
+    def _drop(self, mask):
+        """Keep only the lights selected by `mask`."""
+        self.names = [name for name, keep in zip(self.names, mask) if keep]
+        self.data_names = [name for name, keep in zip(self.data_names, mask) if keep]
+        self.types = [t for t, keep in zip(self.types, mask) if keep]
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field)[mask])
+
+    def _changed(self, field, previous, rows, known) -> np.ndarray:
+        """Per-light mask of values that moved beyond the tolerance since the previous batch."""
+        values = getattr(self, field)
+        mask = ~known
+        if known.any():
+            delta = np.abs(values[known] - getattr(previous, field)[rows[known]])
+            mask[known] = np.any(delta > LightBatch.TOLERANCE, axis=1)
+        return mask
+
+    def _remove_missing(self, previous):
+        """Delete lights the previous batch produced but this one no longer contains."""
+        current = set(self.names)
+        to_remove = []
+        for name in previous.names:
+            if name in current:
+                continue
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.type != "LIGHT":
+                continue
+            to_remove.append(obj)
+            if obj.data.users == 1:
+                to_remove.append(obj.data)
+        if to_remove:
+            bpy.data.batch_remove(ids=to_remove)
+
+    def world_matrices(self) -> np.ndarray:
+        """(N, 4, 4) world matrices of the received lights, e.g. for recording."""
+        matrices = np.zeros((len(self.names), 4, 4))
+        matrices[:, :3, :3] = self.orientations
+        matrices[:, :3, 3] = self.locations
+        matrices[:, 3, 3] = 1
+        return matrices
+
+    @staticmethod
+    def clear(channel_name=None):
+        """Forget applied values so the next message writes every property."""
+        if channel_name is None:
+            LightBatch._applied.clear()
+        else:
+            LightBatch._applied.pop(channel_name, None)
+
+    @staticmethod
+    def _rotation_to(directions) -> np.ndarray:
+        """Rotation matrices turning Blender's light axis (0, 0, -1) onto each direction."""
+        count = len(directions)
+        length = np.linalg.norm(directions, axis=1)
+        d = LightBatch._normalize(directions)
+        cos = -d[:, 2]
+        # Rodrigues for a = (0, 0, -1): axis a x d = (dy, -dx, 0)
+        k = np.zeros((count, 3, 3))
+        k[:, 0, 2], k[:, 1, 2] = -d[:, 0], -d[:, 1]
+        k[:, 2, 0], k[:, 2, 1] = d[:, 0], d[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrices = np.eye(3) + k + (k @ k) / (1 + cos)[:, None, None]
+        opposite = cos < -1 + 1e-9
+        matrices[opposite] = np.diag((1.0, -1.0, -1.0))  # half turn about X
+        matrices[length == 0] = np.eye(3)
+        return matrices
+
+    @staticmethod
+    def _spot_blend(spot_sizes, radius_ratios) -> np.ndarray:
+        """
+        Blender's spot_blend for cones given as full angles and inner / outer radius ratios.
+        Blender fades over cosines: full intensity from cos(outer) + (1 - cos(outer)) * blend.
+        Both radii are measured at the same distance, so tan(inner) = ratio * tan(outer).
+        """
+        outer = np.clip(spot_sizes / 2, 0, np.pi / 2 - 1e-6)
+        inner = np.arctan(np.clip(radius_ratios, 0, 1) * np.tan(outer))
+        cos_outer = np.cos(outer)
+        blend = np.divide(
+            np.cos(inner) - cos_outer,
+            1 - cos_outer,
+            out=np.zeros_like(cos_outer),
+            where=cos_outer < 1,
+        )
+        return np.clip(blend, 0, 1)
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        length = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, length, out=np.zeros_like(vectors), where=length > 0)
+
+    @staticmethod
+    def from_dicts(light_dicts, conversion=None) -> "LightBatch":
+        """
+        Parse a list of light dictionaries. Positions and direction vectors are gathered into
+        arrays, optionally passed through a CoordinateConversion, and turned into rotations at once.
+        """
+        count = len(light_dicts)
+        batch = LightBatch()
+        batch.colors = np.zeros((count, 3))
+        batch.energies = np.zeros((count, 1))
+        batch.locations = np.zeros((count, 3))
+        batch.spots = np.zeros((count, 2))
+        radius_ratios = np.zeros(count)  # inner / outer spot radius
+        directions = np.zeros((count, 3))
+        lengths = np.zeros((count, 3))
+        widths = np.zeros((count, 3))
+        color_cache = {}
+
+        for i, data in enumerate(light_dicts):
+            light_type = data.get("LightType")
+            intensity = data.get("Intensity")
+            position = data.get("Position")
+            if not all([light_type, position]) or intensity is None:
+                raise ValueError(f"Missing required light data. Got: {data}")
+            blender_type = LightBatch.TYPES.get(light_type.upper())
+            if blender_type is None:
+                raise ValueError(f"Unsupported light type: {light_type}")
+
+            hex_color = data.get("Color", "#FFFFFF")
+            if hex_color not in color_cache:
+                color_cache[hex_color] = Color.from_hex(hex_color, "srgb").to_tuple(
+                    "rgb", normalize=True
+                )
+            batch.colors[i] = color_cache[hex_color]
+            batch.energies[i] = intensity * 1000  # Convert to watts
+            batch.locations[i] = position[:3]
+            batch.names.append(f"Light_{data.get('Id', i)}")
+            batch.data_names.append(data.get("Name"))
+            batch.types.append(blender_type)
+
+            if blender_type == "SPOT":
+                spot_size = data.get("SpotAngleRadians")
+                radii = data.get("SpotRadii")
+                direction = data.get("Direction")
+                if spot_size is None or direction is None or not radii:
+                    raise ValueError("Missing required spot light data")
+                batch.spots[i, 0] = spot_size
+                outer = radii.get("Outer")
+                radius_ratios[i] = radii.get("Inner") / outer if outer else 0.0
+                directions[i] = direction[:3]
+            elif blender_type == "AREA":
+                length, width = data.get("Length"), data.get("Width")
+                direction = data.get("Direction")
+                if not all([length, width, direction]):
+                    raise ValueError("Missing required area light data")
+                lengths[i], widths[i], directions[i] = length[:3], width[:3], direction[:3]
+
+        if conversion:
+            batch.locations = conversion.points(batch.locations)
+            directions = conversion.vectors(directions)
+            lengths = conversion.vectors(lengths)
+            widths = conversion.vectors(widths)
+
+        types = np.asarray(batch.types)
+        rotations = np.zeros((count, 3, 3))
+        spot = types == "SPOT"
+        if spot.any():
+            rotations[spot] = LightBatch._rotation_to(directions[spot])
+            batch.spots[spot, 1] = LightBatch._spot_blend(batch.spots[spot, 0], radius_ratios[spot])
+        area = types == "AREA"
+        if area.any():
+            # area light faces along negative Z in local space, X along its length
+            z_axis = -LightBatch._normalize(directions[area])
+            x_axis = LightBatch._normalize(lengths[area])
+            x_axis = LightBatch._normalize(
+                x_axis - np.sum(x_axis * z_axis, axis=1, keepdims=True) * z_axis
+            )
+            y_axis = LightBatch._normalize(np.cross(z_axis, x_axis))
+            rotations[area] = np.stack((x_axis, y_axis, z_axis), axis=2)
+        rotations[~(spot | area)] = np.eye(3)  # point and sun lights are not oriented
+        batch.orientations = rotations
+        batch.rotations = CoordinateConversion.to_euler(rotations)
+
+        batch.sizes = np.stack(
+            (np.linalg.norm(lengths, axis=1), np.linalg.norm(widths, axis=1)), axis=1
+        )
+        return batch
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 
 import bpy
@@ -7,6 +9,10 @@ from .color import Color
 
 
 class Material:
+    HASH_KEY = "portal_material_hash"
+    _materials = {}  # material dict hash -> name of the Blender material built from it
+    _images = {}  # texture path -> (mtime, image name)
+
     def __init__(self):
         """Initialize the Material object."""
         self.name = None
@@ -71,7 +77,10 @@ class Material:
             return False
 
         for tex_node, new_texture in zip(existing_textures, self.textures):
-            if tex_node.image.filepath != new_texture["Path"]:
+            if "Image" in new_texture:
+                if not tex_node.image or tex_node.image.name != new_texture["Image"]:
+                    return False
+            elif tex_node.image.filepath != new_texture["Path"]:
                 return False
 
         return True
@@ -106,16 +115,24 @@ class Material:
 
         for texture in self.textures:
             tex_type = texture["Type"]
-            tex_path = texture["Path"]
 
-            # Check if the texture path exists
-            if not os.path.exists(tex_path):
-                print(f"Texture file not found: {tex_path}")
-                continue
+            if "Image" in texture:
+                # Pixels streamed over an "Image" connection, no file involved
+                image = bpy.data.images.get(texture["Image"])
+                if not image:
+                    print(f"Streamed image not found: {texture['Image']}")
+                    continue
+            else:
+                tex_path = texture["Path"]
+                # Check if the texture path exists
+                if not os.path.exists(tex_path):
+                    print(f"Texture file not found: {tex_path}")
+                    continue
+                image = Material._load_image(tex_path)
 
             # Create a new texture image node
             tex_image_node = nodes.new(type="ShaderNodeTexImage")
-            tex_image_node.image = bpy.data.images.load(tex_path)
+            tex_image_node.image = image
 
             # Link the texture node based on its type
             if tex_type in (
@@ -129,13 +146,50 @@ class Material:
                 print(f"Unsupported texture type: {tex_type}")
                 continue
 
+    @staticmethod
+    def _load_image(tex_path):
+        """Load a texture once per session, reloading it only when the file changed on disk."""
+        mtime = os.path.getmtime(tex_path)
+        cached = Material._images.get(tex_path)
+        image = bpy.data.images.get(cached[1]) if cached else None
+        if image is None:
+            image = bpy.data.images.load(tex_path, check_existing=True)
+        elif cached[0] != mtime:
+            image.reload()
+        Material._images[tex_path] = (mtime, image.name)
+        return image
+
+    @staticmethod
+    def content_hash(dict) -> str:
+        """Hash a material dictionary, independent of key order."""
+        encoded = json.dumps(dict, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    @staticmethod
+    def get_or_create(dict) -> str:
+        """
+        Return the name of the Blender material for a material dictionary, building it only the
+        first time its content is seen in this session.
+        """
+        content_hash = Material.content_hash(dict)
+        name = Material._materials.get(content_hash)
+        cached = bpy.data.materials.get(name) if name else None
+        if cached and cached.get(Material.HASH_KEY) == content_hash:
+            return cached.name
+
+        material = Material.from_dict(dict)
+        material.create_or_replace(dict.get("Name"))
+        material.material[Material.HASH_KEY] = content_hash
+        Material._materials[content_hash] = material.material.name
+        return material.material.name
+
     @staticmethod
     def from_dict(dict):
         """Create a Material object from a dictionary."""
         material = Material()
         material.set_data(
             diffuse_color=dict.get("DiffuseColor"),
-            textures=dict.get("Textures"),
+            textures=dict.get("Textures") or [],
         )
         return material
 
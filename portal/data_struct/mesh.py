@@ -1,51 +1,80 @@
+import base64
+import hashlib
+from itertools import chain
+
 import bpy
 import numpy as np
-from mathutils import Vector
+from mathutils import Matrix, Vector
 
+from .collection_cache import CollectionCache
 from .color import Color
 from .material import Material
 from .p_types import PGeoType
+from .quantized import QuantizedArray
 
 
 class Mesh:
+    VERSION_KEY = "portal_mesh_version"
+    HASH_KEY = "portal_geometry_hash"
+    _shared_meshes = {}  # geometry hash -> name of the mesh datablock holding that geometry
+
+    # attribute type -> (dtype, components, foreach_set key)
+    ATTRIBUTE_TYPES = {
+        "FLOAT": (np.float32, 1, "value"),
+        "INT": (np.int32, 1, "value"),
+        "FLOAT_VECTOR": (np.float32, 3, "vector"),
+        "FLOAT2": (np.float32, 2, "vector"),
+        "BOOLEAN": (np.bool_, 1, "value"),
+        "FLOAT_COLOR": (np.float32, 4, "color"),
+        "FLOAT4X4": (np.float32, 16, "value"),
+    }
+
     def __init__(self):
         """Initialize the Mesh object without requiring object name or collection name."""
         self.vertices = []
         self.faces = []
+        self.face_sizes = None  # when set, `faces` is a flat array of corner vertex indices
         self.vertex_colors = []
         self.uvs = []
         self.mesh_data = None
         self.object_name = None
+        self.version = None  # delta baseline version, stamped on the Blender object
+        self.transform = None  # optional 4x4 world matrix supplied by the sender
+        self.attributes = []  # (name, type, domain, flat values) written as mesh attributes
 
-    def to_dict(self, meta: dict | None = None) -> dict:
+    def to_dict(self, meta: dict | None = None, precision: float | None = None) -> dict:
         """
         Convert the mesh data to a dictionary for serialization.
 
         Args:
             meta (dict | None): Metadata dictionary.
+            precision (float | None): If set, vertices are quantized relative to their bounding
+                box with at most this absolute error, and UVs are quantized to 16 bits.
 
         Returns:
             dict: Serialized mesh data.
         """
-        vertices = [[v[0], v[1], v[2]] for v in self.vertices]
-        uvs = [[uv[0], uv[1]] for uv in self.uvs]
-
         mesh_dict = {
             "Type": PGeoType.MESH.value,
-            "Vertices": vertices,
             "Faces": [list(face) for face in self.faces],
-            "UVs": uvs,
             "VertexColors": [
                 Color.from_normalized_tuple(col).to_hex("rgb") for col in self.vertex_colors
             ],
         }
+        if precision:
+            mesh_dict["QuantizedVertices"] = QuantizedArray.encode(self.vertices, precision)
+            if len(self.uvs):
+                mesh_dict["QuantizedUVs"] = QuantizedArray.encode(self.uvs, bits=16)
+        else:
+            mesh_dict["Vertices"] = [[v[0], v[1], v[2]] for v in self.vertices]
+            mesh_dict["UVs"] = [[uv[0], uv[1]] for uv in self.uvs]
         return {"Items": mesh_dict, "Meta": meta if meta else {}}
 
     def set_data(self, vertices, faces, uvs=None, vertex_colors=None):
         """Set the mesh data."""
         self.vertices = vertices
         self.faces = faces
-        self.uvs = uvs or []
+        self.uvs = uvs if uvs is not None else []
         self.vertex_colors = vertex_colors or []
 
     def create_or_replace(self, object_name, layer_path=None):
@@ -53,18 +82,38 @@ class Mesh:
         self._validate_data()
         self.object_name = object_name
 
+        geometry_hash = self.geometry_hash()
         existing_obj = bpy.data.objects.get(object_name)
-
-        if existing_obj and existing_obj.type == "MESH":
-            self._replace_mesh(existing_obj)
+        if existing_obj and existing_obj.type != "MESH":
+            # Object data type cannot change; drop the stale object so the new one keeps the name
+            bpy.data.objects.remove(existing_obj)
+            existing_obj = None
+
+        # Attributes live on the datablock, so meshes carrying them are never shared
+        share = not self.attributes
+        if existing_obj:
+            if existing_obj.data.get(Mesh.HASH_KEY) == geometry_hash and (
+                share or existing_obj.data.users == 1
+            ):
+                self.mesh_data = existing_obj.data  # geometry unchanged, nothing to rebuild
+            else:
+                self._replace_mesh(existing_obj, geometry_hash, share)
+            if not existing_obj.users_collection:
+                # Object taken from a pool is not linked anywhere yet
+                self._link_object_to_collection(existing_obj, layer_path)
         else:
-            self._create_new_mesh(object_name, layer_path)
+            existing_obj = self._create_new_mesh(object_name, layer_path, geometry_hash, share)
 
-        if self.vertex_colors:
-            self._apply_vertex_colors()
+        if self.attributes:
+            self._apply_attributes(geometry_hash)
 
-        if self.uvs:
-            self._apply_uv_map()
+        obj = existing_obj
+        if self.transform is not None:
+            obj.matrix_world = Mesh._to_matrix(self.transform)
+        if self.version is not None:
+            obj[Mesh.VERSION_KEY] = self.version
+        elif Mesh.VERSION_KEY in obj:
+            del obj[Mesh.VERSION_KEY]
 
     def apply_material(self, material):
         """Apply material to the mesh object."""
@@ -86,8 +135,50 @@ class Mesh:
         # Apply the material to the object
         if len(obj.data.materials) == 0:
             obj.data.materials.append(mat)
+        slot = obj.material_slots[0]
+        # A shared datablock keeps the material on the object slot so instances can differ
+        slot.link = "OBJECT" if obj.data.users > 1 else "DATA"
+        slot.material = mat
+
+    def geometry_hash(self) -> str:
+        """Hash vertices, faces, UVs and vertex colors to find identical geometry."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(self.vertices, dtype=np.float32).tobytes())
+        if self.face_sizes is not None:
+            digest.update(np.ascontiguousarray(self.face_sizes, dtype=np.int32).tobytes())
+            digest.update(np.ascontiguousarray(self.faces, dtype=np.int32).tobytes())
         else:
-            obj.data.materials[0] = mat
+            digest.update(np.fromiter(map(len, self.faces), dtype=np.int32).tobytes())
+            digest.update(np.fromiter(chain.from_iterable(self.faces), dtype=np.int32).tobytes())
+        digest.update(np.ascontiguousarray(self.uvs, dtype=np.float32).tobytes())
+        digest.update(np.ascontiguousarray(self.vertex_colors, dtype=np.float32).tobytes())
+        return digest.hexdigest()
+
+    def _fill_from_arrays(self):
+        """Build geometry from flat face arrays with foreach_set instead of from_pydata."""
+        mesh_data = self.mesh_data
+        vertices = np.ascontiguousarray(self.vertices, dtype=np.float32).reshape(-1)
+        corners = np.ascontiguousarray(self.faces, dtype=np.int32)
+        sizes = np.asarray(self.face_sizes, dtype=np.int32)
+        if sizes.sum() != len(corners):
+            raise ValueError(
+                f"Face sizes add up to {sizes.sum()}, but {len(corners)} face indices were given."
+            )
+        starts = np.zeros(len(sizes), dtype=np.int32)
+        np.cumsum(sizes[:-1], out=starts[1:])
+
+        mesh_data.vertices.add(len(vertices) // 3)
+        mesh_data.loops.add(len(corners))
+        mesh_data.polygons.add(len(sizes))
+        mesh_data.vertices.foreach_set("co", vertices)
+        mesh_data.loops.foreach_set("vertex_index", corners)
+        mesh_data.polygons.foreach_set("loop_start", starts)
+        mesh_data.update(calc_edges=True)
+
+    def _corner_vertices(self) -> np.ndarray:
+        corners = np.empty(len(self.mesh_data.loops), dtype=np.int32)
+        self.mesh_data.loops.foreach_get("vertex_index", corners)
+        return corners
 
     def _apply_vertex_colors(self):
         """Apply vertex colors to the mesh."""
@@ -95,6 +186,13 @@ class Mesh:
             self.mesh_data.vertex_colors.new()
 
         color_layer = self.mesh_data.vertex_colors.active
+        if len(self.vertex_colors) == len(self.mesh_data.vertices):
+            # one color per vertex: spread to corners in one pass
+            colors = np.asarray(self.vertex_colors, dtype=np.float32)
+            if colors.shape[1] == 3:
+                colors = np.hstack((colors, np.ones((len(colors), 1), dtype=np.float32)))
+            color_layer.data.foreach_set("color", colors[self._corner_vertices()].ravel())
+            return
         color_dict = {i: col for i, col in enumerate(self.vertex_colors)}
 
         for poly in self.mesh_data.polygons:
@@ -110,6 +208,10 @@ class Mesh:
             self.mesh_data.uv_layers.new()
 
         uv_layer = self.mesh_data.uv_layers.active
+        if len(self.uvs) == len(self.mesh_data.vertices):
+            uvs = np.asarray(self.uvs, dtype=np.float32)
+            uv_layer.data.foreach_set("uv", uvs[self._corner_vertices()].ravel())
+            return
         uv_dict = {i: uv for i, uv in enumerate(self.uvs)}
 
         for poly in self.mesh_data.polygons:
@@ -119,70 +221,112 @@ class Mesh:
                 if vertex_index in uv_dict:
                     uv_layer.data[idx].uv = uv_dict[vertex_index]
 
-    def _create_new_mesh(self, object_name, layer_path=None):
-        """Create a new mesh in Blender."""
-        self.mesh_data = bpy.data.meshes.new(f"{object_name}_mesh")
-        self.mesh_data.from_pydata(self.vertices, [], self.faces)
+    def _apply_attributes(self, geometry_hash):
+        """Write each attribute with one foreach_set, updating existing attributes in place."""
+        if Mesh._shared_meshes.get(geometry_hash) == self.mesh_data.name:
+            del Mesh._shared_meshes[geometry_hash]  # no longer plain geometry others may share
+        attributes = self.mesh_data.attributes
+        domain_sizes = {
+            "POINT": len(self.mesh_data.vertices),
+            "FACE": len(self.mesh_data.polygons),
+            "CORNER": len(self.mesh_data.loops),
+        }
+        for name, data_type, domain, values in self.attributes:
+            _, components, key = Mesh.ATTRIBUTE_TYPES[data_type]
+            if len(values) != domain_sizes[domain] * components:
+                raise ValueError(
+                    f"Attribute {name} has {len(values)} values, expected "
+                    f"{domain_sizes[domain] * components} for domain {domain}."
+                )
+            attribute = attributes.get(name)
+            if attribute and (attribute.data_type != data_type or attribute.domain != domain):
+                attributes.remove(attribute)
+                attribute = None
+            if attribute is None:
+                attribute = attributes.new(name, data_type, domain)
+            attribute.data.foreach_set(key, values)
+        self.mesh_data.update()
+
+    def _get_or_build_mesh_data(self, object_name, geometry_hash, reuse=None, share=True):
+        """
+        Reuse the datablock already holding identical geometry, or build one. A single-user
+        datablock passed as `reuse` is cleared and refilled instead of allocating a new one.
+        """
+        mesh_name = Mesh._shared_meshes.get(geometry_hash) if share else None
+        mesh_data = bpy.data.meshes.get(mesh_name) if mesh_name else None
+        if mesh_data and mesh_data.get(Mesh.HASH_KEY) == geometry_hash:
+            self.mesh_data = mesh_data
+            return
+
+        if reuse is not None and reuse.users == 1:
+            reuse.clear_geometry()
+            self.mesh_data = reuse
+        else:
+            self.mesh_data = bpy.data.meshes.new(f"{object_name}_mesh")
+        if self.face_sizes is not None:
+            self._fill_from_arrays()
+        else:
+            self.mesh_data.from_pydata(self.vertices, [], self.faces)
         self.mesh_data.update()
+        if self.vertex_colors:
+            self._apply_vertex_colors()
+        if len(self.uvs):
+            self._apply_uv_map()
+        self.mesh_data[Mesh.HASH_KEY] = geometry_hash
+        if share:
+            Mesh._shared_meshes[geometry_hash] = self.mesh_data.name
+
+    def _create_new_mesh(self, object_name, layer_path=None, geometry_hash=None, share=True):
+        """Create a new mesh in Blender."""
+        self._get_or_build_mesh_data(object_name, geometry_hash, share=share)
 
         new_object = bpy.data.objects.new(object_name, self.mesh_data)
         self._link_object_to_collection(new_object, layer_path)
+        return new_object
 
-    def _replace_mesh(self, existing_obj):
+    def _replace_mesh(self, existing_obj, geometry_hash=None, share=True):
         """Replace the existing mesh data in the Blender object."""
         old_mesh = existing_obj.data
-        self.mesh_data = bpy.data.meshes.new(f"{existing_obj.name}_mesh")
-        self.mesh_data.from_pydata(self.vertices, [], self.faces)
-        self.mesh_data.update()
+        self._get_or_build_mesh_data(existing_obj.name, geometry_hash, old_mesh, share)
 
         existing_obj.data = self.mesh_data
-        bpy.data.meshes.remove(old_mesh)
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+    @staticmethod
+    def _to_matrix(transform):
+        """Build a world matrix from a 4x4 row-major transform, nested or flat."""
+        return Matrix(np.reshape(transform, (4, 4)).tolist())
 
     def _validate_data(self):
         """Ensure that the mesh data is valid before creating or replacing."""
-        if not self.vertices or not self.faces:
+        if len(self.vertices) == 0 or len(self.faces) == 0:
             raise ValueError("Mesh data must include vertices and faces.")
 
     def _link_object_to_collection(self, obj, layer_path=None):
         """Link the object to the appropriate Blender collection, handling nested layers."""
-        if layer_path:
-            layer_names = layer_path.split("::")
-            parent_collection = None
-
-            for i, layer in enumerate(layer_names):
-                # Initialize the collection as None
-                collection = None
-
-                if parent_collection:
-                    # Check if the collection exists in the parent collection's children
-                    collection = parent_collection.children.get(layer)
-                    if not collection:
-                        # Create the collection under the parent collection
-                        collection = bpy.data.collections.new(layer)
-                        parent_collection.children.link(collection)
-                else:
-                    # For root-level collections, check in the scene's collection
-                    collection = bpy.context.scene.collection.children.get(layer)
-                    if not collection:
-                        # Create the collection under the scene's collection
-                        collection = bpy.data.collections.new(layer)
-                        bpy.context.scene.collection.children.link(collection)
-
-                # Set parent for the next nested layer
-                parent_collection = collection
-
-            # Link the object to the final collection in the nested structure
-            parent_collection.objects.link(obj)
-        else:
-            bpy.context.collection.objects.link(obj)
-
+        CollectionCache.link(obj, layer_path)
 
     @staticmethod
     def from_dict(dict):
         """Create a Mesh object from json dictionary."""
-        vertices = [(v[0], v[1], v[2]) for v in dict["Vertices"]]
-        faces = [tuple(face_list) for face_list in dict["Faces"]]
-        uvs = [(uv[0], uv[1]) for uv in dict.get("UVs", [])]
+        if "QuantizedVertices" in dict:
+            vertices = QuantizedArray.decode(dict["QuantizedVertices"]).reshape(-1, 3)
+        elif isinstance(dict["Vertices"], np.ndarray):
+            vertices = dict["Vertices"].reshape(-1, 3)  # binary source, e.g. a .portal archive
+        else:
+            vertices = [(v[0], v[1], v[2]) for v in dict["Vertices"]]
+        face_sizes = None
+        if "FaceSizes" in dict:
+            # flat form: per-face corner counts plus all corner vertex indices
+            face_sizes = np.asarray(dict["FaceSizes"], dtype=np.int32)
+            faces = np.asarray(dict["FaceIndices"], dtype=np.int32)
+        else:
+            faces = [tuple(face_list) for face_list in dict["Faces"]]
+        if "QuantizedUVs" in dict:
+            uvs = QuantizedArray.decode(dict["QuantizedUVs"]).reshape(-1, 2)
+        else:
+            uvs = [(uv[0], uv[1]) for uv in dict.get("UVs", [])]
         color_hexs = dict.get("VertexColors")
 
         vertex_colors = None
@@ -193,8 +337,110 @@ class Mesh:
 
         mesh = Mesh()
         mesh.set_data(vertices, faces, uvs, vertex_colors)
+        mesh.face_sizes = face_sizes
+        mesh.version = dict.get("Version")
+        mesh.transform = dict.get("Transform")
+        mesh.attributes = [
+            Mesh._parse_attribute(attribute) for attribute in dict.get("Attributes", [])
+        ]
         return mesh
 
+    @staticmethod
+    def _parse_attribute(attribute: dict):
+        """
+        Parse {"Name", "Type", "Domain", "Values" | "Data"}. "Data" is base64 of little-endian
+        float32 / int32 / uint8 (bool) values, flattened for vectors.
+        """
+        data_type = attribute["Type"]
+        domain = attribute.get("Domain", "POINT")
+        if data_type not in Mesh.ATTRIBUTE_TYPES:
+            raise ValueError(f"Unsupported attribute type: {data_type}")
+        if domain not in ("POINT", "FACE", "CORNER"):
+            raise ValueError(f"Unsupported attribute domain: {domain}")
+        dtype = Mesh.ATTRIBUTE_TYPES[data_type][0]
+        if "Data" in attribute:
+            raw = base64.b64decode(attribute["Data"])
+            values = np.frombuffer(raw, dtype=np.dtype(dtype).newbyteorder("<"))
+            values = values.astype(dtype, copy=False)
+        else:
+            values = np.asarray(attribute["Values"], dtype=dtype).ravel()
+        return attribute["Name"], data_type, domain, values
+
+    @staticmethod
+    def apply_delta(object_name, delta: dict) -> bool:
+        """
+        Patch vertex positions of an existing mesh in place from a delta message.
+        Returns False if the object does not hold the delta's baseline; the caller should wait
+        for the next keyframe.
+        """
+        obj = bpy.data.objects.get(object_name)
+        if not obj or obj.type != "MESH" or obj.get(Mesh.VERSION_KEY) != delta["Base"]:
+            return False
+        mesh_data = obj.data
+        if len(mesh_data.vertices) != delta["Count"]:
+            return False
+        if delta["Base"] == delta["Version"]:
+            return True  # nothing moved
+
+        if mesh_data.users > 1:
+            # Patching a shared datablock would move every instance; give this object its own
+            obj.data = mesh_data = mesh_data.copy()
+        if Mesh.HASH_KEY in mesh_data:
+            del mesh_data[Mesh.HASH_KEY]
+
+        coords = np.empty(delta["Count"] * 3)
+        mesh_data.vertices.foreach_get("co", coords)
+        for start, values in delta["Ranges"]:
+            coords[start * 3 : start * 3 + len(values)] = values
+        mesh_data.vertices.foreach_set("co", coords)
+        mesh_data.update()
+        obj[Mesh.VERSION_KEY] = delta["Version"]
+        return True
+
+    @staticmethod
+    def dict_from_obj(obj, meta: dict | None = None) -> dict:
+        """
+        Describe a Blender mesh object as an item in array form: local vertices, flat faces, its
+        world matrix and every user attribute (UV maps included). Values stay NumPy arrays, for
+        binary containers such as a .portal archive rather than JSON.
+        """
+        mesh_data = obj.data
+        vertices = np.empty(len(mesh_data.vertices) * 3, dtype=np.float32)
+        mesh_data.vertices.foreach_get("co", vertices)
+        face_sizes = np.empty(len(mesh_data.polygons), dtype=np.int32)
+        mesh_data.polygons.foreach_get("loop_total", face_sizes)
+        face_indices = np.empty(len(mesh_data.loops), dtype=np.int32)
+        mesh_data.loops.foreach_get("vertex_index", face_indices)
+
+        attributes = []
+        for attribute in mesh_data.attributes:
+            if attribute.is_internal or attribute.is_required:
+                continue
+            spec = Mesh.ATTRIBUTE_TYPES.get(attribute.data_type)
+            if spec is None or attribute.domain not in ("POINT", "FACE", "CORNER"):
+                continue
+            dtype, components, key = spec
+            values = np.empty(len(attribute.data) * components, dtype=dtype)
+            attribute.data.foreach_get(key, values)
+            attributes.append(
+                {
+                    "Name": attribute.name,
+                    "Type": attribute.data_type,
+                    "Domain": attribute.domain,
+                    "Values": values,
+                }
+            )
+
+        mesh_dict = {
+            "Type": PGeoType.MESH.value,
+            "Vertices": vertices.reshape(-1, 3),
+            "FaceSizes": face_sizes,
+            "FaceIndices": face_indices,
+            "Transform": [value for row in obj.matrix_world for value in row],
+            "Attributes": attributes,
+        }
+        return {"Items": mesh_dict, "Meta": meta if meta else {}}
+
     @staticmethod
     def from_obj(obj):
         """Create a Mesh object from a Blender object, using world coordinates for vertices."""
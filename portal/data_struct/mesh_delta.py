@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .p_types import PGeoType
+
+if TYPE_CHECKING:
+    from .mesh import Mesh  # needs bpy; only the duck-typed mesh data is used here
+
+
+class MeshDeltaEncoder:
+    """
+    Encode successive frames of the same mesh as vertex deltas against the last frame sent.
+
+    Messages are full keyframes when there is no baseline for the key, when the topology, UVs or
+    vertex colors changed, or every `KEYFRAME_INTERVAL` deltas so receivers that missed the
+    baseline can resync. Otherwise only the changed vertex ranges are sent.
+    """
+
+    KEYFRAME_INTERVAL = 30  # deltas between forced keyframes
+    MERGE_GAP = 8  # unchanged vertices bridged between two changed ranges
+
+    def __init__(self):
+        self._baselines = {}  # key -> (version, vertices, topology signature, deltas since keyframe)
+
+    def reset(self):
+        """Forget all baselines so the next frame of every object is a keyframe."""
+        self._baselines.clear()
+
+    def encode(
+        self, key, mesh: "Mesh", meta: dict | None = None, precision: float | None = None
+    ) -> dict:
+        vertices = np.asarray(mesh.vertices, dtype=np.float64).reshape(-1, 3)
+        signature = MeshDeltaEncoder._topology_signature(mesh)
+        baseline = self._baselines.get(key)
+
+        if (
+            baseline is None
+            or baseline[2] != signature
+            or len(baseline[1]) != len(vertices)
+            or baseline[3] >= self.KEYFRAME_INTERVAL
+        ):
+            version = baseline[0] + 1 if baseline else 1
+            self._baselines[key] = (version, vertices, signature, 0)
+            item = mesh.to_dict(meta, precision)
+            item["Items"]["Version"] = version
+            return item
+
+        version, previous, _, since_keyframe = baseline
+        ranges = MeshDeltaEncoder._changed_ranges(previous, vertices)
+        if ranges:
+            # Unchanged frames keep the version so the message (and its checksum) repeats
+            version += 1
+            self._baselines[key] = (version, vertices, signature, since_keyframe + 1)
+
+        delta = {
+            "Type": PGeoType.MESH.value,
+            "Delta": {
+                "Base": baseline[0] if ranges else version,
+                "Version": version,
+                "Count": len(vertices),
+                "Ranges": [
+                    [start, vertices[start:stop].ravel().tolist()] for start, stop in ranges
+                ],
+            },
+        }
+        return {"Items": delta, "Meta": meta if meta else {}}
+
+    @staticmethod
+    def _changed_ranges(previous: np.ndarray, current: np.ndarray) -> list[tuple[int, int]]:
+        """Return [start, stop) index ranges of vertices that moved, merging nearby ranges."""
+        changed = np.flatnonzero(np.any(previous != current, axis=1))
+        if len(changed) == 0:
+            return []
+        # Split wherever the gap to the next changed vertex is wider than MERGE_GAP
+        breaks = np.flatnonzero(np.diff(changed) > MeshDeltaEncoder.MERGE_GAP + 1)
+        starts = np.concatenate(([changed[0]], changed[breaks + 1]))
+        stops = np.concatenate((changed[breaks], [changed[-1]])) + 1
+        return list(zip(starts.tolist(), stops.tolist()))
+
+    @staticmethod
+    def _topology_signature(mesh: "Mesh") -> int:
+        """Hash everything except vertex positions; a change forces a keyframe."""
+        return hash(
+            (
+                tuple(tuple(face) for face in mesh.faces),
+                np.asarray(mesh.uvs, dtype=np.float64).tobytes(),
+                np.asarray(mesh.vertex_colors, dtype=np.float64).tobytes(),
+            )
+        )
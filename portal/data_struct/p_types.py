@@ -7,6 +7,7 @@ class PGeoType(Enum):
     MESH = auto()
     CURVE = auto()
     PLANE = auto()
+    POINTCLOUD = auto()
 
 class PCurveType(Enum):
     def _generate_next_value_(name, start, count, last_values):
@@ -18,6 +19,15 @@ class PCurveType(Enum):
     POLYLINE = auto()
     NURBS = auto()
 
+class PCompressionType(Enum):
+    # Stored in the header's compression byte; 0/1 stay compatible with the old bool flag
+    NONE = 0
+    GZIP = 1
+    ZLIB = 2
+    DEFLATE = 3
+    LZMA = 4
+    BZ2 = 5
+
 class PTextureType(Enum):
     NONE = 0
     BITMAP = 1
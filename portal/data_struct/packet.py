@@ -1,11 +1,15 @@
 import struct
 
 from ..utils.crypto import Crc16
+from .p_types import PCompressionType
 
 
 class PacketHeader:
-    def __init__(self, is_encrypted, is_compressed, size, checksum):
-        self.is_compressed = is_compressed
+    def __init__(self, is_encrypted, is_compressed, size, checksum, codec=None):
+        if codec is None:
+            codec = PCompressionType.GZIP.value if is_compressed else PCompressionType.NONE.value
+        self.codec = codec
+        self.is_compressed = codec != PCompressionType.NONE.value
         self.is_encrypted = is_encrypted
         self.size = size
         self.checksum = checksum
@@ -26,6 +30,10 @@ class PacketHeader:
     def Checksum(self):
         return self.checksum
 
+    @property
+    def Codec(self):
+        return self.codec
+
     @staticmethod
     def get_expected_size():
         return 8  # 1 + 1 + 2 + 4
@@ -42,6 +50,7 @@ class Packet:
         is_encrypted: bool | None = None,
         is_compressed: bool | None = None,
         header: PacketHeader | None = None,
+        codec: int | None = None,
     ):
         self.data = data
         if header is not None:
@@ -49,15 +58,16 @@ class Packet:
         else:
             self.header = PacketHeader(
                 is_encrypted if is_encrypted is not None else False,
-                is_compressed if is_compressed is not None else self._is_gzip,
+                is_compressed if is_compressed is not None else self._is_gzip(),
                 size if size is not None else len(data),
                 checksum if checksum is not None else self._compute_checksum(),
+                codec,
             )
 
     def serialize(self) -> bytes:
         header_bytes = bytearray()
         header_bytes.extend(Packet.MAGIC_NUMBER)  # magic number
-        header_bytes.append(1 if self.header.is_compressed else 0)  # is_compressed flag
+        header_bytes.append(self.header.codec)  # compression codec (0 = uncompressed)
         header_bytes.append(1 if self.header.is_encrypted else 0)  # is_encrypted flag
         header_bytes.extend(struct.pack("H", self.header.checksum))  # checksum
         header_bytes.extend(struct.pack("i", self.header.size))  # size
@@ -99,7 +109,7 @@ class Packet:
     @staticmethod
     def deserialize_header(data, index):
         # read flags
-        is_compressed = data[index] == 1
+        codec = data[index]
         index += 1
         is_encrypted = data[index] == 1
         index += 1
@@ -112,7 +122,7 @@ class Packet:
         size = struct.unpack_from("i", data, index)[0]
         index += struct.calcsize("i")
 
-        return PacketHeader(is_encrypted, is_compressed, size, checksum)
+        return PacketHeader(is_encrypted, codec != 0, size, checksum, codec)
 
     @staticmethod
     def deserialize_header_start(data, start_index=0):
@@ -0,0 +1,116 @@
+import bpy
+import numpy as np
+
+from .color import Color
+from .mesh import Mesh
+from .quantized import QuantizedArray
+
+
+class PointCloud(Mesh):
+    """
+    Vertex-only mesh for scans and particle output. Points are written with `vertices.add` and a
+    single `foreach_set`; when the point count is unchanged the existing vertices are overwritten
+    in place. Optional per-point `radius` and `color` become POINT attributes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.radii = None  # (N,) float32 or None
+        self.colors = None  # (N, 4) float32 RGBA or None
+
+    def create_or_replace(self, object_name, layer_path=None):
+        """Create or update the point cloud object in Blender."""
+        self._validate_data()
+        self.object_name = object_name
+        count = len(self.vertices)
+
+        obj = bpy.data.objects.get(object_name)
+        if obj and obj.type != "MESH":
+            # Object data type cannot change; drop the stale object so the new one keeps the name
+            bpy.data.objects.remove(obj)
+            obj = None
+        if obj:
+            if obj.data.users > 1:
+                # Never resize geometry another object is using
+                obj.data = bpy.data.meshes.new(f"{object_name}_points")
+            self.mesh_data = obj.data
+            if not obj.users_collection:
+                self._link_object_to_collection(obj, layer_path)
+        else:
+            self.mesh_data = bpy.data.meshes.new(f"{object_name}_points")
+            obj = bpy.data.objects.new(object_name, self.mesh_data)
+            self._link_object_to_collection(obj, layer_path)
+
+        self._resize(count)
+        self.mesh_data.vertices.foreach_set("co", self.vertices.ravel())
+
+        point_attributes = []
+        if self.radii is not None:
+            point_attributes.append(("radius", "FLOAT", "POINT", self.radii))
+        if self.colors is not None:
+            point_attributes.append(("color", "FLOAT_COLOR", "POINT", self.colors.ravel()))
+        self.attributes = point_attributes + self.attributes
+        if self.attributes:
+            self._apply_attributes(None)
+        else:
+            self.mesh_data.update()
+
+        # Positions changed without a geometry hash or delta baseline to match
+        if Mesh.HASH_KEY in self.mesh_data:
+            del self.mesh_data[Mesh.HASH_KEY]
+        if Mesh.VERSION_KEY in obj:
+            del obj[Mesh.VERSION_KEY]
+        if self.transform is not None:
+            obj.matrix_world = self._to_matrix(self.transform)
+
+    def _resize(self, count):
+        """Keep the vertex buffer when the count matches; otherwise reallocate once."""
+        mesh_data = self.mesh_data
+        if len(mesh_data.vertices) == count and not mesh_data.polygons and not mesh_data.edges:
+            return
+        mesh_data.clear_geometry()
+        mesh_data.vertices.add(count)
+
+    def _validate_data(self):
+        """Ensure the point cloud has points; faces are not required."""
+        if len(self.vertices) == 0:
+            raise ValueError("Point cloud data must include points.")
+
+    @staticmethod
+    def from_dict(dict):
+        """
+        Create a PointCloud from a json dictionary with "Points" or "QuantizedPoints", and
+        optional "Radius" (scalar), "Radii", "Colors" (hex) or "QuantizedColors".
+        """
+        if "QuantizedPoints" in dict:
+            points = QuantizedArray.decode(dict["QuantizedPoints"]).reshape(-1, 3)
+        else:
+            points = np.asarray(dict["Points"], dtype=np.float32).reshape(-1, 3)
+
+        point_cloud = PointCloud()
+        point_cloud.vertices = points
+        count = len(points)
+
+        if "Radii" in dict:
+            point_cloud.radii = np.asarray(dict["Radii"], dtype=np.float32).ravel()
+        elif "Radius" in dict:
+            point_cloud.radii = np.full(count, dict["Radius"], dtype=np.float32)
+
+        colors = None
+        if "QuantizedColors" in dict:
+            colors = QuantizedArray.decode(dict["QuantizedColors"])
+        elif dict.get("Colors"):
+            colors = np.asarray(
+                [Color.from_hex(hex_str).to_tuple(normalize=True) for hex_str in dict["Colors"]],
+                dtype=np.float32,
+            )
+        if colors is not None:
+            if colors.shape[1] == 3:
+                colors = np.hstack((colors, np.ones((len(colors), 1), dtype=np.float32)))
+            point_cloud.colors = colors
+
+        point_cloud.transform = dict.get("Transform")
+        point_cloud.attributes = [
+            Mesh._parse_attribute(attribute) for attribute in dict.get("Attributes", [])
+        ]
+        return point_cloud
@@ -0,0 +1,54 @@
+import base64
+
+import numpy as np
+
+
+class QuantizedArray:
+    """
+    Fixed-point encoding of float arrays relative to their axis-aligned bounding box.
+    Values are stored as little-endian uint16 (or uint32 when 16 bits cannot meet the precision)
+    and base64 encoded, which costs ~2.7 characters per component in JSON instead of ~18.
+    """
+
+    @staticmethod
+    def encode(values, precision: float | None = None, bits: int | None = None) -> dict:
+        """
+        Quantize an (N, k) array. Either pass `precision` (max absolute error per component) to
+        pick 16 or 32 bits, or force `bits`.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        lower = values.min(axis=0) if len(values) else np.zeros(values.shape[1])
+        upper = values.max(axis=0) if len(values) else np.zeros(values.shape[1])
+        extent = upper - lower
+
+        if bits is None:
+            # Rounding to the nearest step keeps the error within half a step
+            max_step = 2 * precision if precision else 0.0
+            bits = 16 if max_step > 0 and extent.max(initial=0) / 0xFFFF <= max_step else 32
+        levels = (1 << bits) - 1
+        dtype = "<u2" if bits == 16 else "<u4"
+
+        scale = np.where(extent > 0, levels / np.where(extent > 0, extent, 1), 0)
+        quantized = np.rint((values - lower) * scale).astype(dtype)
+        return {
+            "Min": lower.tolist(),
+            "Max": upper.tolist(),
+            "Bits": bits,
+            "Data": base64.b64encode(quantized.tobytes()).decode("ascii"),
+        }
+
+    @staticmethod
+    def decode(encoded: dict) -> np.ndarray:
+        """Dequantize into a float32 (N, k) array."""
+        lower = np.asarray(encoded["Min"], dtype=np.float32)
+        upper = np.asarray(encoded["Max"], dtype=np.float32)
+        dtype = "<u2" if encoded["Bits"] == 16 else "<u4"
+        levels = (1 << encoded["Bits"]) - 1
+
+        quantized = np.frombuffer(base64.b64decode(encoded["Data"]), dtype=dtype)
+        values = quantized.reshape(-1, len(lower)).astype(np.float32)
+        values *= (upper - lower) / np.float32(levels)
+        values += lower
+        return values
@@ -0,0 +1,61 @@
+import base64
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+from .point_cloud import PointCloud
+
+
+class Transforms:
+    """
+    Batch of world matrices for objects that already exist, so moving an assembly does not
+    resend or rebuild its geometry. Matrices are 4x4 row-major, given as "Matrices" (nested or
+    flat list) or "Data" (base64 little-endian float32, 16 values per matrix).
+
+    With an "Instancer" key the matrices are written to a point mesh instead: one point per
+    matrix at its translation, with the full matrix in a FLOAT4X4 `transform` point attribute.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.matrices = None  # (N, 4, 4) float32, row-major
+        self.instancer = None
+
+    def apply(self, object_names) -> int:
+        """Write each matrix to its object's matrix_world. Returns the number of objects missing."""
+        objects = bpy.data.objects
+        missing = 0
+        for name, matrix in zip(object_names, self.matrices.tolist()):
+            obj = objects.get(name)
+            if obj is None:
+                missing += 1
+                continue
+            obj.matrix_world = Matrix(matrix)
+        return missing
+
+    def apply_to_instancer(self, object_name, layer_path=None):
+        """Write all matrices as points of an instancer mesh with two foreach_set calls."""
+        instancer = PointCloud()
+        instancer.vertices = np.ascontiguousarray(self.matrices[:, :3, 3])
+        # Blender flattens matrices column by column
+        columns = np.ascontiguousarray(self.matrices.transpose(0, 2, 1)).ravel()
+        instancer.attributes = [("transform", "FLOAT4X4", "POINT", columns)]
+        instancer.create_or_replace(object_name, layer_path)
+
+    @staticmethod
+    def from_dict(dict):
+        transforms = Transforms()
+        if "Data" in dict:
+            values = np.frombuffer(base64.b64decode(dict["Data"]), dtype="<f4")
+        else:
+            values = np.asarray(dict["Matrices"], dtype=np.float32)
+        transforms.matrices = values.astype(np.float32, copy=False).reshape(-1, 4, 4)
+        transforms.instancer = dict.get("Instancer")
+        transforms.keys = dict.get("Keys", [])
+        if transforms.instancer is None and len(transforms.keys) != len(transforms.matrices):
+            raise ValueError(
+                f"Transform message has {len(transforms.keys)} keys but "
+                f"{len(transforms.matrices)} matrices."
+            )
+        return transforms
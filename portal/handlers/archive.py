@@ -0,0 +1,175 @@
+import json
+import os
+import struct
+
+import numpy as np
+
+from ..data_struct.p_types import PCompressionType
+from ..data_struct.payload import Payload
+from .binary_handler import BinaryHandler
+from .compression_handler import CompressionHandler
+
+
+class PortalArchive:
+    """
+    `.portal` container: a payload stored as binary blocks so large static scenes skip JSON.
+
+    Layout (little-endian): a 32 byte header `[4s magic "PRTL"] [uint16 version] [uint16 flags]
+    [uint32 item count] [uint64 index offset] [uint64 index size]`, then 64-byte aligned blocks,
+    then the JSON index `{"Meta", "Items": [item block], "Blocks": [[offset, size, codec, dtype,
+    shape]]}`. Each item is a block holding the usual wire item `{"Items": data, "Meta": meta}` as
+    JSON, with every NumPy array replaced by `{"$Block": n}`. Blocks are compressed one by one
+    with the chosen codec when that pays off; raw blocks are read as views of the mapped file.
+    """
+
+    MAGIC = b"PRTL"
+    VERSION = 1
+    HEADER_FORMAT = "<4sHHIQQ4x"
+    ALIGNMENT = 64
+    BLOCK_REF = "$Block"
+
+    def __init__(self, path):
+        self.path = path
+        header_size = struct.calcsize(PortalArchive.HEADER_FORMAT)
+        with open(path, "rb") as file:
+            header = file.read(header_size)
+        if len(header) < header_size:
+            raise ValueError(f"{path} is not a .portal archive.")
+        magic, version, _, self.item_count, index_offset, index_size = struct.unpack(
+            PortalArchive.HEADER_FORMAT, header
+        )
+        if magic != PortalArchive.MAGIC:
+            raise ValueError(f"{path} is not a .portal archive.")
+        if version > PortalArchive.VERSION:
+            raise ValueError(f"Unsupported .portal version {version}.")
+        self.buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        if index_offset < header_size or index_offset + index_size > len(self.buffer):
+            raise ValueError(f"{path} is truncated: index lies outside the file.")
+        index = json.loads(self.buffer[index_offset : index_offset + index_size].tobytes())
+        self.meta, self.item_blocks, self.blocks = self._validate_index(index, len(self.buffer))
+
+    @staticmethod
+    def _validate_index(index, file_size):
+        """Check the index layout so a malformed file fails with ValueError, not KeyError."""
+        if not isinstance(index, dict):
+            raise ValueError("Malformed .portal index: not an object.")
+        missing = {"Meta", "Items", "Blocks"} - index.keys()
+        if missing:
+            raise ValueError(f"Malformed .portal index: missing {', '.join(sorted(missing))}.")
+        blocks = index["Blocks"]
+        if not isinstance(blocks, list):
+            raise ValueError("Malformed .portal index: `Blocks` is not a list.")
+        for block in blocks:
+            if not (isinstance(block, list) and len(block) == 5):
+                raise ValueError(f"Malformed .portal block entry {block!r}.")
+            offset, size = block[0], block[1]
+            if not (isinstance(offset, int) and isinstance(size, int)):
+                raise ValueError(f"Malformed .portal block entry {block!r}.")
+            if offset < 0 or size < 0 or offset + size > file_size:
+                raise ValueError(f"Block at {offset} ({size} bytes) lies outside the file.")
+        items = index["Items"]
+        if not isinstance(items, list) or not all(
+            PortalArchive._is_block_id(block_id, blocks) for block_id in items
+        ):
+            raise ValueError("Malformed .portal index: `Items` must reference blocks.")
+        return index["Meta"], items, blocks
+
+    @staticmethod
+    def _is_block_id(block_id, blocks) -> bool:
+        return isinstance(block_id, int) and 0 <= block_id < len(blocks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.buffer = None  # arrays still referencing the map keep it alive until dropped
+
+    def items(self):
+        """Yield wire-format items one at a time, loading each item's blocks only when reached."""
+        for block in self.item_blocks:
+            yield self._resolve(json.loads(self._read(block)))
+
+    def _read(self, block_id):
+        if not PortalArchive._is_block_id(block_id, self.blocks):
+            raise ValueError(f"Malformed .portal item: no block {block_id!r}.")
+        offset, size, codec, dtype, shape = self.blocks[block_id]
+        data = self.buffer[offset : offset + size]
+        if codec != PCompressionType.NONE.value:
+            data = np.frombuffer(BinaryHandler.decompress(data.tobytes(), codec), dtype=np.uint8)
+        if dtype == "json":
+            return data.tobytes()
+        try:
+            return data.view(np.dtype(dtype)).reshape(shape)
+        except TypeError as e:  # not a dtype string; reshape mismatches already raise ValueError
+            raise ValueError(f"Malformed .portal block {block_id}: {e}") from e
+
+    def _resolve(self, value):
+        """Swap block references back for arrays."""
+        if isinstance(value, dict):
+            if PortalArchive.BLOCK_REF in value:
+                return self._read(value[PortalArchive.BLOCK_REF])
+            return {key: self._resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item) for item in value]
+        return value
+
+    @staticmethod
+    def write(path, payload: Payload, codec="NONE", level=6) -> int:
+        """Write a payload whose items may hold NumPy arrays. Returns the file size in bytes."""
+        compressor = CompressionHandler(codec, level, auto=False)
+        blocks = []
+
+        with open(path + ".tmp", "wb") as file:
+            header_size = struct.calcsize(PortalArchive.HEADER_FORMAT)
+            file.write(b"\0" * header_size)
+
+            def add_block(data: bytes, dtype, shape) -> int:
+                padding = -file.tell() % PortalArchive.ALIGNMENT
+                file.write(b"\0" * padding)
+                stored, block_codec = compressor.compress(data)
+                blocks.append([file.tell(), len(stored), block_codec, dtype, shape])
+                file.write(stored)
+                return len(blocks) - 1
+
+            def extract(value):
+                if isinstance(value, np.ndarray):
+                    array = np.ascontiguousarray(value)
+                    if array.dtype.byteorder == ">":
+                        array = array.astype(array.dtype.newbyteorder("<"))
+                    block = add_block(array.tobytes(), array.dtype.str, list(array.shape))
+                    return {PortalArchive.BLOCK_REF: block}
+                if isinstance(value, dict):
+                    return {key: extract(item) for key, item in value.items()}
+                if isinstance(value, (list, tuple)):
+                    return [extract(item) for item in value]
+                return value
+
+            item_blocks = []
+            for item in payload.items:
+                encoded = json.dumps(extract(item), separators=(",", ":")).encode("utf-8")
+                item_blocks.append(add_block(encoded, "json", None))
+
+            index = json.dumps(
+                {"Meta": payload.meta, "Items": item_blocks, "Blocks": blocks},
+                separators=(",", ":"),
+            ).encode("utf-8")
+            index_offset = file.tell()
+            file.write(index)
+            file.seek(0)
+            file.write(
+                struct.pack(
+                    PortalArchive.HEADER_FORMAT,
+                    PortalArchive.MAGIC,
+                    PortalArchive.VERSION,
+                    0,
+                    len(item_blocks),
+                    index_offset,
+                    len(index),
+                )
+            )
+            size = index_offset + len(index)
+        os.replace(path + ".tmp", path)  # never leave a half-written archive behind
+        return size
@@ -1,7 +1,10 @@
+import bz2
 import gzip
-import io
+import lzma
 import struct
+import zlib
 
+from ..data_struct.p_types import PCompressionType
 from ..data_struct.packet import PacketHeader
 
 
@@ -9,24 +12,141 @@ class BinaryHandler:
     @staticmethod
     def parse_header(data: bytes) -> PacketHeader:
         # see https://docs.python.org/3/library/struct.html#format-characters
-        is_compressed, is_encrypted, checksum, size = struct.unpack(
-            "??Hi", data[: PacketHeader.get_expected_size()]
+        codec, is_encrypted, checksum, size = struct.unpack(
+            "B?Hi", data[: PacketHeader.get_expected_size()]
         )
-        return PacketHeader(is_encrypted, is_compressed, size, checksum)
+        return PacketHeader(is_encrypted, codec != 0, size, checksum, codec)
 
     @staticmethod
-    def decompress(data: bytes) -> bytes:
-        if not data[:2] == b"\x1f\x8b":
-            raise ValueError("Data is not in gzip format.")
-        with gzip.GzipFile(fileobj=io.BytesIO(data)) as gz:
-            try:
-                return gz.read()
-            except OSError:
-                return data
-    
+    def decompress(data: bytes, codec: int = PCompressionType.GZIP.value) -> bytes:
+        codec = PCompressionType(codec)
+        if codec == PCompressionType.NONE:
+            return data
+        if codec == PCompressionType.GZIP:
+            if not data[:2] == b"\x1f\x8b":
+                raise ValueError("Data is not in gzip format.")
+            return gzip.decompress(data)
+        if codec == PCompressionType.ZLIB:
+            return zlib.decompress(data)
+        if codec == PCompressionType.DEFLATE:
+            return zlib.decompress(data, wbits=-zlib.MAX_WBITS)
+        if codec == PCompressionType.LZMA:
+            return lzma.decompress(data)
+        if codec == PCompressionType.BZ2:
+            return bz2.decompress(data)
+        raise ValueError(f"Unsupported compression codec: {codec}")
+
     @staticmethod
-    def compress(data: bytes) -> bytes:
-        with io.BytesIO() as compressed_data:
-            with gzip.GzipFile(fileobj=compressed_data, mode="wb") as gz:
-                gz.write(data)
-            return compressed_data.getvalue()
+    def compress(
+        data: bytes, codec: int = PCompressionType.GZIP.value, level: int = 6
+    ) -> bytes:
+        """Compress data with the given codec. `level` is 1 (fastest) to 9 (smallest)."""
+        codec = PCompressionType(codec)
+        if codec == PCompressionType.NONE:
+            return data
+        if codec == PCompressionType.GZIP:
+            return gzip.compress(data, compresslevel=level, mtime=0)
+        if codec == PCompressionType.ZLIB:
+            return zlib.compress(data, level)
+        if codec == PCompressionType.DEFLATE:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            return compressor.compress(data) + compressor.flush()
+        if codec == PCompressionType.LZMA:
+            return lzma.compress(data, preset=level)
+        if codec == PCompressionType.BZ2:
+            return bz2.compress(data, compresslevel=level)
+        raise ValueError(f"Unsupported compression codec: {codec}")
+
+
+class StreamDecompressor:
+    """
+    Incrementally inflates a compressed payload as its chunks arrive from a socket, pipe or mmap.
+
+    Output is written into one buffer kept across messages; it only grows, on demand, up to
+    `max_size`, and exceeding that raises ValueError instead of exhausting memory. Call `begin()`
+    per message, `feed()` per chunk and `finish()` for the decompressed bytes, copied out of the
+    buffer once so the next message can reuse it.
+    """
+
+    CHUNK_SIZE = 1024 * 1024  # upper bound of a single inflate step
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.peak_bytes = 0  # estimated peak memory of the last message
+        self._buffer = bytearray()
+        self._length = 0
+        self._codec = None
+        self._decompressor = None
+
+    def begin(self, codec: int, compressed_size: int = 0) -> None:
+        self._codec = PCompressionType(codec)
+        if self._codec == PCompressionType.GZIP:
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self._codec == PCompressionType.ZLIB:
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+        elif self._codec == PCompressionType.DEFLATE:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif self._codec == PCompressionType.LZMA:
+            self._decompressor = lzma.LZMADecompressor()
+        elif self._codec == PCompressionType.BZ2:
+            self._decompressor = bz2.BZ2Decompressor()
+        else:
+            raise ValueError(f"Unsupported compression codec for streaming: {self._codec}")
+
+        # JSON typically inflates ~4x; preallocate that much unless the kept buffer already fits
+        expected = min(compressed_size * 4, self.max_size)
+        if expected > len(self._buffer):
+            self._buffer = bytearray(expected)
+        self._length = 0
+        self.peak_bytes = len(self._buffer)
+
+    def feed(self, chunk) -> None:
+        """Inflate one chunk of compressed input (bytes, bytearray or memoryview)."""
+        decompressor = self._decompressor
+        if self._codec in (PCompressionType.LZMA, PCompressionType.BZ2):
+            self._write(decompressor.decompress(chunk, self.CHUNK_SIZE), len(chunk))
+            while not decompressor.eof and not decompressor.needs_input:
+                self._write(decompressor.decompress(b"", self.CHUNK_SIZE), len(chunk))
+        else:
+            self._write(decompressor.decompress(chunk, self.CHUNK_SIZE), len(chunk))
+            while decompressor.unconsumed_tail:
+                tail = decompressor.unconsumed_tail
+                self._write(decompressor.decompress(tail, self.CHUNK_SIZE), len(chunk))
+
+    def finish(self) -> bytes:
+        decompressor = self._decompressor
+        if self._codec not in (PCompressionType.LZMA, PCompressionType.BZ2):
+            self._write(decompressor.flush(), 0)
+        if not decompressor.eof:
+            raise ValueError("Compressed payload is truncated.")
+        self._decompressor = None
+        # The one copy per message: the payload is queued and outlives the buffer's next use
+        with memoryview(self._buffer) as view:
+            payload = bytes(view[: self._length])
+        self.peak_bytes = max(self.peak_bytes, len(self._buffer) + len(payload))
+        return payload
+
+    def decompress_buffer(self, data, codec: int) -> bytes:
+        """Inflate a payload that is already mapped in memory (mmap, WebSocket frame) chunk by chunk."""
+        with memoryview(data) as view:
+            self.begin(codec, len(view))
+            for start in range(0, len(view), self.CHUNK_SIZE):
+                self.feed(view[start : start + self.CHUNK_SIZE])
+        return self.finish()
+
+    def _write(self, data: bytes, input_size: int) -> None:
+        end = self._length + len(data)
+        if end > self.max_size:
+            raise ValueError(
+                f"Decompressed payload exceeds the limit of {self.max_size} bytes."
+            )
+        if end > len(self._buffer):
+            capacity = min(max(end, len(self._buffer) * 2), self.max_size)
+            buffer = bytearray(capacity)
+            buffer[: self._length] = memoryview(self._buffer)[: self._length]
+            self.peak_bytes = max(self.peak_bytes, len(self._buffer) + capacity)
+            self._buffer = buffer
+        self._buffer[self._length : end] = data
+        self._length = end
+        # input chunk + inflate step output + output buffer are alive at the same time
+        self.peak_bytes = max(self.peak_bytes, input_size + len(data) + len(self._buffer))
@@ -0,0 +1,77 @@
+import time
+
+from ..data_struct.p_types import PCompressionType
+from .binary_handler import BinaryHandler
+
+
+class CompressionHandler:
+    """
+    Per-connection compression policy for outgoing payloads.
+
+    With `auto` enabled, payloads below `threshold` bytes are sent as-is, and compression is
+    skipped for a growing number of messages whenever the last attempt did not shrink the payload
+    enough or took longer than sending the saved bytes would have over a link of
+    `link_bytes_per_sec`.
+    """
+
+    # Used when no connection is given; connections set it from their "Link (Mbit/s)" setting
+    DEFAULT_LINK_BYTES_PER_SEC = 100 * 1000 * 1000 // 8  # 100 Mbit/s
+    MIN_RATIO = 0.9  # compressed/original above this is not worth sending compressed
+    MAX_BACKOFF = 64  # messages
+
+    def __init__(
+        self,
+        codec="NONE",
+        level=6,
+        auto=True,
+        threshold=4096,
+        link_bytes_per_sec=DEFAULT_LINK_BYTES_PER_SEC,
+    ):
+        self.codec = PCompressionType[codec]
+        self.level = level
+        self.auto = auto
+        self.threshold = threshold
+        self.link_bytes_per_sec = link_bytes_per_sec
+        self._backoff = 0
+        self._skip = 0
+        self.last_ratio = None
+        self.last_seconds = None
+
+    @staticmethod
+    def from_connection(connection) -> "CompressionHandler":
+        return CompressionHandler(
+            codec=connection.compression_codec,
+            level=connection.compression_level,
+            auto=connection.compression_auto,
+            threshold=connection.compression_threshold * 1024,  # Convert KB to bytes
+            link_bytes_per_sec=connection.link_bandwidth * 1000 * 1000 // 8,  # Mbit/s to bytes
+        )
+
+    def compress(self, data: bytes) -> tuple[bytes, int]:
+        """Return the bytes to send and the codec id to write into the packet header."""
+        if self.codec == PCompressionType.NONE:
+            return data, PCompressionType.NONE.value
+        if self.auto:
+            if len(data) < self.threshold:
+                return data, PCompressionType.NONE.value
+            if self._skip > 0:
+                self._skip -= 1
+                return data, PCompressionType.NONE.value
+
+        start = time.perf_counter()
+        compressed = BinaryHandler.compress(data, self.codec.value, self.level)
+        self.last_seconds = time.perf_counter() - start
+        self.last_ratio = len(compressed) / len(data) if data else 1.0
+
+        if self.auto:
+            saved_seconds = (len(data) - len(compressed)) / self.link_bytes_per_sec
+            if self.last_ratio > self.MIN_RATIO or self.last_seconds > saved_seconds:
+                # Not paying off: back off exponentially before probing again
+                self._backoff = min(max(1, self._backoff * 2), self.MAX_BACKOFF)
+                self._skip = self._backoff
+            else:
+                self._backoff = 0
+
+        if self.last_ratio > self.MIN_RATIO:
+            return data, PCompressionType.NONE.value
+        return compressed, self.codec.value
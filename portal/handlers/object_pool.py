@@ -0,0 +1,73 @@
+import bpy
+
+from ..data_struct.mesh import Mesh
+
+
+class ObjectPool:
+    """
+    Tracks which objects each channel's last message produced and recycles the leftovers.
+
+    Objects no longer produced are unlinked and kept (with their mesh) for reuse by new items, up
+    to `POOL_SIZE` per channel; the rest are deleted together with orphaned meshes in a single
+    `bpy.data.batch_remove` call.
+    """
+
+    POOL_SIZE = 64  # unlinked objects kept per channel
+
+    _produced = {}  # channel name -> set of object names created by the last message
+    _pools = {}  # channel name -> list of unlinked object names ready for reuse
+
+    @staticmethod
+    def acquire(channel_name, object_name, object_type="MESH"):
+        """
+        Make sure `object_name` exists, renaming a pooled object of `object_type` to it if one is
+        available. Pooled objects of other types stay in the pool for items of their own type.
+        """
+        pool = ObjectPool._pools.get(channel_name, [])
+        if bpy.data.objects.get(object_name):
+            if object_name in pool:
+                pool.remove(object_name)  # the same item came back; it is relinked on replace
+            return
+        for index in range(len(pool) - 1, -1, -1):
+            obj = bpy.data.objects.get(pool[index])
+            if obj is None or obj.users_collection:
+                del pool[index]  # deleted or relinked by the user since it was pooled
+                continue
+            if obj.type != object_type:
+                continue
+            del pool[index]
+            obj.name = object_name
+            if Mesh.VERSION_KEY in obj:
+                del obj[Mesh.VERSION_KEY]  # its delta baseline belongs to another item
+            return
+
+    @staticmethod
+    def produced(channel_name) -> set:
+        """Names of the objects the channel's last message produced."""
+        return ObjectPool._produced.get(channel_name, set())
+
+    @staticmethod
+    def reconcile(channel_name, object_names):
+        """Record the objects produced by the latest message and release the ones it dropped."""
+        current = set(object_names)
+        stale = ObjectPool._produced.get(channel_name, set()) - current
+        ObjectPool._produced[channel_name] = current
+        if not stale:
+            return
+
+        pool = ObjectPool._pools.setdefault(channel_name, [])
+        to_remove = []
+        for name in stale:
+            obj = bpy.data.objects.get(name)
+            if not obj:
+                continue
+            if len(pool) < ObjectPool.POOL_SIZE:
+                for collection in obj.users_collection:
+                    collection.objects.unlink(obj)
+                pool.append(obj.name)
+                continue
+            to_remove.append(obj)
+            if obj.type in ("MESH", "CURVE") and obj.data.users == 1:
+                to_remove.append(obj.data)
+        if to_remove:
+            bpy.data.batch_remove(ids=to_remove)
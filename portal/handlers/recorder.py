@@ -0,0 +1,316 @@
+import time
+
+import bpy
+import numpy as np
+
+from ..data_struct.conversion import CoordinateConversion
+from ..data_struct.mesh import Mesh
+
+
+class StreamRecorder:
+    """
+    Buffers what a receiving channel writes into Blender and bakes it to keyframes on stop.
+
+    Handlers call `record()` with the arrays they just decoded: world matrices, light energy and
+    color or camera lens, and optionally mesh vertex positions. Nothing is read back from Blender.
+    Samples go into NumPy buffers shaped (samples, objects, ...) that double when full. A message
+    costs one vectorized row write plus a name-to-column lookup, which is skipped when the names
+    match the previous message. At most one sample is kept per scene frame; later data in the
+    same frame overwrites it. `stop()` writes every F-curve with a single `keyframe_points.add`
+    and `foreach_set("co", ...)`, in each object's own rotation mode. Vertex positions become one
+    shape key per sample, each keyed to full influence on its own frame.
+    """
+
+    INITIAL_SAMPLES = 256
+    OBJECT_TYPES = {"Mesh": ("MESH", "CURVE"), "Light": ("LIGHT",), "Camera": ("CAMERA",)}
+
+    _recordings = {}  # channel name -> StreamRecorder
+
+    def __init__(self, frame_start, fps, object_types=(), shapes=False):
+        self.frame_start = frame_start
+        self.fps = fps
+        self.object_types = object_types  # objects of other types are never keyed
+        self.shapes = shapes
+        self.start_time = time.perf_counter()
+
+        self.names = []  # column -> object name
+        self.columns = {}  # object name -> column
+        self._last_names = None  # names of the previous call and their columns
+        self._last_columns = None
+
+        self.count = 0  # samples in use
+        self.frames = np.empty(self.INITIAL_SAMPLES, dtype=np.int32)
+        self.matrices = None  # (samples, objects, 4, 4) float32
+        self.values = None  # (samples, objects, k) float32: light energy + rgb, camera lens
+        self.valid = None  # (samples, objects) bool: the object was sampled in that frame
+        self.last_values = None  # (objects, k) latest values, for samples without new ones
+        self.shape_samples = {}  # object name -> list of (frame, flat vertex positions)
+        self.last_coords = {}  # object name -> latest positions, patched by deltas
+
+    @staticmethod
+    def is_recording(channel_name) -> bool:
+        return channel_name in StreamRecorder._recordings
+
+    @staticmethod
+    def records_shapes(channel_name) -> bool:
+        recorder = StreamRecorder._recordings.get(channel_name)
+        return recorder is not None and recorder.shapes
+
+    @staticmethod
+    def start(channel_name, scene, data_type, shapes=False):
+        fps = scene.render.fps / scene.render.fps_base
+        object_types = StreamRecorder.OBJECT_TYPES.get(data_type, ())
+        StreamRecorder._recordings[channel_name] = StreamRecorder(
+            scene.frame_current, fps, object_types, shapes
+        )
+
+    @staticmethod
+    def record(channel_name, names, matrices=None, values=None):
+        """
+        Buffer one message: (N, 4, 4) world matrices and optionally (N, k) values for `names`.
+        Values without matrices only update what later samples carry (e.g. a lens between
+        smoothed camera poses).
+        """
+        recorder = StreamRecorder._recordings.get(channel_name)
+        if recorder is None or not len(names):
+            return
+        columns = recorder._columns(names)
+        if values is not None:
+            values = np.asarray(values, dtype=np.float32).reshape(len(names), -1)
+            recorder._ensure_values(values.shape[1])
+            recorder.last_values[columns] = values
+        if matrices is None:
+            return
+        row = recorder._row()
+        recorder.matrices[row, columns] = np.asarray(matrices, dtype=np.float32).reshape(-1, 4, 4)
+        recorder.valid[row, columns] = True
+        if recorder.values is not None:
+            recorder.values[row, columns] = recorder.last_values[columns]
+
+    @staticmethod
+    def record_shape(channel_name, name, coords=None, ranges=None):
+        """Buffer an object's vertex positions, or patch the last ones with delta ranges."""
+        recorder = StreamRecorder._recordings.get(channel_name)
+        if recorder is None or not recorder.shapes:
+            return
+        if coords is not None:
+            coords = np.asarray(coords, dtype=np.float32).ravel()
+        else:
+            previous = recorder.last_coords.get(name)
+            if previous is None:
+                return  # no full frame of this object recorded yet
+            coords = previous.copy()
+            for start, positions in ranges:
+                positions = np.asarray(positions, dtype=np.float32).ravel()
+                coords[start * 3 : start * 3 + len(positions)] = positions
+        recorder.last_coords[name] = coords
+
+        frame = recorder._frame()
+        samples = recorder.shape_samples.setdefault(name, [])
+        if samples and samples[-1][0] == frame:
+            samples[-1] = (frame, coords)  # keep the latest state within a frame
+        else:
+            samples.append((frame, coords))
+
+    @staticmethod
+    def stop(channel_name, scene=None) -> int:
+        """Bake the recording to keyframes. Returns the number of objects animated."""
+        recorder = StreamRecorder._recordings.pop(channel_name, None)
+        if recorder is None:
+            return 0
+        return recorder._bake_all(scene)
+
+    def _frame(self) -> int:
+        return self.frame_start + round((time.perf_counter() - self.start_time) * self.fps)
+
+    def _row(self) -> int:
+        """Row of the current frame, appending (and growing the buffers) on a new frame."""
+        frame = self._frame()
+        if self.count and self.frames[self.count - 1] == frame:
+            return self.count - 1
+        if self.count == len(self.frames):
+            self._grow_samples()
+        self.frames[self.count] = frame
+        self.valid[self.count] = False
+        if self.values is not None:
+            self.values[self.count] = 0
+        self.count += 1
+        return self.count - 1
+
+    def _columns(self, names) -> np.ndarray:
+        if names is self._last_names or names == self._last_names:
+            return self._last_columns
+        columns = np.empty(len(names), dtype=np.int64)
+        for i, name in enumerate(names):
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = len(self.names)
+                self.names.append(name)
+            columns[i] = column
+        if self.matrices is None or len(self.names) > self.matrices.shape[1]:
+            self._grow_objects(len(self.names))
+        self._last_names, self._last_columns = list(names), columns
+        return columns
+
+    def _grow_samples(self):
+        samples = max(len(self.frames) * 2, self.INITIAL_SAMPLES)
+        self.frames = StreamRecorder._resized(self.frames, samples, axis=0)
+        self.matrices = StreamRecorder._resized(self.matrices, samples, axis=0)
+        self.valid = StreamRecorder._resized(self.valid, samples, axis=0)
+        if self.values is not None:
+            self.values = StreamRecorder._resized(self.values, samples, axis=0)
+
+    def _grow_objects(self, needed):
+        capacity = needed if self.matrices is None else max(self.matrices.shape[1] * 2, needed)
+        samples = len(self.frames)
+        if self.matrices is None:
+            self.matrices = np.zeros((samples, capacity, 4, 4), dtype=np.float32)
+            self.valid = np.zeros((samples, capacity), dtype=bool)
+            return
+        self.matrices = StreamRecorder._resized(self.matrices, capacity, axis=1)
+        self.valid = StreamRecorder._resized(self.valid, capacity, axis=1)
+        if self.values is not None:
+            self.values = StreamRecorder._resized(self.values, capacity, axis=1)
+            self.last_values = StreamRecorder._resized(self.last_values, capacity, axis=0)
+
+    def _ensure_values(self, width):
+        if self.values is None:
+            objects = self.matrices.shape[1]
+            self.values = np.zeros((len(self.frames), objects, width), dtype=np.float32)
+            self.last_values = np.zeros((objects, width), dtype=np.float32)
+
+    @staticmethod
+    def _resized(array, size, axis) -> np.ndarray:
+        shape = list(array.shape)
+        shape[axis] = size
+        resized = np.zeros(shape, dtype=array.dtype)
+        index = [slice(None)] * array.ndim
+        index[axis] = slice(0, array.shape[axis])
+        resized[tuple(index)] = array
+        return resized
+
+    def _bake_all(self, scene) -> int:
+        baked = set()
+        last_frame = self.frame_start
+        objects = bpy.data.objects
+        if self.count:
+            frames = self.frames[: self.count].astype(np.float32)
+            valid = self.valid[: self.count]
+            for column, name in enumerate(self.names):
+                obj = objects.get(name)
+                sampled = valid[:, column]
+                if obj is None or obj.type not in self.object_types or not sampled.any():
+                    continue
+                values = self.values[: self.count, column][sampled] if self.values is not None else None
+                self._bake(obj, frames[sampled], self.matrices[: self.count, column][sampled], values)
+                last_frame = max(last_frame, int(frames[sampled][-1]))
+                baked.add(name)
+        for name, samples in self.shape_samples.items():
+            obj = objects.get(name)
+            if obj is None or obj.type != "MESH" or not samples:
+                continue
+            StreamRecorder._bake_shapes(obj, samples)
+            last_frame = max(last_frame, samples[-1][0])
+            baked.add(name)
+        if scene is not None and last_frame > scene.frame_end:
+            scene.frame_end = last_frame
+        return len(baked)
+
+    def _bake(self, obj, frames, matrices, values):
+        location = matrices[:, :3, 3]
+        scale = np.linalg.norm(matrices[:, :3, :3], axis=1)  # column lengths
+        rotation = matrices[:, :3, :3] / np.where(scale > 0, scale, 1)[:, None, :]
+
+        action = StreamRecorder._action(obj, f"{obj.name}_recording")
+        for index in range(3):
+            StreamRecorder._write_fcurve(action, "location", index, frames, location[:, index])
+            StreamRecorder._write_fcurve(action, "scale", index, frames, scale[:, index])
+        # keep the object's rotation mode; cameras stream as quaternions, lights as eulers
+        data_path, rotation = StreamRecorder._rotation_channels(obj.rotation_mode, rotation)
+        for index in range(rotation.shape[1]):
+            StreamRecorder._write_fcurve(action, data_path, index, frames, rotation[:, index])
+
+        if obj.type == "LIGHT" and values is not None and values.shape[1] >= 4:
+            action = StreamRecorder._action(obj.data, f"{obj.data.name}_recording")
+            StreamRecorder._write_fcurve(action, "energy", 0, frames, values[:, 0])
+            for index in range(3):
+                StreamRecorder._write_fcurve(action, "color", index, frames, values[:, index + 1])
+        elif obj.type == "CAMERA" and values is not None and values.shape[1] >= 1:
+            action = StreamRecorder._action(obj.data, f"{obj.data.name}_recording")
+            StreamRecorder._write_fcurve(action, "lens", 0, frames, values[:, 0])
+
+    @staticmethod
+    def _rotation_channels(rotation_mode, rotation):
+        """Data path and per-sample values of (N, 3, 3) rotations in the given rotation mode."""
+        if rotation_mode in ("QUATERNION", "AXIS_ANGLE"):
+            quaternions = CoordinateConversion.to_quaternion(rotation.astype(np.float64))
+            # q and -q are the same rotation; pick the sign closest to the previous sample
+            dots = np.sum(quaternions[1:] * quaternions[:-1], axis=1)
+            signs = np.cumprod(np.concatenate(([1.0], np.where(dots < 0, -1.0, 1.0))))
+            quaternions *= signs[:, None]
+            if rotation_mode == "QUATERNION":
+                return "rotation_quaternion", quaternions
+            sine = np.linalg.norm(quaternions[:, 1:], axis=1)
+            angle = 2 * np.arctan2(sine, quaternions[:, 0])
+            axis = np.divide(
+                quaternions[:, 1:],
+                sine[:, None],
+                out=np.tile((0.0, 1.0, 0.0), (len(sine), 1)),  # Blender's default axis
+                where=sine[:, None] > 1e-9,
+            )
+            return "rotation_axis_angle", np.column_stack((angle, axis))
+        euler = CoordinateConversion.to_euler(rotation.astype(np.float64), rotation_mode)
+        return "rotation_euler", np.unwrap(euler, axis=0)  # no 360 degree flips
+
+    @staticmethod
+    def _bake_shapes(obj, samples):
+        """Turn recorded vertex positions into shape keys, each peaking on its own frame."""
+        mesh = obj.data
+        size = len(mesh.vertices) * 3
+        samples = [(frame, coords) for frame, coords in samples if len(coords) == size]
+        if not samples:
+            return
+        if mesh.users > 1:
+            obj.data = mesh = mesh.copy()  # shape keys would leak into instances
+        if Mesh.HASH_KEY in mesh:
+            del mesh[Mesh.HASH_KEY]  # geometry no longer matches the hashed shape
+        if mesh.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+
+        frames = [frame for frame, _ in samples]
+        action = StreamRecorder._action(mesh.shape_keys, f"{mesh.name}_recording")
+        for i, (frame, coords) in enumerate(samples):
+            block = obj.shape_key_add(name=f"{obj.name}_{frame}", from_mix=False)
+            block.data.foreach_set("co", coords)
+            # 0 on the neighbouring samples, 1 on its own: consecutive keys cross-fade
+            keys = [(frame, 1.0)]
+            if i > 0:
+                keys.insert(0, (frames[i - 1], 0.0))
+            if i < len(samples) - 1:
+                keys.append((frames[i + 1], 0.0))
+            key_frames, key_values = zip(*keys)
+            data_path = f'key_blocks["{block.name}"].value'
+            StreamRecorder._write_fcurve(action, data_path, 0, key_frames, key_values)
+
+    @staticmethod
+    def _action(id_data, name):
+        animation_data = id_data.animation_data or id_data.animation_data_create()
+        if animation_data.action is None:
+            animation_data.action = bpy.data.actions.new(name)
+        return animation_data.action
+
+    @staticmethod
+    def _write_fcurve(action, data_path, index, frames, values):
+        """Append keyframes to an F-curve with one add and one foreach_set."""
+        fcurve = action.fcurves.find(data_path, index=index)
+        if fcurve is None:
+            fcurve = action.fcurves.new(data_path, index=index)
+        points = fcurve.keyframe_points
+        existing = len(points)
+        points.add(len(frames))
+        co = np.empty(len(points) * 2, dtype=np.float32)
+        points.foreach_get("co", co)
+        co[existing * 2 :: 2] = frames
+        co[existing * 2 + 1 :: 2] = values
+        points.foreach_set("co", co)
+        fcurve.update()  # sort and recalculate handles
@@ -1,33 +1,67 @@
 import json
 from typing import Tuple
 
+import bpy
+import numpy as np
+
 from ..data_struct.camera import Camera
-from ..data_struct.light import Light
+from ..data_struct.camera_stream import CameraStream
+from ..data_struct.collection_cache import CollectionCache
+from ..data_struct.conversion import CoordinateConversion
+from ..data_struct.curve import Curve
+from ..data_struct.frame_cache import FrameCache
+from ..data_struct.image import Image
+from ..data_struct.light_batch import LightBatch
 from ..data_struct.material import Material
 from ..data_struct.mesh import Mesh
+from ..data_struct.p_types import PGeoType
+from ..data_struct.point_cloud import PointCloud
+from ..data_struct.transforms import Transforms
 from .custom_handler import CustomHandler
+from .object_pool import ObjectPool
+from .recorder import StreamRecorder
 
 
 class StringHandler:
     @staticmethod
-    def handle_string(payload, data_type, uuid, channel_name, handler_src):
-        """Handle generic string data for different types."""
+    def handle_string(
+        payload,
+        data_type,
+        uuid,
+        channel_name,
+        handler_src,
+        conversion=None,
+        camera_smoothing="NONE",
+    ):
+        """
+        Handle received data for different types.
+
+        `payload` is the bytes-like buffer queued by the listener; json.loads parses it directly,
+        so no intermediate str is built between the socket and the decoder. `conversion` is the
+        connection's CoordinateConversion (None for identity), applied once to decoded arrays
+        before any Blender data is built; custom handlers receive the raw payload. Unless
+        `camera_smoothing` is "NONE", camera poses are buffered and written by `update_camera`.
+        """
         if payload is None:
             return
         try:
             if data_type == "Custom":
                 StringHandler._handle_custom_data(payload, channel_name, uuid, handler_src)
             elif data_type == "Mesh":
-                StringHandler._handle_mesh_data(payload, channel_name)
+                StringHandler._handle_mesh_data(payload, channel_name, conversion)
             elif data_type == "Camera":
-                StringHandler._handle_camera_data(payload)
+                StringHandler._handle_camera_data(
+                    payload, channel_name, conversion, camera_smoothing
+                )
             elif data_type == "Light":
-                StringHandler._handle_light_data(payload)
-        except json.JSONDecodeError:
-            raise ValueError(f"Unsupported data: {payload}")
+                StringHandler._handle_light_data(payload, channel_name, conversion)
+            elif data_type == "Image":
+                StringHandler._handle_image_data(payload, channel_name)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ValueError(f"Unsupported data: {bytes(payload[:256])!r}")
 
     @staticmethod
-    def _handle_light_data(payload):
+    def _handle_light_data(payload, channel_name, conversion=None):
         """Handle light data payload."""
         light_dict = json.loads(payload)
         if not light_dict:
@@ -35,9 +69,22 @@ class StringHandler:
         light_datas = light_dict.get("Lights")
         if not light_datas:
             raise ValueError("Light dict does not contain `Lights` key.")
-        for i, light_data in enumerate(light_datas):
-            light = Light.from_dict(light_data)
-            light.create_or_replace(f"Light_{i}")
+        lights = LightBatch.from_dicts(light_datas, conversion)
+        with CollectionCache.batch():
+            lights.apply(channel_name)
+        if StreamRecorder.is_recording(channel_name):
+            StreamRecorder.record(
+                channel_name,
+                lights.names,
+                lights.world_matrices(),
+                np.column_stack((lights.energies, lights.colors)),
+            )
+
+    @staticmethod
+    def _handle_image_data(payload, channel_name):
+        """Handle binary image payload; pixels go to the image without passing through JSON."""
+        image = Image.from_bytes(payload)
+        image.create_or_replace(image.name or channel_name)
 
     @staticmethod
     def _handle_custom_data(payload, channel_name, uuid, handler_src):
@@ -46,21 +93,96 @@ class StringHandler:
             "MyRecvHandler",
             "https://github.com/sean1832/portal.blender/blob/main/templates/recv_handler.py",
         )
+        # Custom handlers have always received text
+        if not isinstance(payload, str):
+            payload = str(payload, "utf-8")
         handler = custom_handler(payload, channel_name, uuid)
         handler.handle()
 
     @staticmethod
-    def _handle_mesh_data(payload, channel_name):
+    def _handle_mesh_data(payload, channel_name, conversion=None):
         """Handle mesh data payload."""
-        message_dicts, global_metadata = StringHandler.unpack_packet(json.loads(payload))
+        message = json.loads(payload)
+        global_metadata = {}
+        if "Transforms" in message:
+            # Transform-only update: existing objects move, nothing is rebuilt or reconciled
+            StringHandler._handle_transform_data(message["Transforms"], channel_name, conversion)
+        else:
+            message_dicts, global_metadata = StringHandler.unpack_packet(message)
+            StringHandler.handle_items(message_dicts, channel_name, conversion)
+
+        if FrameCache.is_writing(channel_name):
+            frame = global_metadata.get("Frame", bpy.context.scene.frame_current)
+            FrameCache.write(channel_name, frame, ObjectPool.produced(channel_name))
+
+    @staticmethod
+    def handle_items(items, channel_name, conversion=None) -> list[str]:
+        """
+        Build a payload's items, from the wire or from a file. `items` may be a generator, so
+        each item is decoded only when it is built. Returns the object names produced.
+        """
+        with CollectionCache.batch():
+            object_names = StringHandler._build_mesh_items(items, channel_name, conversion)
+        ObjectPool.reconcile(channel_name, object_names)
+        return object_names
+
+    @staticmethod
+    def _handle_transform_data(transform_dict, channel_name, conversion=None):
+        """Apply a batch of world matrices to objects created by earlier messages."""
+        transforms = Transforms.from_dict(transform_dict)
+        if conversion:
+            transforms.matrices = conversion.matrices(transforms.matrices)
+        if transforms.instancer is not None:
+            with CollectionCache.batch():
+                transforms.apply_to_instancer(
+                    StringHandler._object_name(transforms.instancer, channel_name), channel_name
+                )
+            return
+        object_names = [StringHandler._object_name(key, channel_name) for key in transforms.keys]
+        missing = transforms.apply(object_names)
+        StreamRecorder.record(channel_name, object_names, transforms.matrices)
+        if missing:
+            print(f"{missing} transform targets not found on channel {channel_name}.")
+
+    @staticmethod
+    def _build_mesh_items(message_dicts, channel_name, conversion=None) -> list[str]:
+        """Create or update one object per item and return the object names produced."""
+        object_names = []
+        recording = StreamRecorder.is_recording(channel_name)
+        recorded_names, recorded_matrices = [], []
         for i, item in enumerate(message_dicts):
             data, metadata = StringHandler.unpack_packet(item)
-            mesh = Mesh.from_dict(dict=data)
+            object_name = StringHandler._get_object_name(metadata, i, channel_name)
+            object_names.append(object_name)
+            if "Delta" in data:
+                if conversion:
+                    data["Delta"]["Ranges"] = [
+                        [start, conversion.points(values).ravel()]
+                        for start, values in data["Delta"]["Ranges"]
+                    ]
+                if not Mesh.apply_delta(object_name, data["Delta"]):
+                    print(f"Missing baseline for {object_name}; waiting for keyframe.")
+                elif recording:
+                    StreamRecorder.record_shape(
+                        channel_name, object_name, ranges=data["Delta"]["Ranges"]
+                    )
+                continue
+            if data.get("Type") == PGeoType.POINTCLOUD.value:
+                mesh = PointCloud.from_dict(data)
+            elif data.get("Type") == PGeoType.CURVE.value:
+                mesh = Curve.from_dict(data)
+            else:
+                mesh = Mesh.from_dict(dict=data)
+            if conversion:
+                StringHandler._convert_geometry(mesh, conversion)
             try:
                 layer_path, layer_mat = StringHandler._handle_layer(metadata, channel_name)
             except AttributeError:
                 layer_path, layer_mat = channel_name, None
-            mesh.create_or_replace(object_name=f"obj_{i}_{channel_name}", layer_path=layer_path)
+            ObjectPool.acquire(
+                channel_name, object_name, "CURVE" if isinstance(mesh, Curve) else "MESH"
+            )
+            mesh.create_or_replace(object_name=object_name, layer_path=layer_path)
 
             if metadata and metadata.get("Material", None):
                 # if material is string
@@ -71,16 +193,66 @@ class StringHandler:
             elif layer_mat:
                 StringHandler._apply_mesh_material(mesh, layer_mat)
 
+            if recording:
+                if mesh.transform is not None:
+                    recorded_names.append(object_name)
+                    recorded_matrices.append(np.reshape(mesh.transform, (4, 4)))
+                if not isinstance(mesh, Curve):
+                    StreamRecorder.record_shape(channel_name, object_name, coords=mesh.vertices)
+        if recorded_names:
+            StreamRecorder.record(channel_name, recorded_names, recorded_matrices)
+        return object_names
+
     @staticmethod
-    def _handle_camera_data(payload):
+    def _convert_geometry(geometry, conversion: CoordinateConversion):
+        """Convert decoded positions (and any sender transform) before Blender data is built."""
+        if isinstance(geometry, Curve):
+            for spline in geometry.splines:
+                points = spline[1]
+                points[:, :3] = conversion.points(points[:, :3])
+        else:
+            geometry.vertices = conversion.points(geometry.vertices)
+            if isinstance(geometry, PointCloud) and geometry.radii is not None:
+                geometry.radii *= conversion.scale
+        if geometry.transform is not None:
+            matrix = np.reshape(geometry.transform, (1, 4, 4))
+            geometry.transform = conversion.matrices(matrix)[0]
+
+    @staticmethod
+    def _handle_camera_data(payload, channel_name, conversion=None, smoothing="NONE"):
         """Handle camera data payload."""
         camera_data = json.loads(payload)
         if not camera_data:
             raise ValueError("Camera data is empty.")
+        if conversion:
+            camera_data = conversion.convert_dict(
+                camera_data, points=("Position",), vectors=("LookDirection",)
+            )
         cam = Camera.from_dict(camera_data)
-        cam.sync_camera("Camera")
+        if smoothing == "NONE":
+            cam.sync_camera("Camera")
+            StreamRecorder.record(
+                channel_name, ["Camera"], cam.pose_matrix()[None], [[cam.focal_length]]
+            )
+        else:
+            cam.sync_camera("Camera", pose=False)
+            CameraStream.push(
+                channel_name, camera_data.get("Timestamp"), cam.position, cam.look_direction
+            )
+            StreamRecorder.record(channel_name, ["Camera"], values=[[cam.focal_length]])
         cam.set_cliping(near=0.1, far=10000)
 
+    @staticmethod
+    def update_camera(channel_name, delay, extrapolate=False):
+        """Write the buffered camera pose for the current time; called on every timer tick."""
+        pose = CameraStream.sample(channel_name, delay, extrapolate)
+        if pose is None:
+            return
+        cam = Camera()
+        cam.position, cam.look_direction = pose
+        cam.sync_pose("Camera")
+        StreamRecorder.record(channel_name, ["Camera"], cam.pose_matrix()[None])
+
     @staticmethod
     def unpack_packet(packet: str) -> Tuple[str, str]:
         """Unpack a JSON packet into items and metadata."""
@@ -91,9 +263,7 @@ class StringHandler:
 
     @staticmethod
     def _apply_mesh_material(mesh, material_data):
-        material = Material.from_dict(material_data)
-        material.create_or_replace(material_data.get("Name"))
-        mesh.apply_material(material.name)
+        mesh.apply_material(Material.get_or_create(material_data))
 
     @staticmethod
     def _handle_layer(data: dict, channel_name: str) -> None:
@@ -107,6 +277,18 @@ class StringHandler:
         layer_mat = data.get("Layer").get("Material")
         return layer_path, layer_mat
 
+    @staticmethod
+    def _get_object_name(metadata: dict, index: int, channel_name: str) -> str:
+        """Key objects by the sender's stable `Id` when present, otherwise by list position."""
+        item_id = metadata.get("Id") if metadata else None
+        if item_id is None:
+            item_id = index
+        return StringHandler._object_name(item_id, channel_name)
+
+    @staticmethod
+    def _object_name(key, channel_name: str) -> str:
+        return f"obj_{key}_{channel_name}"
+
     @staticmethod
     def _get_name(metadata: str) -> str:
         """Get object name from metadata."""
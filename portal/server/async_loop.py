@@ -0,0 +1,72 @@
+import asyncio
+import concurrent.futures
+import threading
+
+
+class AsyncLoop:
+    """
+    Process-wide asyncio event loop running on a single daemon thread.
+    WebSocket listeners and senders schedule their coroutines here instead of owning a loop each.
+    """
+
+    _loop = None
+    _thread = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_loop() -> asyncio.AbstractEventLoop:
+        """Return the shared loop, starting its thread on first use."""
+        with AsyncLoop._lock:
+            if AsyncLoop._thread is None or not AsyncLoop._thread.is_alive():
+                AsyncLoop._loop = asyncio.new_event_loop()
+                AsyncLoop._thread = threading.Thread(
+                    target=AsyncLoop._run_loop_in_thread,
+                    args=(AsyncLoop._loop,),
+                    name="portal-asyncio",
+                    daemon=True,
+                )
+                AsyncLoop._thread.start()
+            return AsyncLoop._loop
+
+    @staticmethod
+    def _run_loop_in_thread(loop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    @staticmethod
+    def submit(coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the shared loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, AsyncLoop.get_loop())
+
+    @staticmethod
+    def call_soon(callback, *args) -> None:
+        """Schedule a plain callback on the shared loop from any thread."""
+        AsyncLoop.get_loop().call_soon_threadsafe(callback, *args)
+
+
+class LoopQueue:
+    """
+    Queue fed from Blender's main thread and consumed by a coroutine on the shared loop.
+    Exposes the `put` interface of `queue.Queue` so custom send handlers keep working.
+    """
+
+    def __init__(self):
+        self._queue = asyncio.Queue()
+
+    def put(self, item) -> None:
+        AsyncLoop.call_soon(self._queue.put_nowait, item)
+
+    def put_nowait(self, item) -> None:
+        self.put(item)
+
+    async def get(self):
+        return await self._queue.get()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
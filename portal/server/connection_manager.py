@@ -1,57 +1,71 @@
-from .listeners.mmap_server import MMFListenerManager
-from .listeners.pipe_server import PipeListenerManager
-from .listeners.udp_server import UDPListenerManager
-from .listeners.websockets_server import WebSocketListenerManager
-from .senders.mmap_sender import MMFSenderManager
-from .senders.pipe_sender import PipeSenderManager
-from .senders.udp_sender import UDPSenderManager
-from .senders.websockets_sender import WebSocketSenderManager
+import importlib
+
+# Transport modules are resolved lazily so that heavy optional dependencies (aiohttp, pywin32)
+# are only imported once a connection of that type is actually used.
+# (direction, connection_type, variant) -> (module path relative to this package, class name)
+# A variant of None is the default implementation for that connection type.
+TRANSPORT_REGISTRY = {
+    ("RECV", "NAMED_PIPE", None): (".listeners.pipe_server", "PipeListenerManager"),
+    ("RECV", "MMAP", None): (".listeners.mmap_server", "MMFListenerManager"),
+    ("RECV", "WEBSOCKETS", None): (".listeners.websockets_server", "WebSocketListenerManager"),
+    ("RECV", "UDP", None): (".listeners.udp_server", "UDPListenerManager"),
+    ("RECV", "TCP", None): (".listeners.tcp_server", "TCPListenerManager"),
+    ("SEND", "NAMED_PIPE", None): (".senders.pipe_sender", "PipeSenderManager"),
+    ("SEND", "MMAP", None): (".senders.mmap_sender", "MMFSenderManager"),
+    ("SEND", "WEBSOCKETS", None): (".senders.websockets_sender", "WebSocketSenderManager"),
+    ("SEND", "WEBSOCKETS", "BROADCAST"): (
+        ".senders.websockets_broadcaster",
+        "WebSocketBroadcastManager",
+    ),
+    ("SEND", "UDP", None): (".senders.udp_sender", "UDPSenderManager"),
+    ("SEND", "TCP", None): (".senders.tcp_sender", "TCPSenderManager"),
+}
 
 
 class ConnectionManager:
     def __init__(self):
         self.managers = {}
+        self._manager_classes = {}
 
-    def get(self, connection_type, uuid, direction):
+    def _resolve_manager_class(self, connection_type, direction, variant=None):
+        """
+        Import the transport module for the given connection type on first use and cache the manager class.
+        Falls back to the default implementation when the type has no dedicated class for the variant.
+        """
+        direction = "SEND" if direction == "SEND" else "RECV"
+        key = (direction, connection_type, variant)
+        if key not in TRANSPORT_REGISTRY:
+            key = (direction, connection_type, None)
+        if key not in self._manager_classes:
+            if key not in TRANSPORT_REGISTRY:
+                raise ValueError(f"Unknown connection type: {connection_type}")
+            module_path, class_name = TRANSPORT_REGISTRY[key]
+            module = importlib.import_module(module_path, package=__package__)
+            self._manager_classes[key] = getattr(module, class_name)
+        return self._manager_classes[key]
+
+    def get(self, connection_type, uuid, direction, variant=None):
         """
         Retrieves or creates a new server manager instance for the given connection type and uuid.
-        If a different connection type was previously used, it removes the old one and creates a new instance.
+        If a different connection type (or variant, e.g. send mode) was previously used,
+        it removes the old one and creates a new instance.
         """
+        manager_type = (connection_type, variant)
 
         # Check if the server manager already exists for this uuid
         if uuid in self.managers:
             existing_manager, existing_type = self.managers[uuid]
 
             # If the existing server manager is of a different type, remove it and create a new one
-            if existing_type != connection_type:
+            if existing_type != manager_type:
                 existing_manager.stop_server()  # Stop the current server if running
                 self.remove(uuid)  # Remove the current manager from the dictionary
 
         # If no server manager exists for this uuid or it was removed, create a new one
         if uuid not in self.managers:
-            # Create a new server manager based on the connection type
-            if direction == "SEND":
-                if connection_type == "NAMED_PIPE":
-                    manager = PipeSenderManager(uuid)
-                elif connection_type == "MMAP":
-                    manager = MMFSenderManager(uuid)
-                elif connection_type == "WEBSOCKETS":
-                    manager = WebSocketSenderManager(uuid)
-                elif connection_type == "UDP":
-                    manager = UDPSenderManager(uuid)
-            else:
-                if connection_type == "NAMED_PIPE":
-                    manager = PipeListenerManager(uuid)
-                elif connection_type == "MMAP":
-                    manager = MMFListenerManager(uuid)
-                elif connection_type == "WEBSOCKETS":
-                    manager = WebSocketListenerManager(uuid)
-                elif connection_type == "UDP":
-                    manager = UDPListenerManager(uuid)
-                else:
-                    raise ValueError(f"Unknown connection type: {connection_type}")
-
-            self.managers[uuid] = (manager, connection_type)
+            manager_class = self._resolve_manager_class(connection_type, direction, variant)
+            manager = manager_class(uuid)
+            self.managers[uuid] = (manager, manager_type)
 
         return self.managers[uuid][0]  # Return the manager instance
 
@@ -7,7 +7,7 @@ import traceback
 import bpy  # type: ignore
 
 from ...data_struct.packet import Packet, PacketHeader
-from ...handlers.binary_handler import BinaryHandler
+from ...handlers.binary_handler import BinaryHandler, StreamDecompressor
 
 
 class MMFListenerManager:
@@ -21,6 +21,7 @@ class MMFListenerManager:
         self.shutdown_event = threading.Event()
         self._server_thread = None
         self._last_checksum = None
+        self._decompressor = StreamDecompressor(self.connection.max_payload_size * 1024 * 1024)
         self.mmf = None
         self.error = None
         self.traceback = None
@@ -39,19 +40,25 @@ class MMFListenerManager:
                     # Only process data if checksum is different from the last one
                     if checksum != self._last_checksum:
                         print(
-                            f"isCompressed: {header.IsCompressed}, isEncrypted: {header.IsEncrypted}, checksum: {checksum}, size: {header.Size}"
+                            f"isCompressed: {header.IsCompressed}, codec: {header.Codec}, isEncrypted: {header.IsEncrypted}, checksum: {checksum}, size: {header.Size}"
                         )
                         self._last_checksum = checksum
-                        data = self.mmf.read(header.Size)
                         if header.IsCompressed:
-                            data = BinaryHandler.decompress(data)
+                            # Inflate straight from the mapped region without copying it out first
+                            offset = self.mmf.tell()
+                            with memoryview(self.mmf) as mapped:
+                                data = self._decompressor.decompress_buffer(
+                                    mapped[offset : offset + header.Size], header.Codec
+                                )
+                            print(
+                                f"Decompressed {header.Size} -> {len(data)} bytes, peak {self._decompressor.peak_bytes} bytes"
+                            )
+                        else:
+                            data = self.mmf.read(header.Size)
                         if header.IsEncrypted:
                             raise NotImplementedError("Encrypted data is not supported.")
-                        try:
-                            decoded_data = data.decode("utf-8")
-                        except UnicodeDecodeError:
-                            raise ValueError("Received data cannot be decoded as UTF-8.")
-                        self.data_queue.put(decoded_data)
+                        # One copy out of the mapping (or out of the inflate buffer); queued as bytes
+                        self.data_queue.put(data)
                     time.sleep(self.connection.event_timer)
                 else:
                     raise ValueError(
@@ -5,7 +5,7 @@ import traceback
 import bpy  # type: ignore
 
 from ...data_struct.packet import Packet, PacketHeader
-from ...handlers.binary_handler import BinaryHandler
+from ...handlers.binary_handler import BinaryHandler, StreamDecompressor
 
 # Attempt to import the pywin32 modules safely
 try:
@@ -20,6 +20,8 @@ except ImportError:
 
 
 class PipeListenerManager:
+    CHUNK_SIZE = 256 * 1024  # compressed bytes read per step when streaming decompression
+
     def __init__(self, uuid):
         self.uuid = uuid
         self.connection = next(
@@ -27,6 +29,7 @@ class PipeListenerManager:
             None,
         )
         self.data_queue = queue.Queue()
+        self._decompressor = StreamDecompressor(self.connection.max_payload_size * 1024 * 1024)
         self.shutdown_event = threading.Event()
         self.pipe_handle = None
         self.pipe_event = None
@@ -35,6 +38,23 @@ class PipeListenerManager:
         self.traceback = None
         self.error_lock = threading.Lock()
 
+    def _read_decompressed(self, pipe, header):
+        """Inflate the payload chunk by chunk as it is read from the pipe."""
+        self._decompressor.begin(header.codec, header.size)
+        remaining = header.size
+        while remaining > 0:
+            # ReadFile returns ERROR_MORE_DATA (not an exception) while the message continues
+            chunk = win32file.ReadFile(pipe, min(remaining, self.CHUNK_SIZE), None)[1]
+            if not chunk:
+                raise ValueError("Pipe closed before the full payload was received.")
+            self._decompressor.feed(chunk)
+            remaining -= len(chunk)
+        data = self._decompressor.finish()
+        print(
+            f"Decompressed {header.size} -> {len(data)} bytes, peak {self._decompressor.peak_bytes} bytes"
+        )
+        return data
+
     def _handle_raw_bytes(self, pipe):
         if not PYWIN32_AVAILABLE:
             return
@@ -47,12 +67,14 @@ class PipeListenerManager:
                         1
                     ]
                     header = BinaryHandler.parse_header(header_bytes)
-                    data = win32file.ReadFile(pipe, header.size, None)[1]
                     if header.is_compressed:
-                        data = BinaryHandler.decompress(data)
+                        data = self._read_decompressed(pipe, header)
+                    else:
+                        data = win32file.ReadFile(pipe, header.size, None)[1]
                     if header.is_encrypted:
                         raise NotImplementedError("Encrypted data is not supported.")
-                    self.data_queue.put(data.decode("utf-8"))
+                    # ReadFile's result (or the inflated bytes) is queued as-is, no decode copy
+                    self.data_queue.put(data)
                 except pywintypes.error as e:
                     if e.winerror == 109:  # ERROR_BROKEN_PIPE
                         break
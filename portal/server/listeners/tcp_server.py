@@ -0,0 +1,166 @@
+import queue
+import socket
+import threading
+import traceback
+
+import bpy  # type: ignore
+
+from ...data_struct.packet import Packet, PacketHeader
+from ...handlers.binary_handler import BinaryHandler, StreamDecompressor
+
+
+class TCPListenerManager:
+    CHUNK_SIZE = 256 * 1024  # compressed bytes read per step when streaming decompression
+
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.connection = next(
+            (conn for conn in bpy.context.scene.portal_connections if conn.uuid == self.uuid),
+            None,
+        )
+        self.data_queue = queue.Queue()
+        self.shutdown_event = threading.Event()
+        self._server_thread = None
+        self._sock = None
+        self._client = None
+        self._buffer = bytearray(64 * 1024)  # grown on demand, reused across messages
+        self._decompressor = StreamDecompressor(self.connection.max_payload_size * 1024 * 1024)
+        self.error = None
+        self.traceback = None
+        self.error_lock = threading.Lock()
+
+    def _recv_exact(self, conn, size, out=None) -> memoryview | None:
+        """Read exactly `size` bytes into `out` or the reusable buffer. Returns None if the peer closed."""
+        if out is None:
+            if size > len(self._buffer):
+                self._buffer = bytearray(size)
+            out = self._buffer
+        view = memoryview(out)[:size]
+        received = 0
+        while received < size:
+            if self.shutdown_event.is_set():
+                return None
+            try:
+                n = conn.recv_into(view[received:], size - received)
+            except socket.timeout:
+                continue
+            if n == 0:
+                return None
+            received += n
+        return view
+
+    def _recv_payload(self, conn, header) -> bytearray | None:
+        """Receive an uncompressed payload straight into a buffer the consumer takes ownership of."""
+        payload = bytearray(header.size)
+        if self._recv_exact(conn, header.size, payload) is None:
+            return None
+        return payload
+
+    def _recv_decompressed(self, conn, header) -> bytes | None:
+        """Inflate the payload while it arrives so the compressed bytes are never held in full."""
+        self._decompressor.begin(header.codec, header.size)
+        remaining = header.size
+        while remaining > 0:
+            chunk = self._recv_exact(conn, min(remaining, self.CHUNK_SIZE))
+            if chunk is None:
+                return None
+            self._decompressor.feed(chunk)
+            remaining -= len(chunk)
+        payload = self._decompressor.finish()
+        print(
+            f"Decompressed {header.size} -> {len(payload)} bytes, peak {self._decompressor.peak_bytes} bytes"
+        )
+        return payload
+
+    def _handle_client(self, conn, addr):
+        """Serve one client until it disconnects; its errors close only its own socket."""
+        buffer_size = self.connection.socket_buffer_size * 1024  # Convert KB to bytes
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
+            conn.settimeout(1)
+            self._receive_packets(conn)
+        except (ConnectionResetError, ConnectionAbortedError):
+            pass  # client went away; wait for it to reconnect
+        except Exception as e:
+            # A malformed packet leaves the stream out of sync: drop this client, keep listening
+            with self.error_lock:
+                self.traceback = traceback.format_exc()
+                self.error = RuntimeError(f"Error handling TCP client {addr}: {e}")
+        finally:
+            self._close_client()
+            print(f"TCP client disconnected: {addr}")
+
+    def _receive_packets(self, conn):
+        prefix_size = len(Packet.MAGIC_NUMBER) + PacketHeader.get_expected_size()
+        while not self.shutdown_event.is_set():
+            prefix = self._recv_exact(conn, prefix_size)
+            if prefix is None:
+                return
+            Packet.validate_magic_number(prefix[:2])
+            header = BinaryHandler.parse_header(prefix[2:])
+            if not 0 <= header.size <= self._decompressor.max_size:
+                # Checked before allocating: the size field comes straight off the wire
+                raise ValueError(
+                    f"Packet size {header.size} is outside the limit of {self._decompressor.max_size} bytes."
+                )
+            if header.is_compressed:
+                payload = self._recv_decompressed(conn, header)
+            else:
+                payload = self._recv_payload(conn, header)
+            if payload is None:
+                return
+            if header.is_encrypted:
+                raise NotImplementedError("Encrypted data is not supported.")
+            # One copy either way: socket -> payload buffer, or inflate buffer -> bytes
+            self.data_queue.put(payload)
+
+    def _run_server(self):
+        try:
+            host = "0.0.0.0" if self.connection.is_external else "localhost"
+            port = self.connection.port
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._sock.bind((host, port))
+            self._sock.listen(1)
+            self._sock.settimeout(1)  # set a timeout to allow graceful shutdown
+
+            while not self.shutdown_event.is_set():
+                try:
+                    self._client, addr = self._sock.accept()
+                except socket.timeout:
+                    continue
+                print(f"TCP client connected: {addr}")
+                self._handle_client(self._client, addr)
+        except Exception as e:
+            with self.error_lock:
+                self.traceback = traceback.format_exc()
+                self.error = RuntimeError(f"Error creating or handling TCP server: {e}")
+        finally:
+            self._close_client()
+            if self._sock:
+                self._sock.close()
+                self._sock = None
+
+    def _close_client(self):
+        if self._client:
+            self._client.close()
+            self._client = None
+
+    def start_server(self):
+        self.shutdown_event.clear()
+        self._server_thread = threading.Thread(target=self._run_server, daemon=True)
+        self._server_thread.start()
+        print(f"TCP server started for connection uuid: {self.uuid}, name: {self.connection.name}")
+
+    def stop_server(self):
+        self.shutdown_event.set()
+        if self._server_thread:
+            self._server_thread.join()
+        print(f"TCP server stopped for connection uuid: {self.uuid}, name: {self.connection.name}")
+
+    def is_running(self):
+        return self._server_thread is not None and self._server_thread.is_alive()
+
+    def is_shutdown(self):
+        return self.shutdown_event.is_set()
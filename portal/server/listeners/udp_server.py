@@ -5,6 +5,7 @@ import traceback
 
 import bpy  # type: ignore
 
+from ...data_struct.packet import Packet
 from ...handlers.binary_handler import BinaryHandler
 
 
@@ -28,13 +29,14 @@ class UDPListenerManager:
             try:
                 # 1500 is the max size of a UDP packet
                 data, addr = self._sock.recvfrom(1500)
-                header = BinaryHandler.parse_header(data)
+                Packet.validate_magic_number(data[:2])
+                header = BinaryHandler.parse_header(data[2:])
                 payload = data[header.get_expected_size() + 2 :]
                 if header.is_compressed:
-                    payload = BinaryHandler.decompress(payload)
+                    payload = BinaryHandler.decompress(payload, header.codec)
                 if header.is_encrypted:
                     raise NotImplementedError("Encrypted data is not supported.")
-                self.data_queue.put(payload.decode("utf-8"))
+                self.data_queue.put(payload)
             except socket.timeout:
                 continue
             except Exception as e:
@@ -46,8 +48,16 @@ class UDPListenerManager:
         try:
             host = "0.0.0.0" if self.connection.is_external else "localhost"
             port = self.connection.port  # use the connection-specific port
+            group = self.connection.multicast_group.strip()
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._sock.bind((host, port))
+            if group:
+                # Subscribe to a broadcasting sender's group; other receivers may share the port
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self._sock.bind(("", port))  # group datagrams are not addressed to a local host
+                membership = socket.inet_aton(group) + socket.inet_aton("0.0.0.0")
+                self._sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+            else:
+                self._sock.bind((host, port))
             self._sock.settimeout(1)  # set a timeout to allow graceful shutdown
 
             self._udp_handler()
@@ -1,7 +1,9 @@
 import asyncio
+import concurrent.futures
 import queue
 import threading
 import traceback
+from urllib.parse import quote
 
 import bpy  # type: ignore
 
@@ -14,7 +16,110 @@ except ImportError:
     DEPENDENCIES_AVAILABLE = False
 
 from ...data_struct.packet import Packet
-from ...handlers.binary_handler import BinaryHandler
+from ...handlers.binary_handler import BinaryHandler, StreamDecompressor
+from ..async_loop import AsyncLoop
+
+
+class SharedWebSocketServer:
+    """
+    One aiohttp server per port shared by every receive and broadcast channel bound to it.
+    Channels register under `/portal/<name>`, with the name percent-encoded in the URL; the root
+    route `/` is kept for existing clients and dispatches to the channel when exactly one is
+    registered on the port.
+    All methods must be called on the shared asyncio loop.
+    """
+
+    ROUTE_PREFIX = "/portal/"
+    LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "::1", "")
+    _servers = {}  # port -> SharedWebSocketServer
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self._handlers = {}  # route name -> coroutine handling a websocket request
+        self._runner = None
+        self._start_task = None
+
+    @staticmethod
+    def get_route(route_name):
+        """URL path of a channel; `/`, `?`, `#` and spaces in the name are percent-encoded."""
+        return f"{SharedWebSocketServer.ROUTE_PREFIX}{quote(route_name, safe='')}"
+
+    @staticmethod
+    def normalize_host(host) -> str:
+        """Spell every loopback address the same way when comparing hosts."""
+        return "127.0.0.1" if host in SharedWebSocketServer.LOOPBACK_HOSTS else host
+
+    @staticmethod
+    async def acquire(host, port) -> "SharedWebSocketServer":
+        """Return the server listening on host:port, starting it if this is the first channel."""
+        key = port  # one socket per port: a second bind on another host would fail anyway
+        server = SharedWebSocketServer._servers.get(key)
+        normalize = SharedWebSocketServer.normalize_host
+        if server is not None and normalize(server.host) != normalize(host):
+            raise ValueError(
+                f"Port {port} is already served on {server.host}; channels sharing a port must "
+                f"use the same external setting (requested {host})"
+            )
+        if server is None:
+            # Register before awaiting so concurrent channels on the same port share one bind
+            server = SharedWebSocketServer(host, port)
+            server._start_task = asyncio.ensure_future(server._start())
+            SharedWebSocketServer._servers[key] = server
+        try:
+            await asyncio.shield(server._start_task)
+        except Exception:
+            if SharedWebSocketServer._servers.get(key) is server:
+                del SharedWebSocketServer._servers[key]
+            raise
+        return server
+
+    def add_route(self, route_name, handler):
+        if route_name in self._handlers:
+            raise ValueError(
+                f"Route '{self.get_route(route_name)}' is already registered on port {self.port}"
+            )
+        self._handlers[route_name] = handler
+
+    async def release(self, route_name):
+        """Unregister a channel and shut the server down once no channels remain."""
+        self._handlers.pop(route_name, None)
+        if not self._handlers:
+            if SharedWebSocketServer._servers.get(self.port) is self:
+                del SharedWebSocketServer._servers[self.port]
+            if self._runner:
+                await self._runner.cleanup()
+                self._runner = None
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_route("GET", "/", self._dispatch_root)
+        # match_info holds the decoded name, so handlers stay keyed by the raw channel name
+        app.router.add_route("GET", f"{self.ROUTE_PREFIX}{{name}}", self._dispatch)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        try:
+            await site.start()
+        except Exception:
+            await self._runner.cleanup()
+            self._runner = None
+            raise
+
+    async def _dispatch(self, request):
+        handler = self._handlers.get(request.match_info["name"])
+        if handler is None:
+            raise web.HTTPNotFound(text=f"No channel registered at {request.path}")
+        return await handler(request)
+
+    async def _dispatch_root(self, request):
+        if len(self._handlers) != 1:
+            raise web.HTTPNotFound(
+                text=f"Multiple channels share this port; connect to {self.ROUTE_PREFIX}<name>"
+            )
+        handler = next(iter(self._handlers.values()))
+        return await handler(request)
 
 
 class WebSocketListenerManager:
@@ -26,11 +131,10 @@ class WebSocketListenerManager:
         )
         self.data_queue = queue.Queue()
         self.shutdown_event = threading.Event()
-        self._server_thread = None
-        self._app = None
-        self._runner = None
-        self._site = None
-        self.loop = None  # asyncio loop reference
+        self._server_future = None
+        self._stop_event = None  # asyncio.Event awaited on the shared loop
+        self._websockets = set()
+        self._decompressor = StreamDecompressor(self.connection.max_payload_size * 1024 * 1024)
         self.error = None
         self.traceback = None
         self.error_lock = threading.Lock()
@@ -41,6 +145,7 @@ class WebSocketListenerManager:
 
         ws = web.WebSocketResponse()
         await ws.prepare(request)
+        self._websockets.add(ws)
 
         try:
             async for msg in ws:
@@ -48,12 +153,15 @@ class WebSocketListenerManager:
                     raw_data = msg.data
                     Packet.validate_magic_number(raw_data[:2])
                     header = BinaryHandler.parse_header(raw_data[2:])
-                    payload = raw_data[header.get_expected_size() + 2 :]
-                    if header.is_compressed:
-                        payload = BinaryHandler.decompress(payload)
+                    payload = memoryview(raw_data)[header.get_expected_size() + 2 :]
                     if header.is_encrypted:
                         raise NotImplementedError("Encrypted data is not supported.")
-                    self.data_queue.put(payload.decode("utf-8"))
+                    if header.is_compressed:
+                        payload = self._decompressor.decompress_buffer(payload, header.codec)
+                    else:
+                        # json.loads does not take memoryviews; this is the single copy per frame
+                        payload = bytes(payload)
+                    self.data_queue.put(payload)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     raise RuntimeError(
                         f"WebSocket connection closed with exception {ws.exception()}"
@@ -65,88 +173,67 @@ class WebSocketListenerManager:
                 self.traceback = traceback.format_exc()
                 self.error = RuntimeError(f"Error handling WebSocket message: {e}")
         finally:
+            self._websockets.discard(ws)
             await ws.close()
         return ws
 
-    async def _run_server(self):
+    async def _run_server(self, host, port, route_name):
         if not DEPENDENCIES_AVAILABLE:
             return
 
+        server = None
         try:
-            self._app = web.Application()
-            route = "/"  # root route
-            self._app.router.add_route("GET", route, self._websocket_handler)
-
-            self._runner = web.AppRunner(self._app)
-            await self._runner.setup()
+            shared_server = await SharedWebSocketServer.acquire(host, port)
+            shared_server.add_route(route_name, self._websocket_handler)
+            server = shared_server  # only release routes this channel actually registered
 
-            host = "0.0.0.0" if self.connection.is_external else "localhost"
-            port = self.connection.port  # port specific to the connection
-            self._site = web.TCPSite(self._runner, host, port)
-            await self._site.start()
-
-            while not self.shutdown_event.is_set():
-                try:
-                    await asyncio.sleep(1)
-                except asyncio.CancelledError:
-                    break  # Properly exit the loop when the task is cancelled
-
-            await self._runner.cleanup()
+            # Sleep until stop_server() sets the event; no periodic wake-ups
+            await self._stop_event.wait()
         except Exception as e:
             with self.error_lock:
                 self.traceback = traceback.format_exc()
                 self.error = RuntimeError(f"Error creating or handling WebSocket server: {e}")
+        finally:
+            await self._shutdown_server(server, route_name)
+
+    async def _shutdown_server(self, server, route_name):
+        # Close this channel's client sockets first so the shared runner does not wait on them
+        for ws in list(self._websockets):
+            await ws.close(code=aiohttp.WSCloseCode.GOING_AWAY)
+        self._websockets.clear()
+        if server:
+            await server.release(route_name)
 
     def start_server(self):
         if not DEPENDENCIES_AVAILABLE:
             return
 
         self.shutdown_event.clear()
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-
-        self._server_thread = threading.Thread(target=self._run_loop_in_thread, daemon=True)
-        self._server_thread.start()
+        self._stop_event = asyncio.Event()
+        # Read connection settings on the main thread; the coroutine runs on the shared loop
+        host = "0.0.0.0" if self.connection.is_external else "localhost"
+        self._server_future = AsyncLoop.submit(
+            self._run_server(host, self.connection.port, self.connection.name)
+        )
 
         print(
             f"WebSocket server started for connection uuid: {self.uuid}, name: {self.connection.name}"
         )
 
-    def _run_loop_in_thread(self):
-        self.loop.run_until_complete(self._run_server())
-        self.loop.run_forever()
-
-    async def shutdown_server(self):
-        if self._runner:
-            # Get the current task (the one running shutdown_server)
-            current_task = asyncio.current_task(loop=self.loop)
-
-            # Cancel all other tasks except the current one
-            tasks = [
-                task
-                for task in asyncio.all_tasks(self.loop)
-                if task is not current_task and not task.done()
-            ]
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Clean up the site and runner
-            await self._runner.cleanup()
-
-        # Stop the loop
-        self.loop.stop()
-
     def stop_server(self):
         if not DEPENDENCIES_AVAILABLE:
             return
 
         self.shutdown_event.set()
-        if self.loop:
-            asyncio.run_coroutine_threadsafe(self.shutdown_server(), self.loop)
+        if self._stop_event:
+            AsyncLoop.call_soon(self._stop_event.set)
 
-        if self._server_thread:
-            self._server_thread.join(1)
+        if self._server_future:
+            try:
+                self._server_future.result(timeout=5)
+            except concurrent.futures.TimeoutError:
+                print("WebSocket server shutdown timed out. Cancelling server task.")
+                self._server_future.cancel()
 
         print(
             f"WebSocket server stopped for connection uuid: {self.uuid}, name: {self.connection.name}"
@@ -156,7 +243,7 @@ class WebSocketListenerManager:
         if not DEPENDENCIES_AVAILABLE:
             return False
 
-        return self._server_thread is not None and self._server_thread.is_alive()
+        return self._server_future is not None and not self._server_future.done()
 
     def is_shutdown(self):
         if not DEPENDENCIES_AVAILABLE:
@@ -5,7 +5,7 @@ import queue
 import bpy  # type: ignore
 
 from ...data_struct.packet import Packet
-from ...handlers.binary_handler import BinaryHandler
+from ...handlers.compression_handler import CompressionHandler
 from ...utils.crypto import Crc16
 
 class MMFSenderManager:
@@ -23,8 +23,9 @@ class MMFSenderManager:
         self.error_lock = threading.Lock()
         self._last_checksum = None
         self.data_queue = queue.Queue()
+        self._compressor = CompressionHandler.from_connection(self.connection)
 
-    def _send_data(self, data: str, is_compressed=False):
+    def _send_data(self, data: str):
         if not self.mmf:
             return
         try:
@@ -35,15 +36,14 @@ class MMFSenderManager:
             if checksum == self._last_checksum:
                 return
 
-            if is_compressed:
-                data_bytes = BinaryHandler.compress(data_bytes)
+            data_bytes, codec = self._compressor.compress(data_bytes)
 
             # Create the packet header
             packet = Packet(
                 data=data_bytes,
                 size=len(data_bytes),
                 checksum=checksum,
-                is_compressed=is_compressed,
+                codec=codec,
                 is_encrypted=False,
             )
 
@@ -6,7 +6,7 @@ import traceback
 import bpy
 
 from ...data_struct.packet import Packet
-from ...handlers.binary_handler import BinaryHandler
+from ...handlers.compression_handler import CompressionHandler
 from ...utils.crypto import Crc16
 
 try:
@@ -33,6 +33,7 @@ class PipeSenderManager:
         self.traceback = None
         self._client_thread = None
         self.data_queue = queue.Queue()
+        self._compressor = CompressionHandler.from_connection(self.connection)
         self._last_checksum = None
         self.pipe_handle = None
 
@@ -83,7 +84,7 @@ class PipeSenderManager:
             while not self.shutdown_event.is_set():
                 try:
                     data = self.data_queue.get(timeout=0.1)
-                    self._send(data, compress=True)
+                    self._send(data)
                     self.data_queue.task_done()
                 except queue.Empty:
                     continue
@@ -95,7 +96,7 @@ class PipeSenderManager:
         finally:
             self._close_handles()
 
-    def _send(self, data: str, compress: bool = False):
+    def _send(self, data: str):
         """Send data to the named pipe."""
         try:
             data_bytes = data.encode("utf-8")
@@ -105,13 +106,12 @@ class PipeSenderManager:
             if self._last_checksum == checksum:
                 return
 
-            if compress:
-                data_bytes = BinaryHandler.compress(data_bytes)
+            data_bytes, codec = self._compressor.compress(data_bytes)
 
             packet = Packet(
                 data_bytes,
                 is_encrypted=False,
-                is_compressed=compress,
+                codec=codec,
                 size=len(data_bytes),
                 checksum=checksum,
             )
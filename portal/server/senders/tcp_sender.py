@@ -0,0 +1,134 @@
+import queue
+import socket
+import threading
+import traceback
+
+import bpy  # type: ignore
+
+from ...data_struct.packet import Packet
+from ...handlers.compression_handler import CompressionHandler
+from ...utils.crypto import Crc16
+
+
+class TCPSenderManager:
+    SEND_TIMEOUT = 5.0  # seconds a stalled receiver may block a write before reconnecting
+
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.connection = next(
+            (conn for conn in bpy.context.scene.portal_connections if conn.uuid == self.uuid),
+            None,
+        )
+        self.shutdown_event = threading.Event()
+        self._server_thread = None
+        self._sock = None
+        self.error = None
+        self.traceback = None
+        self.error_lock = threading.Lock()
+        self.data_queue = queue.Queue()
+        self._compressor = CompressionHandler.from_connection(self.connection)
+        self._last_checksum = None
+
+    def _connect(self):
+        """Connect to the receiver, retrying with backoff until connected or shut down."""
+        host = self.connection.host
+        port = self.connection.port
+        buffer_size = self.connection.socket_buffer_size * 1024  # Convert KB to bytes
+        retry_delay = 0.1
+        while not self.shutdown_event.is_set():
+            try:
+                sock = socket.create_connection((host, port), timeout=2)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size)
+                sock.settimeout(self.SEND_TIMEOUT)
+                self._sock = sock
+                print(f"Connected to TCP receiver at {host}:{port}")
+                return True
+            except OSError:
+                # Receiver not up yet; back off up to one second between attempts
+                self.shutdown_event.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, 1.0)
+        return False
+
+    def _build_packet(self, data: str):
+        data_bytes = data.encode("utf-8")
+        checksum = Crc16().compute_checksum(data_bytes)
+        if checksum == self._last_checksum:
+            return None, checksum
+
+        data_bytes, codec = self._compressor.compress(data_bytes)
+
+        packet = Packet(
+            data=data_bytes,
+            size=len(data_bytes),
+            checksum=checksum,
+            codec=codec,
+            is_encrypted=False,
+        )
+        return packet.serialize(), checksum
+
+    def _send_data(self, data: str):
+        packet_bytes, checksum = self._build_packet(data)
+        if packet_bytes is None:
+            return
+
+        # Resend the same packet after reconnecting if the link dropped mid-write
+        while not self.shutdown_event.is_set():
+            if self._sock is None and not self._connect():
+                return
+            try:
+                self._sock.sendall(packet_bytes)
+                self._last_checksum = checksum
+                return
+            except OSError as e:
+                # Dropped, stalled (timeout) or unreachable peer: all recoverable by reconnecting
+                print(f"TCP connection lost ({e}). Reconnecting...")
+                self._close_socket()
+
+    def _run_sender(self):
+        try:
+            self._connect()
+            while not self.shutdown_event.is_set():
+                try:
+                    data = self.data_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                try:
+                    self._send_data(data)
+                except Exception as e:
+                    # Only this message is lost (e.g. it failed to encode or compress)
+                    with self.error_lock:
+                        self.traceback = traceback.format_exc()
+                        self.error = RuntimeError(f"Error sending TCP packet: {e}")
+        except Exception as e:
+            with self.error_lock:
+                self.traceback = traceback.format_exc()
+                self.error = RuntimeError(f"Error sending TCP packet: {e}")
+        finally:
+            self._close_socket()
+
+    def _close_socket(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    def start_server(self):
+        self.shutdown_event.clear()
+        self._server_thread = threading.Thread(target=self._run_sender, daemon=True)
+        self._server_thread.start()
+        print(f"TCP sender started for connection uuid: {self.uuid}, name: {self.connection.name}")
+
+    def stop_server(self):
+        self.shutdown_event.set()
+        if self._server_thread:
+            # A write in progress gives up after SEND_TIMEOUT; never block Blender longer than that
+            self._server_thread.join(timeout=self.SEND_TIMEOUT + 1)
+            if self._server_thread.is_alive():
+                print("TCP sender shutdown timed out. Leaving the sender thread to exit on its own.")
+        print(f"TCP sender stopped for connection uuid: {self.uuid}, name: {self.connection.name}")
+
+    def is_running(self):
+        return self._server_thread is not None and self._server_thread.is_alive()
+
+    def is_shutdown(self):
+        return self.shutdown_event.is_set()
@@ -5,7 +5,7 @@ import queue
 
 import bpy  # type: ignore
 
-from ...handlers.binary_handler import BinaryHandler
+from ...handlers.compression_handler import CompressionHandler
 from ...data_struct.packet import Packet
 from ...utils.crypto import Crc16
 
@@ -24,9 +24,10 @@ class UDPSenderManager:
         self.traceback = None
         self.error_lock = threading.Lock()
         self.data_queue = queue.Queue()
+        self._compressor = CompressionHandler.from_connection(self.connection)
         self._last_checksum = None
 
-    def _send_data(self, data: str, is_compressed=False):
+    def _send_data(self, data: str):
         try:
             # Resolve the connection address and port
             host = self.connection.host
@@ -34,21 +35,25 @@ class UDPSenderManager:
 
             # Create UDP socket
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            if self.connection.send_mode == "BROADCAST":
+                # host is a multicast group; one datagram reaches every subscribed receiver
+                self._sock.setsockopt(
+                    socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, self.connection.multicast_ttl
+                )
 
             data_bytes = data.encode("utf-8")
             checksum = Crc16().compute_checksum(data_bytes)
             if checksum == self._last_checksum:
                 return
 
-            if is_compressed:
-                data_bytes = BinaryHandler.compress(data_bytes)
+            data_bytes, codec = self._compressor.compress(data_bytes)
 
             # Create the packet header
             packet = Packet(
                 data=data_bytes,
                 size=len(data_bytes),
                 checksum=checksum,
-                is_compressed=is_compressed,
+                codec=codec,
                 is_encrypted=False,
             )
 
@@ -0,0 +1,211 @@
+import asyncio
+import concurrent.futures
+import threading
+import traceback
+
+import bpy  # type: ignore
+
+try:
+    import aiohttp  # type: ignore
+    from aiohttp import web  # type: ignore
+
+    DEPENDENCIES_AVAILABLE = True
+except ImportError:
+    DEPENDENCIES_AVAILABLE = False
+
+from ...data_struct.packet import Packet
+from ...handlers.compression_handler import CompressionHandler
+from ...utils.crypto import Crc16
+from ..async_loop import AsyncLoop, LoopQueue
+from ..listeners.websockets_server import SharedWebSocketServer
+
+_STOP = object()  # sentinel that wakes the broadcast loop on shutdown
+
+
+class WebSocketBroadcastManager:
+    """
+    Hosts a WebSocket endpoint and pushes every payload to all connected subscribers.
+    The endpoint is the `/portal/<name>` route of the port's SharedWebSocketServer, so broadcast
+    and receive channels can share a port.
+    Each payload is serialized once; every subscriber has its own bounded queue that drops
+    the oldest frame when full, so a slow client never stalls the others.
+    """
+
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.connection = next(
+            (conn for conn in bpy.context.scene.portal_connections if conn.uuid == self.uuid),
+            None,
+        )
+        self.shutdown_event = threading.Event()
+        self.error_lock = threading.Lock()
+        self.error = None
+        self.traceback = None
+        self.data_queue = LoopQueue()
+        self._compressor = CompressionHandler.from_connection(self.connection)
+        self._server_future = None
+        self._subscribers = {}  # WebSocketResponse -> asyncio.Queue of serialized frames
+        self._writers = {}  # WebSocketResponse -> task draining its queue, cancelled on stop
+        self._last_checksum = None
+        self._last_frame = None  # replayed to late subscribers
+        self._server = None  # SharedWebSocketServer holding this channel's route
+        self._name = None
+        self._queue_size = 1
+
+    @staticmethod
+    def _offer(frame_queue, frame):
+        """Put a frame on a subscriber queue, dropping the oldest frame if it is full."""
+        if frame_queue.full():
+            try:
+                frame_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        frame_queue.put_nowait(frame)
+
+    def _build_frame(self, data: str):
+        """Serialize a payload into a packet once for all subscribers. Returns None if unchanged."""
+        data_bytes = data.encode("utf-8")
+        checksum = Crc16().compute_checksum(data_bytes)
+        if checksum == self._last_checksum:
+            return None
+
+        data_bytes, codec = self._compressor.compress(data_bytes)
+
+        packet = Packet(
+            data=data_bytes,
+            size=len(data_bytes),
+            checksum=checksum,
+            is_encrypted=False,
+            codec=codec,
+        )
+        self._last_checksum = checksum
+        return packet.serialize()
+
+    async def _subscriber_handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        frame_queue = asyncio.Queue(maxsize=self._queue_size)
+        if self._last_frame is not None:
+            frame_queue.put_nowait(self._last_frame)
+        self._subscribers[ws] = frame_queue
+        print(f"Subscriber connected to broadcast '{self._name}': {request.remote}")
+
+        # Queues may drop frames, so stopping never goes through them: the writer is cancelled
+        reader = asyncio.ensure_future(self._read_until_closed(ws))
+        writer = asyncio.ensure_future(self._write_frames(ws, frame_queue))
+        self._writers[ws] = writer
+        try:
+            await asyncio.wait({reader, writer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            reader.cancel()
+            writer.cancel()
+            self._subscribers.pop(ws, None)
+            self._writers.pop(ws, None)
+            await ws.close()
+            print(f"Subscriber disconnected from broadcast '{self._name}': {request.remote}")
+        return ws
+
+    @staticmethod
+    async def _write_frames(ws, frame_queue):
+        """Send queued frames to one subscriber until it disconnects or the task is cancelled."""
+        try:
+            while True:
+                await ws.send_bytes(await frame_queue.get())
+        except (ConnectionResetError, aiohttp.ClientConnectionError):
+            pass  # subscriber went away; others are unaffected
+
+    @staticmethod
+    async def _read_until_closed(ws):
+        """Consume incoming control frames; returns once the subscriber disconnects."""
+        async for _ in ws:
+            pass  # subscribers are receive-only
+
+    async def _run_server(self, host, port):
+        if not DEPENDENCIES_AVAILABLE:
+            return
+
+        try:
+            shared_server = await SharedWebSocketServer.acquire(host, port)
+            shared_server.add_route(self._name, self._subscriber_handler)
+            self._server = shared_server  # only release routes this channel actually registered
+            print(
+                f"WebSocket broadcast listening on {host}:{port}"
+                f"{SharedWebSocketServer.get_route(self._name)}"
+            )
+
+            while not self.shutdown_event.is_set():
+                data = await self.data_queue.get()
+                if data is _STOP:
+                    break
+                try:
+                    frame = self._build_frame(data)
+                except Exception as e:
+                    with self.error_lock:
+                        self.error = e
+                        self.traceback = traceback.format_exc()
+                    continue
+                if frame is None:
+                    continue
+                self._last_frame = frame
+                for frame_queue in self._subscribers.values():
+                    self._offer(frame_queue, frame)
+        except Exception as e:
+            with self.error_lock:
+                self.error = RuntimeError(f"Error creating or handling WebSocket broadcast: {e}")
+                self.traceback = traceback.format_exc()
+        finally:
+            await self._shutdown_server()
+
+    async def _shutdown_server(self):
+        for writer in list(self._writers.values()):
+            writer.cancel()
+        for ws in list(self._subscribers):
+            await ws.close(code=aiohttp.WSCloseCode.GOING_AWAY)
+        self._subscribers.clear()
+        self._writers.clear()
+        if self._server:
+            await self._server.release(self._name)
+            self._server = None
+
+    def start_server(self):
+        if not DEPENDENCIES_AVAILABLE:
+            print("aiohttp is not available. Cannot start WebSocket broadcast.")
+            return
+
+        self.shutdown_event.clear()
+        # Read connection settings on the main thread; the coroutines run on the shared loop
+        self._name = self.connection.name
+        self._queue_size = self.connection.subscriber_queue_size
+        host = "0.0.0.0" if self.connection.is_external else "localhost"
+        self._server_future = AsyncLoop.submit(self._run_server(host, self.connection.port))
+        print(
+            f"WebSocket broadcast started for connection uuid: {self.uuid}, name: {self.connection.name}"
+        )
+
+    def stop_server(self):
+        if not DEPENDENCIES_AVAILABLE:
+            return
+
+        self.shutdown_event.set()
+        self.data_queue.put(_STOP)
+        if self._server_future:
+            try:
+                self._server_future.result(timeout=5)
+            except concurrent.futures.TimeoutError:
+                print("WebSocket broadcast shutdown timed out. Cancelling server task.")
+                self._server_future.cancel()
+            self._server_future = None
+        print(
+            f"WebSocket broadcast stopped for connection uuid: {self.uuid}, name: {self.connection.name}"
+        )
+
+    def is_running(self):
+        if not DEPENDENCIES_AVAILABLE:
+            return False
+        return self._server_future is not None and not self._server_future.done()
+
+    def is_shutdown(self):
+        if not DEPENDENCIES_AVAILABLE:
+            return True
+        return self.shutdown_event.is_set()
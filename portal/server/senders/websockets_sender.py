@@ -1,7 +1,6 @@
-import asyncio
+import concurrent.futures
 import threading
 import traceback
-import queue
 
 import bpy  # type: ignore
 
@@ -12,8 +11,11 @@ except ImportError:
     DEPENDENCIES_AVAILABLE = False
 
 from ...data_struct.packet import Packet
-from ...handlers.binary_handler import BinaryHandler
+from ...handlers.compression_handler import CompressionHandler
 from ...utils.crypto import Crc16
+from ..async_loop import AsyncLoop, LoopQueue
+
+_STOP = object()  # sentinel that wakes the send loop on shutdown
 
 
 class WebSocketSenderManager:
@@ -27,26 +29,12 @@ class WebSocketSenderManager:
         self.error_lock = threading.Lock()
         self.error = None
         self.traceback = None
-        self._client_thread = None
-        self.data_queue = queue.Queue()
+        self._client_future = None
+        self.data_queue = LoopQueue()
+        self._compressor = CompressionHandler.from_connection(self.connection)
         self._last_checksum = None
         self._session = None
         self._ws = None
-        self.loop = None  # asyncio loop reference
-
-    def _run_loop_in_thread(self):
-        """
-        Initialize and run the asyncio event loop in a separate thread.
-        """
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        # Schedule the send loop as a task
-        self.loop.create_task(self._send_loop())
-        try:
-            self.loop.run_forever()
-        finally:
-            # Close the loop when run_forever is exited
-            self.loop.close()
 
     async def _send_loop(self):
         """
@@ -62,15 +50,12 @@ class WebSocketSenderManager:
                 async with self._session.ws_connect(ws_url) as self._ws:
                     print(f"Connected to WebSocket at {ws_url}")
                     while not self.shutdown_event.is_set():
+                        # Wait for the next payload; stop_server() wakes us with a sentinel
+                        data = await self.data_queue.get()
+                        if data is _STOP:
+                            break
                         try:
-                            # Attempt to get data with a timeout
-                            data = await self.loop.run_in_executor(
-                                None, self.data_queue.get, True, 0.1
-                            )
-                            await self._send_data(data, is_compressed=False)
-                            self.data_queue.task_done()
-                        except queue.Empty:
-                            await asyncio.sleep(0.1)  # Prevent tight loop
+                            await self._send_data(data)
                         except Exception as e:
                             with self.error_lock:
                                 self.error = e
@@ -84,7 +69,7 @@ class WebSocketSenderManager:
         finally:
             await self._shutdown_sender()
 
-    async def _send_data(self, data: str, is_compressed: bool = False):
+    async def _send_data(self, data: str):
         """
         Serialize and send data over the WebSocket connection.
         """
@@ -97,8 +82,7 @@ class WebSocketSenderManager:
                 print("Checksum matches previous data. Skipping send.")
                 return
 
-            if is_compressed:
-                data_bytes = BinaryHandler.compress(data_bytes)
+            data_bytes, codec = self._compressor.compress(data_bytes)
 
             # Create the packet header
             packet = Packet(
@@ -106,7 +90,7 @@ class WebSocketSenderManager:
                 size=len(data_bytes),
                 checksum=checksum,
                 is_encrypted=False,
-                is_compressed=is_compressed,
+                codec=codec,
             )
 
             await self._ws.send_bytes(packet.serialize())
@@ -121,7 +105,7 @@ class WebSocketSenderManager:
 
     async def _shutdown_sender(self):
         """
-        Gracefully shut down the WebSocket connection and the event loop.
+        Gracefully shut down the WebSocket connection and client session.
         """
         try:
             if self._ws:
@@ -136,26 +120,23 @@ class WebSocketSenderManager:
                 self.traceback = traceback.format_exc()
             print(f"Error during shutdown: {e}")
         finally:
-            # Schedule loop.stop() to be called in the event loop's thread
-            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._ws = None
+            self._session = None
 
     def start_server(self):
         """
-        Start the WebSocket sender in a separate thread.
+        Start the WebSocket sender on the shared event loop.
         """
         if not DEPENDENCIES_AVAILABLE:
             print("aiohttp is not available. Cannot start WebSocket sender.")
             return
 
-        if self._client_thread and self._client_thread.is_alive():
+        if self.is_running():
             print("WebSocket sender is already running.")
             return
 
         self.shutdown_event.clear()
-        self._client_thread = threading.Thread(
-            target=self._run_loop_in_thread, daemon=True
-        )
-        self._client_thread.start()
+        self._client_future = AsyncLoop.submit(self._send_loop())
         print(
             f"WebSocket sender started for connection uuid: {self.uuid}, name: {self.connection.name}"
         )
@@ -168,37 +149,27 @@ class WebSocketSenderManager:
             print("aiohttp is not available. WebSocket sender was not started.")
             return
 
-        if not self._client_thread:
+        if not self._client_future:
             print("WebSocket sender was not started.")
             return
 
         self.shutdown_event.set()
-        if self.loop:
-            # Schedule the shutdown coroutine
-            future = asyncio.run_coroutine_threadsafe(
-                self._shutdown_sender(), self.loop
+        self.data_queue.put(_STOP)
+        try:
+            self._client_future.result(timeout=5)  # Wait for shutdown to complete
+            print(
+                f"WebSocket sender stopped for connection uuid: {self.uuid}, name: {self.connection.name}"
             )
-            try:
-                future.result(timeout=5)  # Wait for shutdown to complete
-            except asyncio.TimeoutError:
-                print("Shutdown timed out. Forcing loop stop.")
-                self.loop.call_soon_threadsafe(self.loop.stop)
-
-        if self._client_thread:
-            self._client_thread.join(timeout=5)
-            if self._client_thread.is_alive():
-                print("Client thread is still running after shutdown attempt.")
-            else:
-                print(
-                    f"WebSocket sender stopped for connection uuid: {self.uuid}, name: {self.connection.name}"
-                )
-            self._client_thread = None
+        except concurrent.futures.TimeoutError:
+            print("Shutdown timed out. Cancelling sender task.")
+            self._client_future.cancel()
+        self._client_future = None
 
     def is_running(self):
         """
-        Check if the sender thread is running.
+        Check if the sender task is running.
         """
-        return self._client_thread is not None and self._client_thread.is_alive()
+        return self._client_future is not None and not self._client_future.done()
 
     def is_shutdown(self):
         """
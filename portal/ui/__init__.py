@@ -1,7 +1,11 @@
+from .operators.archive import register as _register_archive
+from .operators.archive import unregister as _unregister_archive
 from .operators.connections import register as _register_connections
 from .operators.connections import unregister as _unregister_connections
 from .operators.dict_editor import register as _register_dict_items
 from .operators.dict_editor import unregister as _unregister_dict_items
+from .operators.frame_cache import register as _register_frame_cache
+from .operators.frame_cache import unregister as _unregister_frame_cache
 from .operators.modal import register as _register_modal
 from .operators.modal import unregister as _unregister_modal
 from .operators.text_editor import register as _register_text_editor
@@ -22,6 +26,8 @@ def register():
     _register_dict_items_properties()
     _register_connection_properties()
     _register_dict_items()
+    _register_frame_cache()
+    _register_archive()
 
 
 def unregister():
@@ -32,3 +38,5 @@ def unregister():
     _unregister_dict_items_properties()
     _unregister_connection_properties()
     _unregister_dict_items()
+    _unregister_frame_cache()
+    _unregister_archive()
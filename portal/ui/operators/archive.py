@@ -0,0 +1,151 @@
+import os
+import time
+
+import bpy
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+
+from ...data_struct.color import Color
+from ...data_struct.material import PTextureType
+from ...data_struct.mesh import Mesh
+from ...data_struct.payload import Payload
+from ...handlers.archive import PortalArchive
+from ...handlers.string_handler import StringHandler
+
+
+class PORTAL_OT_ImportArchive(bpy.types.Operator, ImportHelper):
+    bl_idname = "portal.import_archive"
+    bl_label = "Import Portal Archive"
+    bl_description = "Import meshes from a .portal archive"
+    bl_options = {"REGISTER", "UNDO"}
+
+    filename_ext = ".portal"
+    filter_glob: bpy.props.StringProperty(default="*.portal", options={"HIDDEN"})  # type: ignore
+
+    def execute(self, context):
+        # The file name plays the channel's role: it names the root collection and the objects
+        channel_name = os.path.splitext(os.path.basename(self.filepath))[0]
+        start = time.perf_counter()
+        try:
+            with PortalArchive(self.filepath) as archive:
+                object_names = StringHandler.handle_items(archive.items(), channel_name)
+        except (OSError, ValueError) as e:
+            self.report({"ERROR"}, f"Failed to import {self.filepath}: {e}")
+            return {"CANCELLED"}
+        self.report(
+            {"INFO"},
+            f"Imported {len(object_names)} items in {time.perf_counter() - start:.2f} s.",
+        )
+        return {"FINISHED"}
+
+
+class PORTAL_OT_ExportArchive(bpy.types.Operator, ExportHelper):
+    bl_idname = "portal.export_archive"
+    bl_label = "Export Portal Archive"
+    bl_description = "Export meshes to a .portal archive"
+
+    filename_ext = ".portal"
+    filter_glob: bpy.props.StringProperty(default="*.portal", options={"HIDDEN"})  # type: ignore
+
+    selected_only: bpy.props.BoolProperty(name="Selected Only", default=True)  # type: ignore
+    compression_codec: bpy.props.EnumProperty(
+        name="Compression",
+        description="Codec applied to each block; blocks that do not shrink are stored raw",
+        items=[
+            ("NONE", "None", "Store blocks raw; they are read straight from the mapped file"),
+            ("ZLIB", "Zlib", "Fast, moderate ratio"),
+            ("LZMA", "LZMA", "Slow, best ratio"),
+        ],
+        default="NONE",
+    )  # type: ignore
+    compression_level: bpy.props.IntProperty(name="Level", default=6, min=1, max=9)  # type: ignore
+
+    def execute(self, context):
+        objects = context.selected_objects if self.selected_only else context.scene.objects
+        payload = Payload(meta={"Source": os.path.basename(bpy.data.filepath)})
+        layer_paths = self._layer_paths(context.scene.collection)
+        for obj in objects:
+            if obj.type == "MESH":
+                payload.add_items(Mesh.dict_from_obj(obj, self._item_meta(obj, layer_paths)))
+        if not payload.items:
+            self.report({"WARNING"}, "No mesh objects to export.")
+            return {"CANCELLED"}
+
+        size = PortalArchive.write(
+            self.filepath, payload, self.compression_codec, self.compression_level
+        )
+        self.report(
+            {"INFO"}, f"Exported {len(payload.items)} meshes ({size / 1024 / 1024:.1f} MB)."
+        )
+        return {"FINISHED"}
+
+    @staticmethod
+    def _item_meta(obj, layer_paths) -> dict:
+        """Id, layer and material in the same metadata shape senders use."""
+        meta = {"Id": obj.name, "Name": obj.name}
+        collection = obj.users_collection[0] if obj.users_collection else None
+        if collection in layer_paths:
+            meta["Layer"] = {"FullPath": layer_paths[collection]}
+        material = obj.active_material
+        if material:
+            meta["Material"] = {
+                "Name": material.name,
+                "DiffuseColor": Color.from_normalized_tuple(material.diffuse_color).to_hex("rgb"),
+            }
+            textures = PORTAL_OT_ExportArchive._textures(material)
+            if textures:
+                meta["Material"]["Textures"] = textures
+        return meta
+
+    @staticmethod
+    def _layer_paths(root) -> dict:
+        """`::` separated path of every collection below the scene collection, as senders give."""
+        paths = {}
+        pending = [(child, child.name) for child in root.children]
+        while pending:
+            collection, path = pending.pop()
+            if collection in paths:
+                continue  # linked in several places: keep the first path
+            paths[collection] = path
+            pending.extend((child, f"{path}::{child.name}") for child in collection.children)
+        return paths
+
+    @staticmethod
+    def _textures(material) -> list:
+        """Image files feeding the Principled BSDF base color, the only textures import reads."""
+        if not material.use_nodes or not material.node_tree:
+            return []
+        textures = []
+        for link in material.node_tree.links:
+            image = getattr(link.from_node, "image", None)
+            if (
+                link.to_socket.name == "Base Color"
+                and link.from_node.type == "TEX_IMAGE"
+                and image is not None
+                and image.filepath
+                and not image.packed_file
+            ):
+                textures.append(
+                    {"Type": PTextureType.Diffuse, "Path": bpy.path.abspath(image.filepath)}
+                )
+        return textures
+
+def menu_import(self, context):
+    self.layout.operator(PORTAL_OT_ImportArchive.bl_idname, text="Portal Archive (.portal)")
+
+
+def menu_export(self, context):
+    self.layout.operator(PORTAL_OT_ExportArchive.bl_idname, text="Portal Archive (.portal)")
+
+
+def register():
+    bpy.utils.register_class(PORTAL_OT_ImportArchive)
+    bpy.utils.register_class(PORTAL_OT_ExportArchive)
+    bpy.types.TOPBAR_MT_file_import.append(menu_import)
+    bpy.types.TOPBAR_MT_file_export.append(menu_export)
+
+
+def unregister():
+    bpy.types.TOPBAR_MT_file_import.remove(menu_import)
+    bpy.types.TOPBAR_MT_file_export.remove(menu_export)
+    bpy.utils.unregister_class(PORTAL_OT_ImportArchive)
+    bpy.utils.unregister_class(PORTAL_OT_ExportArchive)
@@ -4,7 +4,7 @@ import bpy
 
 from ..globals import CONNECTION_MANAGER, MODAL_OPERATORS
 from ..properties.connection_properties import PortalConnection
-from ..ui_utils.helper import is_connection_duplicated
+from ..ui_utils.helper import get_transport_variant, is_connection_duplicated
 
 
 # Operator to add new connection
@@ -52,7 +52,10 @@ class PORTAL_OT_RemoveConnection(bpy.types.Operator):
         if connection:
             index = context.scene.portal_connections.find(connection.name)
             server_manager = CONNECTION_MANAGER.get(
-                connection.connection_type, self.uuid, connection.direction
+                connection.connection_type,
+                self.uuid,
+                connection.direction,
+                get_transport_variant(connection),
             )
 
             # Stop the server if it's running
@@ -95,7 +98,10 @@ class PORTAL_OT_ToggleServer(bpy.types.Operator):
             return {"CANCELLED"}
 
         server_manager = CONNECTION_MANAGER.get(
-            connection.connection_type, self.uuid, connection.direction
+            connection.connection_type,
+            self.uuid,
+            connection.direction,
+            get_transport_variant(connection),
         )
 
         if connection.running or (server_manager and server_manager.is_running()):
@@ -0,0 +1,53 @@
+import os
+
+import bpy
+
+from ...data_struct.frame_cache import FrameCache
+
+
+@bpy.app.handlers.persistent
+def play_frame_caches(scene, depsgraph=None):
+    """Show cached frames for every connection in playback mode; no network or JSON involved."""
+    for connection in scene.portal_connections:
+        if connection.cache_mode != "PLAY":
+            continue
+        try:
+            FrameCache.play(connection.name, connection.cache_path, scene.frame_current)
+        except Exception as e:
+            print(f"Error playing frame cache of {connection.name}: {e}")
+
+
+class PORTAL_OT_ClearFrameCache(bpy.types.Operator):
+    bl_idname = "portal.clear_frame_cache"
+    bl_label = "Clear Frame Cache"
+    bl_description = "Delete the cached frames of this connection"
+
+    uuid: bpy.props.StringProperty()  # type: ignore
+
+    def execute(self, context):
+        connection = next(
+            (conn for conn in context.scene.portal_connections if conn.uuid == self.uuid), None
+        )
+        if not connection:
+            self.report({"ERROR"}, "Connection not found.")
+            return {"CANCELLED"}
+        if FrameCache.is_writing(connection.name):
+            self.report({"ERROR"}, "Cache is being written; stop the connection first.")
+            return {"CANCELLED"}
+        FrameCache.clear(connection.name)
+        path = FrameCache.cache_path(connection.cache_path, connection.name)
+        for file_path in (path, path + ".idx"):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        return {"FINISHED"}
+
+
+def register():
+    bpy.utils.register_class(PORTAL_OT_ClearFrameCache)
+    bpy.app.handlers.frame_change_post.append(play_frame_caches)
+
+
+def unregister():
+    bpy.utils.unregister_class(PORTAL_OT_ClearFrameCache)
+    if play_frame_caches in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(play_frame_caches)
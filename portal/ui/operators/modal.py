@@ -4,10 +4,16 @@ import traceback
 
 import bpy
 
+from ...data_struct.camera_stream import CameraStream
+from ...data_struct.conversion import CoordinateConversion
+from ...data_struct.frame_cache import FrameCache
+from ...data_struct.light_batch import LightBatch
+from ...data_struct.mesh_delta import MeshDeltaEncoder
 from ...handlers.custom_handler import CustomHandler
+from ...handlers.recorder import StreamRecorder
 from ...handlers.string_handler import StringHandler
 from ..globals import CONNECTION_MANAGER, MODAL_OPERATORS
-from ..ui_utils.helper import construct_packet_dict
+from ..ui_utils.helper import construct_packet_dict, get_transport_variant
 
 
 class ModalOperator(bpy.types.Operator):
@@ -26,6 +32,7 @@ class ModalOperator(bpy.types.Operator):
         self.connection_pre_save_handler = None
         self.connection_post_save_handler = None
         self.last_update_time = 0  # Track the last update time for the delay
+        self.mesh_encoder = MeshDeltaEncoder()
 
     def modal(self, context, event):
         connection = self._get_connection(context)
@@ -68,6 +75,8 @@ class ModalOperator(bpy.types.Operator):
 
         MODAL_OPERATORS[self.uuid] = self
         self._register_event_handlers(connection)
+        LightBatch.clear(connection.name)
+        CameraStream.clear(connection.name)
 
         if connection.direction == "SEND":
             # send initial data
@@ -85,6 +94,9 @@ class ModalOperator(bpy.types.Operator):
         # Stop the server manager if running
         connection = self._get_connection(context)
         if connection:
+            StreamRecorder.stop(connection.name, context.scene)  # keep what was captured
+            FrameCache.close_writer(connection.name)
+            connection.record = False
             server_manager = self._get_server_manager(connection)
             if server_manager and server_manager.is_running():
                 server_manager.stop_server()
@@ -95,7 +107,11 @@ class ModalOperator(bpy.types.Operator):
 
     def _handle_send_event(self, context, connection, server_manager):
         try:
-            message_to_send = construct_packet_dict(connection.dict_items)
+            message_to_send = construct_packet_dict(
+                connection.dict_items,
+                self.mesh_encoder if connection.use_mesh_delta else None,
+                connection.quantize_precision if connection.use_quantization else None,
+            )
             if not message_to_send or message_to_send == "{}" or message_to_send == "[]":
                 return
             server_manager.data_queue.put(message_to_send)
@@ -109,10 +125,17 @@ class ModalOperator(bpy.types.Operator):
             )
 
     def _handle_recv_event(self, context, connection, server_manager):
+        conversion = CoordinateConversion.from_connection(connection)
+        writing = FrameCache.is_writing(connection.name)
+        if connection.cache_mode == "WRITE" and not writing:
+            FrameCache.open_writer(connection.name, connection.cache_path)
+        elif connection.cache_mode != "WRITE" and writing:
+            FrameCache.close_writer(connection.name)
+        self._handle_recording(context, connection)
         while not server_manager.data_queue.empty():
             try:
                 data = server_manager.data_queue.get_nowait()
-                if not data or data == "{}" or data == "[]":  # Empty data
+                if not data or data in (b"{}", b"[]"):  # Empty data
                     break
                 StringHandler.handle_string(
                     data,
@@ -120,6 +143,8 @@ class ModalOperator(bpy.types.Operator):
                     self.uuid,
                     connection.name,
                     connection.custom_handler,
+                    conversion,
+                    connection.camera_smoothing,
                 )
             except queue.Empty:
                 break
@@ -131,6 +156,22 @@ class ModalOperator(bpy.types.Operator):
                     connection,
                     traceback=traceback.format_exc(),
                 )
+        if connection.data_type == "Camera" and connection.camera_smoothing != "NONE":
+            StringHandler.update_camera(
+                connection.name,
+                connection.camera_delay,
+                connection.camera_smoothing == "EXTRAPOLATE",
+            )
+
+    def _handle_recording(self, context, connection):
+        """Start or stop recording before the tick's messages; handlers feed the recorder."""
+        recording = StreamRecorder.is_recording(connection.name)
+        if connection.record and not recording:
+            StreamRecorder.start(
+                connection.name, context.scene, connection.data_type, connection.record_shapes
+            )
+        elif not connection.record and recording:
+            StreamRecorder.stop(connection.name, context.scene)
 
     def _handle_server_errors(self, context, server_manager, connection):
         with server_manager.error_lock:
@@ -182,7 +223,12 @@ class ModalOperator(bpy.types.Operator):
         )
 
     def _get_server_manager(self, connection):
-        return CONNECTION_MANAGER.get(connection.connection_type, self.uuid, connection.direction)
+        return CONNECTION_MANAGER.get(
+            connection.connection_type,
+            self.uuid,
+            connection.direction,
+            get_transport_variant(connection),
+        )
 
     def _is_server_shutdown(self, server_manager):
         if server_manager.is_shutdown():
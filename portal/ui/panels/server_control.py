@@ -1,6 +1,8 @@
 import bpy
 from bpy.types import UILayout
 
+from ...server.listeners.websockets_server import SharedWebSocketServer
+
 
 # Main panel to show connections
 class PORTAL_PT_ServerControl(bpy.types.Panel):
@@ -57,14 +59,40 @@ class PORTAL_PT_ServerControl(bpy.types.Panel):
                     sub_box.prop(connection, "name", text="MMAP Name")
                     sub_box.prop(connection, "buffer_size", text="Buffer Size (KB)")
                 elif connection.connection_type == "WEBSOCKETS":
-                    row = sub_box.row(align=True)
                     if connection.direction == "SEND":
+                        sub_box.row(align=True).prop(connection, "send_mode", expand=True)
+                    row = sub_box.row(align=True)
+                    if connection.direction == "SEND" and connection.send_mode == "BROADCAST":
+                        row.prop(connection, "port", text="Port")
+                        row.prop(connection, "is_external", text="Remote")
+                        sub_box.prop(connection, "subscriber_queue_size")
+                        route = SharedWebSocketServer.get_route(connection.name)
+                        sub_box.label(text=f"Route: {route}", icon="URL")
+                    elif connection.direction == "SEND":
                         row.prop(connection, "host", text="Address")
                         row.prop(connection, "port", text="Port")
                     else:
                         row.prop(connection, "port", text="Port")
                         row.prop(connection, "is_external", text="Remote")
+                        # channels on the same port share one server, routed by name
+                        route = SharedWebSocketServer.get_route(connection.name)
+                        sub_box.label(text=f"Route: {route}", icon="URL")
                 elif connection.connection_type == "UDP":
+                    if connection.direction == "SEND":
+                        sub_box.row(align=True).prop(connection, "send_mode", expand=True)
+                    row = sub_box.row(align=True)
+                    if connection.direction == "SEND" and connection.send_mode == "BROADCAST":
+                        row.prop(connection, "host", text="Group")
+                        row.prop(connection, "port", text="Port")
+                        sub_box.prop(connection, "multicast_ttl")
+                    elif connection.direction == "SEND":
+                        row.prop(connection, "host", text="Address")
+                        row.prop(connection, "port", text="Port")
+                    else:
+                        row.prop(connection, "port", text="Port")
+                        row.prop(connection, "is_external", text="Remote")
+                        sub_box.prop(connection, "multicast_group", text="Group")
+                elif connection.connection_type == "TCP":
                     row = sub_box.row(align=True)
                     if connection.direction == "SEND":
                         row.prop(connection, "host", text="Address")
@@ -72,6 +100,7 @@ class PORTAL_PT_ServerControl(bpy.types.Panel):
                     else:
                         row.prop(connection, "port", text="Port")
                         row.prop(connection, "is_external", text="Remote")
+                    sub_box.prop(connection, "socket_buffer_size", text="Socket Buffer (KB)")
 
                 if connection.direction == "RECV":
                     sub_box.prop(connection, "data_type", text="Data Type")
@@ -80,13 +109,34 @@ class PORTAL_PT_ServerControl(bpy.types.Panel):
 
                     sub_box.separator()
                     sub_box.prop(connection, "event_timer")
+                    sub_box.prop(connection, "max_payload_size")
+                    if connection.data_type != "Custom":
+                        self._draw_conversion(sub_box, connection)
+                    if connection.data_type in ("Mesh", "Light", "Camera"):
+                        row = sub_box.row(align=True)
+                        row.prop(connection, "record", toggle=True, icon="REC")
+                        if connection.data_type == "Mesh":
+                            row.prop(connection, "record_shapes", toggle=True)
+                    if connection.data_type == "Mesh":
+                        self._draw_frame_cache(sub_box, connection)
+                    if connection.data_type == "Camera":
+                        row = sub_box.row(align=True)
+                        row.prop(connection, "camera_smoothing", text="")
+                        if connection.camera_smoothing != "NONE":
+                            row.prop(connection, "camera_delay")
                 else:
+                    self._draw_compression(sub_box, connection)
                     sub_box.separator()
                     sub_box.prop(connection, "event_types", text="Trigger Event")
                     if connection.event_types == "CUSTOM":
                         self._draw_custom_handler(sub_box, connection)
                     if not connection.event_types == "CUSTOM":
                         sub_box.prop(connection, "event_timer", text="Interval (sec)")
+                        sub_box.prop(connection, "use_mesh_delta")
+                        row = sub_box.row(align=True)
+                        row.prop(connection, "use_quantization", toggle=True)
+                        if connection.use_quantization:
+                            row.prop(connection, "quantize_precision")
                         sub_box.separator()
                         sub_box.operator(
                             "portal.dict_item_editor", text="Data Editor", icon="MODIFIER_DATA"
@@ -94,6 +144,35 @@ class PORTAL_PT_ServerControl(bpy.types.Panel):
 
         layout.operator("portal.add_connection", text="Add New Connection", icon="ADD")
 
+    def _draw_frame_cache(self, box: UILayout, connection):
+        box.row(align=True).prop(connection, "cache_mode", expand=True)
+        if connection.cache_mode != "OFF":
+            row = box.row(align=True)
+            row.prop(connection, "cache_path", text="")
+            row.operator(
+                "portal.clear_frame_cache", text="", icon="TRASH"
+            ).uuid = connection.uuid
+
+    def _draw_conversion(self, box: UILayout, connection):
+        box.separator()
+        row = box.row(align=True)
+        row.prop(connection, "up_axis", text="")
+        row.prop(connection, "source_unit", text="")
+        box.prop(connection, "origin_offset")
+
+    def _draw_compression(self, box: UILayout, connection):
+        box.separator()
+        row = box.row(align=True)
+        row.prop(connection, "compression_codec")
+        if connection.compression_codec == "NONE":
+            return
+        row.prop(connection, "compression_auto", toggle=True)
+        row = box.row(align=True)
+        row.prop(connection, "compression_level")
+        if connection.compression_auto:
+            row.prop(connection, "compression_threshold")
+            box.prop(connection, "link_bandwidth")
+
     def _draw_custom_handler(self, box: UILayout, connection):
         # Handler with prop_search and file browser icon in a compact row
         row = box.row(align=True)
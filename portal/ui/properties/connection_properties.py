@@ -18,6 +18,7 @@ class PortalConnection(bpy.types.PropertyGroup):
             ("MMAP", "Memory Mapped File", "Local memory-mapped file"),
             ("WEBSOCKETS", "WebSockets", "Local / Remote WebSockets"),
             ("UDP", "UDP", "Local / Remote UDP"),
+            ("TCP", "TCP", "Local / Remote TCP stream"),
         ],
         default="NAMED_PIPE",
     )
@@ -26,12 +27,25 @@ class PortalConnection(bpy.types.PropertyGroup):
     port: bpy.props.IntProperty(name="Port", default=6000)
     is_external: bpy.props.BoolProperty(name="Listen Remote", default=False)
     buffer_size: bpy.props.IntProperty(name="Buffer Size (KB)", default=1024)
+    socket_buffer_size: bpy.props.IntProperty(
+        name="Socket Buffer (KB)",
+        description="Kernel send/receive buffer size for TCP connections",
+        default=1024,
+        min=4,
+    )
+    max_payload_size: bpy.props.IntProperty(
+        name="Max Payload (MB)",
+        description="Largest decompressed payload accepted on receive",
+        default=1024,
+        min=1,
+    )
     data_type: bpy.props.EnumProperty(
         name="Data Type",
         items=[
             ("Mesh", "Mesh", "Receive data as mesh"),
             ("Camera", "Camera", "Receive data as camera"),
             ("Light", "Light", "Receive data as light"),
+            ("Image", "Image", "Receive raw pixels into an image"),
             ("Custom", "Custom", "Handle data with custom handler"),
         ],
         default="Mesh",
@@ -50,6 +64,161 @@ class PortalConnection(bpy.types.PropertyGroup):
         ],
         default="RECV",
     )
+    send_mode: bpy.props.EnumProperty(
+        name="Send Mode",
+        description="Choose how data is delivered to receivers",
+        items=[
+            ("CLIENT", "Client", "Connect to a single remote receiver"),
+            ("BROADCAST", "Broadcast", "Host an endpoint and push data to every subscriber"),
+        ],
+        default="CLIENT",
+    )
+    subscriber_queue_size: bpy.props.IntProperty(
+        name="Subscriber Queue",
+        description="Frames buffered per subscriber before the oldest is dropped",
+        default=4,
+        min=1,
+        max=256,
+    )
+    multicast_group: bpy.props.StringProperty(
+        name="Multicast Group",
+        description="Group a UDP receiver joins to get a broadcasting sender's datagrams "
+        "(e.g. 239.0.0.1); leave empty to receive datagrams sent to this machine",
+        default="",
+    )
+    multicast_ttl: bpy.props.IntProperty(
+        name="Multicast TTL",
+        description="Number of router hops a multicast datagram may cross (1 = local network)",
+        default=1,
+        min=0,
+        max=255,
+    )
+    compression_codec: bpy.props.EnumProperty(
+        name="Compression",
+        description="Codec used to compress outgoing payloads",
+        items=[
+            ("NONE", "None", "Send payloads uncompressed"),
+            ("GZIP", "Gzip", "Gzip (compatible with older receivers)"),
+            ("ZLIB", "Zlib", "Zlib stream"),
+            ("DEFLATE", "Deflate", "Raw deflate stream without header"),
+            ("LZMA", "LZMA", "LZMA / xz (small output, slow)"),
+            ("BZ2", "Bzip2", "Bzip2"),
+        ],
+        default="GZIP",
+    )
+    compression_level: bpy.props.IntProperty(
+        name="Level",
+        description="Compression level, 1 (fastest) to 9 (smallest)",
+        default=1,
+        min=1,
+        max=9,
+    )
+    compression_auto: bpy.props.BoolProperty(
+        name="Auto",
+        description="Only compress payloads above the threshold, and back off when compression does not pay off",
+        default=True,
+    )
+    compression_threshold: bpy.props.IntProperty(
+        name="Threshold (KB)",
+        description="Payloads smaller than this are sent uncompressed in auto mode",
+        default=4,
+        min=0,
+    )
+    link_bandwidth: bpy.props.IntProperty(
+        name="Link (Mbit/s)",
+        description="Bandwidth of the link to the receiver; auto mode compresses when the time saved sending fewer bytes over it exceeds the compression time",
+        default=100,
+        min=1,
+    )
+    use_mesh_delta: bpy.props.BoolProperty(
+        name="Mesh Delta",
+        description="Send only moved vertices when a mesh keeps its topology between frames (receiver must support deltas)",
+        default=False,
+    )
+    use_quantization: bpy.props.BoolProperty(
+        name="Quantize",
+        description="Send mesh vertices as fixed-point integers relative to their bounding box (receiver must support quantized meshes)",
+        default=False,
+    )
+    quantize_precision: bpy.props.FloatProperty(
+        name="Precision",
+        description="Largest allowed vertex position error; 16-bit values are used when they meet it, 32-bit otherwise",
+        default=0.0001,
+        min=1e-9,
+        precision=6,
+        unit="LENGTH",
+    )
+    camera_smoothing: bpy.props.EnumProperty(
+        name="Smoothing",
+        description="How camera poses are applied",
+        items=[
+            ("NONE", "None", "Apply every pose as it arrives"),
+            ("INTERPOLATE", "Interpolate", "Play poses slightly delayed, interpolating between samples"),
+            ("EXTRAPOLATE", "Extrapolate", "Interpolate, and predict ahead when packets are late"),
+        ],
+        default="NONE",
+    )
+    camera_delay: bpy.props.FloatProperty(
+        name="Delay (sec)",
+        description="How far playback trails the newest camera sample; cover the packet interval plus jitter",
+        default=0.03,
+        min=0.0,
+        max=1.0,
+        precision=3,
+    )
+    record: bpy.props.BoolProperty(
+        name="Record",
+        description="Record received objects; keyframes are written when recording stops",
+        default=False,
+    )
+    record_shapes: bpy.props.BoolProperty(
+        name="Shapes",
+        description="Also record received mesh vertex positions as shape keys",
+        default=False,
+    )
+    cache_mode: bpy.props.EnumProperty(
+        name="Frame Cache",
+        description="Store received meshes per frame on disk, or play them back on frame change",
+        items=[
+            ("OFF", "Off", "Do not use a frame cache"),
+            ("WRITE", "Write", "Store every received mesh message under the current (or sent) frame"),
+            ("PLAY", "Play", "Load cached meshes on frame change, without a sender"),
+        ],
+        default="OFF",
+    )
+    cache_path: bpy.props.StringProperty(
+        name="Cache Folder",
+        description="Folder holding the <connection>.pcache files",
+        default="//portal_cache/",
+        subtype="DIR_PATH",
+    )
+    source_unit: bpy.props.EnumProperty(
+        name="Unit",
+        description="Length unit of incoming geometry",
+        items=[
+            ("METERS", "Meters", ""),
+            ("CENTIMETERS", "Centimeters", ""),
+            ("MILLIMETERS", "Millimeters", ""),
+            ("INCHES", "Inches", ""),
+            ("FEET", "Feet", ""),
+        ],
+        default="METERS",
+    )
+    up_axis: bpy.props.EnumProperty(
+        name="Up Axis",
+        description="Up axis of the sender's coordinate system",
+        items=[
+            ("Z_UP", "Z Up", "Same axes as Blender"),
+            ("Y_UP", "Y Up", "Y-up sender (Unity, Maya, glTF); Y becomes Z"),
+        ],
+        default="Z_UP",
+    )
+    origin_offset: bpy.props.FloatVectorProperty(
+        name="Origin",
+        description="Point in sender coordinates (sender units) that becomes Blender's origin",
+        size=3,
+        default=(0.0, 0.0, 0.0),
+    )
     send_data: bpy.props.StringProperty(name="Send Data", default="")
     event_types: bpy.props.EnumProperty(
         name="Trigger Event",
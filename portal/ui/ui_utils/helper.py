@@ -13,8 +13,19 @@ def is_connection_duplicated(connections, name_to_check, uuid_to_ignore=None):
     return False
 
 
-def construct_packet_dict(data_items) -> str:
-    """Helper function to construct a dictionary from a collection of dictionary items"""
+def get_transport_variant(connection):
+    """Helper function to get the manager variant (e.g. send mode) for a connection"""
+    if connection.direction == "SEND":
+        return connection.send_mode
+    return None
+
+
+def construct_packet_dict(data_items, mesh_encoder=None, precision=None) -> str:
+    """
+    Helper function to construct a dictionary from a collection of dictionary items.
+    Meshes are delta encoded against the previous frame when `mesh_encoder` is given, and
+    vertices are quantized when `precision` is given.
+    """
     payload = Payload()
     meta = {}
     contains_mesh = False
@@ -33,9 +44,13 @@ def construct_packet_dict(data_items) -> str:
             contains_mesh = True
             scene_obj = item.value_scene_object
             if scene_obj.type == "MESH":
-                payload.add_items(
-                    Mesh.from_obj(scene_obj).to_dict()
-                )
+                mesh = Mesh.from_obj(scene_obj)
+                if mesh_encoder:
+                    payload.add_items(
+                        mesh_encoder.encode(scene_obj.name, mesh, precision=precision)
+                    )
+                else:
+                    payload.add_items(mesh.to_dict(precision=precision))
             elif scene_obj.type == "CAMERA":
                 raise NotImplementedError("Camera object type is not supported yet")
             elif scene_obj.type == "LIGHT":
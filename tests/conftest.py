@@ -0,0 +1,12 @@
+import sys
+import types
+from pathlib import Path
+
+# portal/__init__.py registers the add-on and needs Blender's bpy. Tests only cover modules that
+# run without it, so the package is mounted directly instead of executing that entry point.
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "portal"
+
+if "portal" not in sys.modules:
+    package = types.ModuleType("portal")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["portal"] = package
@@ -0,0 +1,113 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from portal.data_struct.payload import Payload
+from portal.handlers.archive import PortalArchive
+
+
+def mesh_item(name, count):
+    rng = np.random.default_rng(count)
+    return {
+        "Items": {
+            "Type": 1,
+            "Vertices": rng.random((count, 3), dtype=np.float32),
+            "FaceSizes": np.full(count // 3, 3, dtype=np.int32),
+            "FaceIndices": np.arange(count // 3 * 3, dtype=np.int32),
+            "Attributes": {"uv": {"Domain": "CORNER", "Values": rng.random((count, 2))}},
+        },
+        "Meta": {"Id": name, "Layer": {"FullPath": "Site::Walls"}},
+    }
+
+
+def assert_items_equal(expected, actual):
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            assert_items_equal(expected[key], actual[key])
+    elif isinstance(expected, np.ndarray):
+        assert actual.dtype == expected.dtype and actual.shape == expected.shape
+        assert np.array_equal(actual, expected)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize("codec", ["NONE", "ZLIB", "LZMA"])
+def test_round_trip(tmp_path, codec):
+    payload = Payload(meta={"Source": "test.blend"})
+    items = [mesh_item("a", 300), mesh_item("b", 30)]
+    payload.add_items(items)
+    path = str(tmp_path / "scene.portal")
+
+    size = PortalArchive.write(path, payload, codec, level=1)
+    assert size == (tmp_path / "scene.portal").stat().st_size
+    assert not (tmp_path / "scene.portal.tmp").exists()
+
+    with PortalArchive(path) as archive:
+        assert archive.item_count == 2 and archive.meta == payload.meta
+        loaded = list(archive.items())
+    for expected, actual in zip(items, loaded):
+        assert_items_equal(expected, actual)
+
+
+def test_raw_blocks_are_views_of_the_mapped_file(tmp_path):
+    payload = Payload()
+    payload.add_items(mesh_item("a", 300))
+    path = str(tmp_path / "scene.portal")
+    PortalArchive.write(path, payload, "NONE")
+
+    archive = PortalArchive(path)
+    item = next(archive.items())
+    assert np.shares_memory(item["Items"]["Vertices"], archive.buffer)
+    for offset, *_ in archive.blocks:
+        assert offset % PortalArchive.ALIGNMENT == 0
+
+
+def test_foreign_file_is_rejected(tmp_path):
+    path = tmp_path / "other.portal"
+    path.write_bytes(b"NOPE" + bytes(60))
+    with pytest.raises(ValueError):
+        PortalArchive(str(path))
+
+
+def test_short_file_is_rejected(tmp_path):
+    path = tmp_path / "short.portal"
+    path.write_bytes(PortalArchive.MAGIC + bytes(8))
+    with pytest.raises(ValueError):
+        PortalArchive(str(path))
+
+
+def _write_index(path, index):
+    """An archive with the given JSON index and no blocks."""
+    encoded = json.dumps(index).encode("utf-8")
+    header_size = struct.calcsize(PortalArchive.HEADER_FORMAT)
+    header = struct.pack(
+        PortalArchive.HEADER_FORMAT, PortalArchive.MAGIC, 1, 0, 0, header_size, len(encoded)
+    )
+    path.write_bytes(header + encoded)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        [],
+        {"Meta": {}, "Items": []},
+        {"Meta": {}, "Items": [0], "Blocks": []},
+        {"Meta": {}, "Items": [], "Blocks": [[0, 10**6, 0, "json", None]]},
+        {"Meta": {}, "Items": [], "Blocks": [[0, 1]]},
+    ],
+)
+def test_malformed_index_is_rejected(tmp_path, index):
+    with pytest.raises(ValueError):
+        PortalArchive(_write_index(tmp_path / "bad.portal", index))
+
+
+def test_index_outside_file_is_rejected(tmp_path):
+    path = tmp_path / "scene.portal"
+    PortalArchive.write(str(path), Payload(meta={}))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        PortalArchive(str(path))
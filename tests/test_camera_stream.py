@@ -0,0 +1,44 @@
+import pytest
+
+from portal.data_struct import camera_stream
+from portal.data_struct.camera_stream import CameraStream
+
+FORWARD = (0.0, 1.0, 0.0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A controllable local clock in seconds."""
+    now = [50.0]
+    monkeypatch.setattr(camera_stream.time, "perf_counter", lambda: now[0])
+    yield now
+    CameraStream.clear()
+
+
+def push_two_samples(clock):
+    """Two samples sent 100 ms apart that also arrive 100 ms apart."""
+    CameraStream.push("cam", 1000, (0.0, 0.0, 0.0), FORWARD)
+    clock[0] += 0.1
+    CameraStream.push("cam", 1100, (10.0, 0.0, 0.0), FORWARD)
+
+
+def test_timestamps_are_milliseconds(clock):
+    push_two_samples(clock)
+    position, direction = CameraStream.sample("cam", delay=0.025)
+    assert position[0] == pytest.approx(7.5)
+    assert tuple(direction) == pytest.approx(FORWARD)
+
+
+def test_extrapolation_is_capped_in_seconds(clock):
+    push_two_samples(clock)
+    clock[0] += 1.0
+    position, _ = CameraStream.sample("cam", extrapolate=True)
+    assert position[0] == pytest.approx(20.0)
+
+
+def test_missing_timestamp_uses_arrival_time(clock):
+    CameraStream.push("cam", None, (0.0, 0.0, 0.0), FORWARD)
+    clock[0] += 0.1
+    CameraStream.push("cam", None, (10.0, 0.0, 0.0), FORWARD)
+    position, _ = CameraStream.sample("cam", delay=0.05)
+    assert position[0] == pytest.approx(5.0)
@@ -0,0 +1,66 @@
+import os
+import types
+
+from portal.data_struct.p_types import PCompressionType
+from portal.handlers.compression_handler import CompressionHandler
+
+COMPRESSIBLE = b'{"Vertices": [[0.0, 1.0, 2.0]]}' * 4096
+NONE = PCompressionType.NONE.value
+GZIP = PCompressionType.GZIP.value
+
+
+def test_codec_none_never_compresses():
+    data, codec = CompressionHandler("NONE").compress(COMPRESSIBLE)
+    assert codec == NONE and data is COMPRESSIBLE
+
+
+def test_payloads_below_threshold_are_sent_raw():
+    handler = CompressionHandler("GZIP", threshold=len(COMPRESSIBLE) + 1)
+    data, codec = handler.compress(COMPRESSIBLE)
+    assert codec == NONE and data is COMPRESSIBLE
+    assert handler.last_ratio is None  # not even attempted
+
+
+def test_slow_link_compresses_every_message():
+    handler = CompressionHandler("GZIP", level=1, link_bytes_per_sec=1_000_000)
+    for _ in range(5):
+        data, codec = handler.compress(COMPRESSIBLE)
+        assert codec == GZIP and len(data) < len(COMPRESSIBLE)
+
+
+def test_fast_link_backs_off_exponentially():
+    handler = CompressionHandler("GZIP", level=9, link_bytes_per_sec=10**15)
+    codecs = [handler.compress(COMPRESSIBLE)[1] for _ in range(8)]
+    # probe, skip 1, probe, skip 2, probe, skip 4 ...
+    assert codecs[0] == GZIP
+    assert codecs[1:] == [NONE, GZIP, NONE, NONE, GZIP, NONE, NONE]
+
+
+def test_incompressible_data_is_sent_raw_and_backs_off():
+    noise = os.urandom(64 * 1024)
+    handler = CompressionHandler("GZIP", link_bytes_per_sec=1_000)
+    data, codec = handler.compress(noise)
+    assert codec == NONE and data is noise
+    assert handler.last_ratio > CompressionHandler.MIN_RATIO
+    assert handler.compress(noise)[1] == NONE
+    assert handler._skip == 0  # the skipped message consumed the back-off
+
+
+def test_manual_mode_always_compresses_when_it_shrinks():
+    handler = CompressionHandler("ZLIB", auto=False, threshold=10**9, link_bytes_per_sec=10**15)
+    for _ in range(3):
+        assert handler.compress(COMPRESSIBLE)[1] == PCompressionType.ZLIB.value
+
+
+def test_link_setting_is_megabits_per_second():
+    connection = types.SimpleNamespace(
+        compression_codec="GZIP",
+        compression_level=1,
+        compression_auto=True,
+        compression_threshold=4,
+        link_bandwidth=100,
+    )
+    handler = CompressionHandler.from_connection(connection)
+    assert handler.link_bytes_per_sec == 12_500_000
+    assert handler.link_bytes_per_sec == CompressionHandler.DEFAULT_LINK_BYTES_PER_SEC
+    assert handler.threshold == 4096
@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from portal.data_struct.conversion import CoordinateConversion
+
+
+def connection(up_axis="Z_UP", unit="METERS", origin=(0.0, 0.0, 0.0)):
+    return SimpleNamespace(up_axis=up_axis, source_unit=unit, origin_offset=origin)
+
+
+def rotation_z(angle):
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+
+def test_identity_settings_give_no_conversion():
+    assert CoordinateConversion.from_connection(connection()) is None
+
+
+def test_y_up_centimeters_with_origin():
+    conversion = CoordinateConversion.from_connection(
+        connection("Y_UP", "CENTIMETERS", (100.0, 0.0, 0.0))
+    )
+    points = conversion.points([[100.0, 200.0, 300.0], [0.0, 0.0, 0.0]])
+    assert np.allclose(points, [[0.0, -3.0, 2.0], [-1.0, 0.0, 0.0]])
+    # vectors ignore the origin
+    assert np.allclose(conversion.vectors([[0.0, 100.0, 0.0]]), [[0.0, 0.0, 1.0]])
+    assert conversion.scale == pytest.approx(0.01)
+
+
+def test_points_keep_float32():
+    conversion = CoordinateConversion.from_connection(connection(unit="MILLIMETERS"))
+    result = conversion.points(np.ones((4, 3), dtype=np.float32))
+    assert result.dtype == np.float32
+
+
+def test_matrices_commute_with_points():
+    conversion = CoordinateConversion.from_connection(
+        connection("Y_UP", "INCHES", (1.0, 2.0, 3.0))
+    )
+    world = np.eye(4)
+    world[:3, :3] = rotation_z(0.7)
+    world[:3, 3] = (4.0, -2.0, 1.5)
+    local = np.array([[0.5, 1.0, -2.0], [3.0, 0.0, 1.0]])
+
+    transformed = (world @ np.c_[local, np.ones(2)].T).T[:, :3]
+    converted = conversion.matrices(world[None])[0]
+    expected = (converted @ np.c_[conversion.points(local), np.ones(2)].T).T[:, :3]
+    assert np.allclose(conversion.points(transformed), expected)
+    # conjugation keeps a rigid transform rigid
+    assert np.allclose(converted[:3, :3] @ converted[:3, :3].T, np.eye(3))
+
+
+def test_convert_dict_only_touches_named_keys():
+    conversion = CoordinateConversion.from_connection(connection("Y_UP"))
+    data = {"Position": [0.0, 1.0, 0.0], "Direction": [0.0, 0.0, 1.0], "Lens": 50}
+    converted = conversion.convert_dict(data, points=("Position",), vectors=("Direction",))
+    assert np.allclose(converted["Position"], [0.0, 0.0, 1.0])
+    assert np.allclose(converted["Direction"], [0.0, -1.0, 0.0])
+    assert converted["Lens"] == 50 and data["Position"] == [0.0, 1.0, 0.0]
+
+
+def test_to_euler_recovers_xyz_angles():
+    x, y, z = 0.3, -0.4, 1.2
+    cx, sx, cy, sy = np.cos(x), np.sin(x), np.cos(y), np.sin(y)
+    rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    matrix = rotation_z(z) @ ry @ rx
+    assert np.allclose(CoordinateConversion.to_euler(matrix[None])[0], (x, y, z))
+
+
+def _axis_rotation(axis, angle):
+    c, s = np.cos(angle), np.sin(angle)
+    i, j = [k for k in range(3) if k != axis]
+    matrix = np.eye(3)
+    matrix[i, i], matrix[i, j], matrix[j, i], matrix[j, j] = c, -s, s, c
+    if axis == 1:
+        matrix = matrix.T  # rotation about Y runs z -> x
+    return matrix
+
+
+@pytest.mark.parametrize("order", ["XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"])
+def test_to_euler_recovers_every_order(order):
+    angles = np.array([0.3, -0.4, 1.2])
+    matrix = np.eye(3)
+    for letter in order:  # the first axis of the order is applied first
+        axis = "XYZ".index(letter)
+        matrix = _axis_rotation(axis, angles[axis]) @ matrix
+    assert np.allclose(CoordinateConversion.to_euler(matrix[None], order)[0], angles)
+
+
+def test_to_quaternion_matches_rotation():
+    angles = np.linspace(0.0, np.pi, 7)
+    matrices = np.stack([_axis_rotation(1, angle) for angle in angles])
+    quaternions = CoordinateConversion.to_quaternion(matrices)
+    assert np.allclose(np.linalg.norm(quaternions, axis=1), 1)
+    assert np.all(quaternions[:, 0] >= 0)
+    assert np.allclose(quaternions[:, 0], np.cos(angles / 2))
+    assert np.allclose(np.abs(quaternions[:, 2]), np.sin(angles / 2))
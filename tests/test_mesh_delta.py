@@ -0,0 +1,88 @@
+import numpy as np
+
+from portal.data_struct.mesh_delta import MeshDeltaEncoder
+
+
+class MeshData:
+    """The mesh fields MeshDeltaEncoder reads; Mesh itself needs bpy."""
+
+    def __init__(self, vertices, faces):
+        self.vertices = np.asarray(vertices, dtype=np.float64)
+        self.faces = faces
+        self.uvs = []
+        self.vertex_colors = []
+
+    def to_dict(self, meta=None, precision=None):
+        return {"Items": {"Vertices": self.vertices.tolist(), "Faces": self.faces}, "Meta": meta or {}}
+
+
+def grid(count=64):
+    vertices = np.zeros((count, 3))
+    vertices[:, 0] = np.arange(count)
+    faces = [[i, i + 1, i + 2] for i in range(count - 2)]
+    return vertices, faces
+
+
+def test_first_frame_is_keyframe_then_deltas():
+    encoder = MeshDeltaEncoder()
+    vertices, faces = grid()
+    first = encoder.encode("a", MeshData(vertices, faces))
+    assert "Delta" not in first["Items"] and first["Items"]["Version"] == 1
+
+    moved = vertices.copy()
+    moved[10, 2] = 1.0
+    delta = encoder.encode("a", MeshData(moved, faces))["Items"]["Delta"]
+    assert (delta["Base"], delta["Version"], delta["Count"]) == (1, 2, len(vertices))
+    assert delta["Ranges"] == [[10, moved[10].tolist()]]
+
+
+def test_unchanged_frame_repeats_version():
+    encoder = MeshDeltaEncoder()
+    vertices, faces = grid()
+    encoder.encode("a", MeshData(vertices, faces))
+    delta = encoder.encode("a", MeshData(vertices, faces))["Items"]["Delta"]
+    assert delta == {"Base": 1, "Version": 1, "Count": len(vertices), "Ranges": []}
+
+
+def test_nearby_ranges_merge_and_distant_ones_split():
+    previous = np.zeros((100, 3))
+    current = previous.copy()
+    gap = MeshDeltaEncoder.MERGE_GAP
+    current[[5, 5 + gap + 1, 80]] = 1.0  # first two are MERGE_GAP unchanged vertices apart
+    assert MeshDeltaEncoder._changed_ranges(previous, current) == [(5, 5 + gap + 2), (80, 81)]
+
+    current = previous.copy()
+    current[[5, 5 + gap + 2]] = 1.0  # one vertex further: no longer bridged
+    assert MeshDeltaEncoder._changed_ranges(previous, current) == [(5, 6), (5 + gap + 2, 5 + gap + 3)]
+
+
+def test_topology_change_forces_keyframe():
+    encoder = MeshDeltaEncoder()
+    vertices, faces = grid()
+    encoder.encode("a", MeshData(vertices, faces))
+    item = encoder.encode("a", MeshData(vertices, faces[:-1]))["Items"]
+    assert "Delta" not in item and item["Version"] == 2
+
+
+def test_keyframe_is_forced_every_interval():
+    encoder = MeshDeltaEncoder()
+    vertices, faces = grid()
+    encoder.encode("a", MeshData(vertices, faces))
+    for step in range(MeshDeltaEncoder.KEYFRAME_INTERVAL):
+        vertices = vertices.copy()
+        vertices[0, 1] = step + 1
+        assert "Delta" in encoder.encode("a", MeshData(vertices, faces))["Items"]
+    vertices = vertices.copy()
+    vertices[0, 1] = -1
+    item = encoder.encode("a", MeshData(vertices, faces))["Items"]
+    assert "Delta" not in item
+    assert item["Version"] == MeshDeltaEncoder.KEYFRAME_INTERVAL + 2
+
+
+def test_keys_and_reset_are_independent():
+    encoder = MeshDeltaEncoder()
+    vertices, faces = grid()
+    encoder.encode("a", MeshData(vertices, faces))
+    assert "Delta" not in encoder.encode("b", MeshData(vertices, faces))["Items"]
+    encoder.reset()
+    assert "Delta" not in encoder.encode("a", MeshData(vertices, faces))["Items"]
@@ -0,0 +1,48 @@
+import pytest
+
+from portal.data_struct.p_types import PCompressionType
+from portal.data_struct.packet import Packet, PacketHeader
+from portal.handlers.binary_handler import BinaryHandler
+
+PAYLOAD = b'{"Items": [], "Meta": {"Name": "packet"}}' * 64
+
+
+@pytest.mark.parametrize("codec", list(PCompressionType))
+def test_codec_round_trip(codec):
+    compressed = BinaryHandler.compress(PAYLOAD, codec.value, level=1)
+    assert BinaryHandler.decompress(compressed, codec.value) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", list(PCompressionType))
+def test_packet_header_round_trip(codec):
+    data = BinaryHandler.compress(PAYLOAD, codec.value)
+    packet = Packet(data, size=len(data), checksum=0xBEEF, is_encrypted=False, codec=codec.value)
+    serialized = packet.serialize()
+
+    header = BinaryHandler.parse_header(serialized[len(Packet.MAGIC_NUMBER) :])
+    assert header.codec == codec.value
+    assert header.is_compressed == (codec != PCompressionType.NONE)
+    assert header.size == len(data)
+    assert header.checksum == 0xBEEF
+
+    decoded = Packet.deserialize(serialized)
+    assert decoded.header.codec == codec.value
+    assert BinaryHandler.decompress(decoded.data, decoded.header.codec) == PAYLOAD
+
+
+def test_header_size_is_fixed():
+    packet = Packet(b"abc", size=3, checksum=1, is_encrypted=False, codec=0)
+    serialized = packet.serialize()
+    assert len(serialized) == len(Packet.MAGIC_NUMBER) + PacketHeader.get_expected_size() + 3
+
+
+def test_legacy_compressed_flag_means_gzip():
+    header = PacketHeader(is_encrypted=False, is_compressed=True, size=0, checksum=0)
+    assert header.codec == PCompressionType.GZIP.value
+
+
+def test_bad_magic_number_is_rejected():
+    with pytest.raises(ValueError):
+        Packet.validate_magic_number(b"xx")
+    with pytest.raises(ValueError):
+        Packet.validate_magic_number(b"p")
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from portal.data_struct.quantized import QuantizedArray
+
+
+@pytest.mark.parametrize("precision", [1e-2, 1e-4])
+def test_error_stays_within_precision(precision):
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-5, 5, size=(1000, 3))
+    encoded = QuantizedArray.encode(values, precision)
+    decoded = QuantizedArray.decode(encoded)
+    assert decoded.dtype == np.float32 and decoded.shape == values.shape
+    assert np.abs(decoded - values).max() <= precision + 1e-5  # float32 rounding
+
+
+def test_bits_follow_precision():
+    values = np.array([[0.0, 0.0, 0.0], [10.0, 1.0, 1.0]])
+    assert QuantizedArray.encode(values, precision=1e-3)["Bits"] == 16
+    assert QuantizedArray.encode(values, precision=1e-6)["Bits"] == 32
+    assert QuantizedArray.encode(values)["Bits"] == 32
+
+
+def test_forced_bits():
+    encoded = QuantizedArray.encode(np.array([[0.0, 0.5], [1.0, 1.0]]), bits=16)
+    assert encoded["Bits"] == 16
+    assert np.allclose(QuantizedArray.decode(encoded), [[0.0, 0.5], [1.0, 1.0]], atol=1e-4)
+
+
+def test_constant_axis_and_empty_input():
+    flat = np.array([[1.0, 2.0, 3.0], [4.0, 2.0, 3.0]])
+    assert np.allclose(QuantizedArray.decode(QuantizedArray.encode(flat, 1e-3)), flat, atol=1e-3)
+
+    empty = QuantizedArray.decode(QuantizedArray.encode(np.zeros((0, 3)), 1e-3))
+    assert empty.shape == (0, 3)
@@ -0,0 +1,91 @@
+import importlib
+import json
+import socket
+import sys
+import threading
+import tracemalloc
+import types
+
+import numpy as np
+import pytest
+
+from portal.data_struct.p_types import PCompressionType
+from portal.data_struct.packet import Packet
+from portal.handlers.binary_handler import BinaryHandler
+
+PAYLOAD = json.dumps({"Items": [{"Vertices": np.arange(600_000.0).tolist()}]}).encode()
+
+
+@pytest.fixture
+def listener(monkeypatch):
+    """A TCP listener whose connection settings come from a minimal Blender context."""
+    connection = types.SimpleNamespace(uuid="test", max_payload_size=64, socket_buffer_size=1024)
+    bpy = types.ModuleType("bpy")
+    bpy.context = types.SimpleNamespace(
+        scene=types.SimpleNamespace(portal_connections=[connection])
+    )
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    monkeypatch.delitem(sys.modules, "portal.server.listeners.tcp_server", raising=False)
+    tcp_server = importlib.import_module("portal.server.listeners.tcp_server")
+    monkeypatch.setitem(sys.modules, "portal.server.listeners.tcp_server", tcp_server)
+    return tcp_server.TCPListenerManager("test")
+
+
+def receive(listener, packets):
+    """Send `packets` over a socket pair and return (queued payloads, peak bytes allocated)."""
+    reader, writer = socket.socketpair()
+    reader.settimeout(1)
+
+    def send():
+        for packet in packets:
+            writer.sendall(packet)
+        writer.close()
+
+    tracemalloc.start()
+    thread = threading.Thread(target=send)
+    thread.start()
+    listener._receive_packets(reader)
+    thread.join()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    reader.close()
+    payloads = []
+    while not listener.data_queue.empty():
+        payloads.append(listener.data_queue.get())
+    return payloads, peak
+
+
+def packet(codec):
+    data = BinaryHandler.compress(PAYLOAD, codec.value)
+    return Packet(data, size=len(data), checksum=0, is_encrypted=False, codec=codec.value).serialize()
+
+
+def test_uncompressed_payload_is_received_with_one_copy(listener):
+    # socket -> payload bytearray via recv_into; the bytearray itself is queued
+    packets = [packet(PCompressionType.NONE)]
+    (payload,), peak = receive(listener, packets)
+    assert isinstance(payload, bytearray)
+    assert not np.shares_memory(np.frombuffer(payload, np.uint8), listener._buffer)
+    assert peak < len(PAYLOAD) * 1.25
+    assert json.loads(payload) == json.loads(PAYLOAD)
+
+
+def test_compressed_payload_is_received_with_one_copy(listener):
+    # socket -> reused chunk buffer -> kept inflate buffer -> one bytes copy that is queued
+    packets = [packet(PCompressionType.ZLIB)]
+    receive(listener, packets)  # first message sizes the reusable buffers
+    (payload,), peak = receive(listener, packets)
+    assert isinstance(payload, bytes)
+    # the payload copy plus one bounded inflate step, never a second copy of the payload
+    assert peak < len(PAYLOAD) + 2 * listener._decompressor.CHUNK_SIZE
+    assert json.loads(payload) == json.loads(PAYLOAD)
+
+
+def test_payloads_do_not_share_memory_across_messages(listener):
+    packets = [packet(PCompressionType.NONE), packet(PCompressionType.ZLIB)] * 2
+    payloads, _ = receive(listener, packets)
+    assert len(payloads) == 4
+    views = [np.frombuffer(payload, np.uint8) for payload in payloads]
+    for i, view in enumerate(views):
+        assert all(not np.shares_memory(view, other) for other in views[i + 1 :])
+        assert bytes(view) == PAYLOAD
@@ -0,0 +1,91 @@
+import json
+
+import numpy as np
+import pytest
+
+from portal.data_struct.p_types import PCompressionType
+from portal.handlers.binary_handler import BinaryHandler, StreamDecompressor
+
+PAYLOAD = json.dumps({"Items": [{"Vertices": [[i, i * 0.5, -i] for i in range(5000)]}]}).encode()
+STREAMING_CODECS = [codec for codec in PCompressionType if codec != PCompressionType.NONE]
+
+
+def feed_in_chunks(decompressor, data, codec, chunk_size=997):
+    decompressor.begin(codec.value, len(data))
+    for start in range(0, len(data), chunk_size):
+        decompressor.feed(memoryview(data)[start : start + chunk_size])
+    return decompressor.finish()
+
+
+@pytest.mark.parametrize("codec", STREAMING_CODECS)
+def test_chunked_feed_matches_one_shot(codec):
+    compressed = BinaryHandler.compress(PAYLOAD, codec.value)
+    decompressor = StreamDecompressor(max_size=len(PAYLOAD))
+    assert feed_in_chunks(decompressor, compressed, codec) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", STREAMING_CODECS)
+def test_decompress_buffer_accepts_memoryview(codec):
+    compressed = bytearray(BinaryHandler.compress(PAYLOAD, codec.value))
+    decompressor = StreamDecompressor(max_size=len(PAYLOAD))
+    assert decompressor.decompress_buffer(memoryview(compressed), codec.value) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", STREAMING_CODECS)
+def test_output_above_limit_is_rejected(codec):
+    compressed = BinaryHandler.compress(PAYLOAD, codec.value)
+    decompressor = StreamDecompressor(max_size=len(PAYLOAD) - 1)
+    with pytest.raises(ValueError, match="exceeds the limit"):
+        decompressor.decompress_buffer(compressed, codec.value)
+
+
+def test_initial_buffer_is_capped_by_limit():
+    decompressor = StreamDecompressor(max_size=1024)
+    decompressor.begin(PCompressionType.ZLIB.value, compressed_size=1 << 30)
+    assert decompressor.peak_bytes == 1024
+
+
+def test_truncated_payload_is_rejected():
+    compressed = BinaryHandler.compress(PAYLOAD, PCompressionType.GZIP.value)
+    decompressor = StreamDecompressor(max_size=len(PAYLOAD))
+    with pytest.raises(ValueError, match="truncated"):
+        decompressor.decompress_buffer(compressed[: len(compressed) // 2], PCompressionType.GZIP.value)
+
+
+def test_uncompressed_codec_cannot_stream():
+    with pytest.raises(ValueError):
+        StreamDecompressor(max_size=1024).begin(PCompressionType.NONE.value)
+
+
+def test_buffer_is_kept_across_messages():
+    decompressor = StreamDecompressor(max_size=len(PAYLOAD))
+    compressed = BinaryHandler.compress(PAYLOAD, PCompressionType.ZLIB.value)
+    decompressor.decompress_buffer(compressed, PCompressionType.ZLIB.value)
+    buffer = decompressor._buffer
+
+    small = BinaryHandler.compress(b"x" * 100, PCompressionType.ZLIB.value)
+    assert decompressor.decompress_buffer(small, PCompressionType.ZLIB.value) == b"x" * 100
+    assert decompressor._buffer is buffer  # a smaller message reuses it
+    assert decompressor.decompress_buffer(compressed, PCompressionType.ZLIB.value) == PAYLOAD
+    assert decompressor._buffer is buffer  # and so does one that fits exactly
+
+
+def test_finish_copies_out_of_the_buffer_once():
+    decompressor = StreamDecompressor(max_size=len(PAYLOAD))
+    payload = decompressor.decompress_buffer(
+        BinaryHandler.compress(PAYLOAD, PCompressionType.ZLIB.value), PCompressionType.ZLIB.value
+    )
+    assert isinstance(payload, bytes)
+    assert not np.shares_memory(np.frombuffer(payload, np.uint8), decompressor._buffer)
+    assert json.loads(payload) == json.loads(PAYLOAD)
+
+
+def test_payload_survives_next_message():
+    decompressor = StreamDecompressor(max_size=len(PAYLOAD))
+    first = decompressor.decompress_buffer(
+        BinaryHandler.compress(PAYLOAD, PCompressionType.ZLIB.value), PCompressionType.ZLIB.value
+    )
+    decompressor.decompress_buffer(
+        BinaryHandler.compress(b"x" * 100, PCompressionType.ZLIB.value), PCompressionType.ZLIB.value
+    )
+    assert first == PAYLOAD
@@ -0,0 +1,28 @@
+import importlib
+import sys
+import types
+from urllib.parse import unquote
+
+import pytest
+
+
+@pytest.fixture
+def server_cls(monkeypatch):
+    """SharedWebSocketServer imported against a stub bpy module."""
+    monkeypatch.setitem(sys.modules, "bpy", types.ModuleType("bpy"))
+    monkeypatch.delitem(sys.modules, "portal.server.listeners.websockets_server", raising=False)
+    module = importlib.import_module("portal.server.listeners.websockets_server")
+    monkeypatch.setitem(sys.modules, "portal.server.listeners.websockets_server", module)
+    return module.SharedWebSocketServer
+
+
+def test_plain_name_is_unchanged(server_cls):
+    assert server_cls.get_route("Cube") == "/portal/Cube"
+
+
+@pytest.mark.parametrize("name", ["My Mesh", "a/b", "frame?1", "tag#2", "100%", "ünï"])
+def test_reserved_characters_are_encoded(server_cls, name):
+    route = server_cls.get_route(name)
+    segment = route[len(server_cls.ROUTE_PREFIX) :]
+    assert not any(char in segment for char in "/?# ")
+    assert unquote(segment) == name